@@ -0,0 +1,225 @@
+"""crud 함수 지연 시간 벤치마크
+
+HTTP 계층 없이 crud 모듈의 조회 함수를 실제 사용 패턴에 가까운 파라미터 조합으로 호출해
+여러 동시성 수준(스레드 수)에서 p50/p95/p99 지연 시간, 처리량(호출/초), 호출당 SQL 실행 수를 측정한다.
+엔드포인트 벤치마크(bench_endpoints.py)와 함께 보면 지연 시간 중 쿼리·ORM 비용과 HTTP·직렬화 비용을 나눠 볼 수 있다.
+결과는 results/ 아래 JSON으로 저장된다.
+
+사용 예시:
+    python benchmarks/bench_crud.py
+    python benchmarks/bench_crud.py --concurrency 1,4 --calls 500 --only players
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common import (
+    SRC_DIR,
+    environment,
+    make_rng,
+    print_table,
+    sample_ids,
+    summarize,
+    write_results,
+)
+
+# API 소스(src)를 기준으로 실행한다. 데이터베이스 경로가 작업 디렉토리 기준이다.
+sys.path.insert(0, SRC_DIR)
+os.chdir(SRC_DIR)
+
+from sqlalchemy import event  # noqa: E402
+
+import crud  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+
+# (대상 함수 이름, 호출 수 비율, 호출 생성 함수)
+# 호출 생성 함수는 난수 생성기와 샘플 값을 받아 (db)를 인자로 받는 호출 가능한 객체를 반환한다.
+SCENARIOS = [
+    (
+        "get_player",
+        1.0,
+        lambda r, s: (lambda db, id=r.choice(s["player_ids"]): crud.get_player(db, id)),
+    ),
+    (
+        "get_players",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                lambda db, skip=r.randrange(0, s["player_count"]): crud.get_players(
+                    db, skip=skip, limit=100
+                ),
+                lambda db, name=r.choice(s["first_names"]): crud.get_players(
+                    db, first_name=name
+                ),
+                lambda db, date=r.choice(s["change_dates"]): crud.get_players(
+                    db, min_last_changed_date=date
+                ),
+            ]
+        ),
+    ),
+    (
+        "get_players_by_ids",
+        1.0,
+        lambda r, s: (
+            lambda db, ids=r.sample(s["player_ids"], 15): crud.get_players_by_ids(
+                db, ids
+            )
+        ),
+    ),
+    (
+        "get_performances",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                lambda db, skip=r.randrange(
+                    0, s["performance_count"]
+                ): crud.get_performances(db, skip=skip, limit=100),
+                lambda db, date=r.choice(s["change_dates"]): crud.get_performances(
+                    db, min_last_changed_date=date, limit=1000
+                ),
+            ]
+        ),
+    ),
+    (
+        "get_league",
+        1.0,
+        lambda r, s: (lambda db, id=r.choice(s["league_ids"]): crud.get_league(db, id)),
+    ),
+    ("get_leagues", 1.0, lambda r, s: (lambda db: crud.get_leagues(db))),
+    (
+        "get_teams",
+        1.0,
+        lambda r, s: (
+            lambda db, id=r.choice(s["league_ids"]): crud.get_teams(db, league_id=id)
+        ),
+    ),
+    ("get_counts", 1.0, lambda r, s: (lambda db: crud.get_counts(db))),
+    (
+        "get_player_season_stats",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                lambda db, position=r.choice(
+                    ["QB", "RB", "WR", "TE", "K"]
+                ): crud.get_player_season_stats(db, position=position, limit=50),
+                lambda db, week=r.choice(
+                    s["week_numbers"]
+                ): crud.get_player_season_stats(
+                    db,
+                    min_week_number=min(s["week_numbers"]),
+                    max_week_number=week,
+                    limit=50,
+                ),
+            ]
+        ),
+    ),
+    (
+        "get_leaderboard",
+        1.0,
+        lambda r, s: (
+            lambda db, week=r.choice(s["week_numbers"]): crud.get_leaderboard(
+                db, week_number=week
+            )
+        ),
+    ),
+]
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수를 센다(여러 스레드에서 호출된다)."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args):
+        with self._lock:
+            self.count += 1
+
+
+def run_calls(calls: list, concurrency: int) -> tuple:
+    """호출 목록을 concurrency개 스레드가 나눠 실행하고 (지연 시간 목록, 오류 수, 경과 시간)을 반환한다."""
+    local = threading.local()
+    sessions = []
+
+    def session():
+        if not hasattr(local, "db"):
+            local.db = SessionLocal()
+            sessions.append(local.db)
+        return local.db
+
+    def timed(call):
+        db = session()
+        start = time.perf_counter()
+        try:
+            call(db)
+            error = 0
+        except Exception:
+            db.rollback()
+            error = 1
+        # 세션 식별 맵에 객체가 쌓여 뒤쪽 호출이 느려지지 않도록 매번 비운다.
+        db.expunge_all()
+        return time.perf_counter() - start, error
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(timed, calls))
+    elapsed = time.perf_counter() - start
+    for db in sessions:
+        db.close()
+    latencies = [latency for latency, _ in outcomes]
+    return latencies, sum(error for _, error in outcomes), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="crud 함수 지연 시간 벤치마크")
+    parser.add_argument(
+        "--concurrency", default="1,4,8", help="쉼표로 구분한 동시 실행 스레드 수 목록"
+    )
+    parser.add_argument("--calls", type=int, default=200, help="측정 구간별 호출 수")
+    parser.add_argument("--warmup", type=int, default=10, help="측정 전 워밍업 호출 수")
+    parser.add_argument("--seed", type=int, default=7, help="파라미터 조합 난수 시드")
+    parser.add_argument("--only", help="함수 이름에 이 문자열이 포함된 함수만 측정")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    samples = sample_ids()
+    concurrency_levels = [int(value) for value in args.concurrency.split(",")]
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+
+    results = []
+    for name, ratio, make_call in SCENARIOS:
+        if args.only and args.only not in name:
+            continue
+        count = max(int(args.calls * ratio), 1)
+        for concurrency in concurrency_levels:
+            rng = make_rng(args.seed)
+            calls = [make_call(rng, samples) for _ in range(count)]
+            run_calls(calls[: args.warmup], concurrency)
+
+            before = counter.count
+            latencies, errors, elapsed = run_calls(calls, concurrency)
+            row = {"target": name, "concurrency": concurrency}
+            row.update(summarize(latencies, elapsed, errors))
+            row["queries_per_request"] = round((counter.count - before) / count, 2)
+            results.append(row)
+            print_table([row], header=not results[:-1])
+
+    meta = environment(
+        {
+            "concurrency": args.concurrency,
+            "calls": args.calls,
+            "seed": args.seed,
+            "db_profile": os.getenv("SWC_DB_PROFILE", "default"),
+        }
+    )
+    print(f"결과 저장: {write_results('crud', meta, results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
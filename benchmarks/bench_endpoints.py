@@ -0,0 +1,340 @@
+"""엔드포인트 부하·지연 시간 벤치마크
+
+로컬에서 uvicorn으로 API 서버를 띄운 뒤, 엔드포인트마다 실제 사용 패턴에 가까운 파라미터 조합으로
+여러 동시성 수준에서 요청을 보내 p50/p95/p99 지연 시간, 처리량(요청/초), 요청당 SQL 실행 수를 측정한다.
+요청당 SQL 실행 수는 서버의 /metrics(swc_http_request_sql_queries)에서 읽으므로 서버 코드는 그대로 측정된다.
+네트워크 없이 한 대의 Linux 장비에서 실행되며, 결과는 results/ 아래 JSON으로 저장된다.
+
+사용 예시:
+    python benchmarks/bench_endpoints.py
+    python benchmarks/bench_endpoints.py --concurrency 1,16,64 --requests 500
+    python benchmarks/bench_endpoints.py --only players --output before.json
+    python benchmarks/bench_endpoints.py --url http://127.0.0.1:8000   # 이미 실행 중인 서버
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from common import (
+    SRC_DIR,
+    environment,
+    make_rng,
+    print_table,
+    sample_ids,
+    summarize,
+    write_results,
+)
+
+ARROW = {"Accept": "application/vnd.apache.arrow.stream"}
+
+# (대상 operation_id, 요청 수 비율, 요청 생성 함수)
+# 요청 생성 함수는 난수 생성기와 샘플 값을 받아 (경로, 헤더)를 반환한다.
+# 무거운 내보내기 엔드포인트는 요청 수 비율을 낮춰 전체 실행 시간을 제한한다.
+SCENARIOS = [
+    ("v0_health_check", 1.0, lambda r, s: ("/", None)),
+    (
+        "v0_get_players",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                (
+                    f"/v0/players/?skip={r.randrange(0, s['player_count'])}&limit=100",
+                    None,
+                ),
+                (f"/v0/players/?first_name={r.choice(s['first_names'])}", None),
+                (f"/v0/players/?last_name={r.choice(s['last_names'])}", None),
+                (
+                    f"/v0/players/?minimum_last_changed_date={r.choice(s['change_dates'])}"
+                    "&limit=100",
+                    None,
+                ),
+                ("/v0/players/?limit=100&fields=player_id,first_name,last_name", None),
+                ("/v0/players/?limit=500", ARROW),
+            ]
+        ),
+    ),
+    (
+        "v0_get_players_by_player_id",
+        1.0,
+        lambda r, s: (f"/v0/players/{r.choice(s['player_ids'])}", None),
+    ),
+    (
+        "v0_get_players_by_ids",
+        1.0,
+        lambda r, s: (
+            "/v0/players/batch/?ids="
+            + ",".join(map(str, r.sample(s["player_ids"], 15))),
+            None,
+        ),
+    ),
+    (
+        "v0_get_performances",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                (
+                    f"/v0/performances/?skip={r.randrange(0, s['performance_count'])}"
+                    "&limit=100",
+                    None,
+                ),
+                (
+                    "/v0/performances/?minimum_last_changed_date="
+                    f"{r.choice(s['change_dates'])}&limit=1000",
+                    None,
+                ),
+                ("/v0/performances/?limit=5000", ARROW),
+            ]
+        ),
+    ),
+    (
+        "v0_get_leagues",
+        1.0,
+        lambda r, s: r.choice([("/v0/leagues/", None), ("/v0/leagues/?expand=", None)]),
+    ),
+    (
+        "v0_get_league_by_league_id",
+        1.0,
+        lambda r, s: (f"/v0/leagues/{r.choice(s['league_ids'])}", None),
+    ),
+    (
+        "v0_get_teams",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                ("/v0/teams/", None),
+                (f"/v0/teams/?league_id={r.choice(s['league_ids'])}", None),
+                (f"/v0/teams/?team_name={r.choice(s['team_names'])}", None),
+            ]
+        ),
+    ),
+    (
+        "v0_get_teams_by_ids",
+        1.0,
+        lambda r, s: (
+            "/v0/teams/batch/?ids=" + ",".join(map(str, r.sample(s["team_ids"], 5))),
+            None,
+        ),
+    ),
+    ("v0_get_counts", 1.0, lambda r, s: ("/v0/counts/", None)),
+    (
+        "v0_get_player_season_stats",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                (
+                    "/v0/season_stats/?position="
+                    f"{r.choice(['QB', 'RB', 'WR', 'TE', 'K'])}&limit=50",
+                    None,
+                ),
+                (
+                    "/v0/season_stats/?minimum_week_number="
+                    f"{min(s['week_numbers'])}&maximum_week_number="
+                    f"{r.choice(s['week_numbers'])}&limit=50",
+                    None,
+                ),
+            ]
+        ),
+    ),
+    (
+        "v0_get_leaderboard",
+        1.0,
+        lambda r, s: r.choice(
+            [
+                (f"/v0/leaderboard/?week_number={r.choice(s['week_numbers'])}", None),
+                (
+                    f"/v0/leaderboard/?position={r.choice(['QB', 'RB', 'WR'])}&k=10",
+                    None,
+                ),
+            ]
+        ),
+    ),
+    ("v0_export_players", 0.1, lambda r, s: ("/v0/export/players/", None)),
+    (
+        "v0_export_performances",
+        0.05,
+        lambda r, s: ("/v0/export/performances/?format=csv", None),
+    ),
+]
+
+_SQL_QUERIES = re.compile(
+    r'^swc_http_request_sql_queries_(sum|count)\{operation_id="([^"]+)"\} (\S+)$',
+    re.MULTILINE,
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextlib.contextmanager
+def local_server(workers: int, port: int = None):
+    """src 디렉토리에서 uvicorn을 실행하고, 상태 확인이 성공하면 기본 URL을 넘긴다."""
+    port = port or _free_port()
+    url = f"http://127.0.0.1:{port}"
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    server = subprocess.Popen(command, cwd=SRC_DIR, env=dict(os.environ))
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn이 시작 직후 종료됐습니다.")
+            try:
+                if httpx.get(url + "/").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("uvicorn이 30초 안에 응답하지 않았습니다.")
+            time.sleep(0.2)
+        yield url
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def sql_query_totals(client: httpx.Client) -> dict:
+    """
+    /metrics에서 operation_id별 (요청당 SQL 수 합계, 요청 수)를 읽는다.
+
+    워커가 여러 개면 /metrics를 응답한 워커 하나의 값이지만, 비율(요청당 SQL 수)은 그대로 의미가 있다.
+    """
+    totals = {}
+    for kind, operation_id, value in _SQL_QUERIES.findall(client.get("/metrics").text):
+        entry = totals.setdefault(operation_id, [0.0, 0.0])
+        entry[0 if kind == "sum" else 1] = float(value)
+    return totals
+
+
+async def run_load(base_url: str, requests: list, concurrency: int) -> tuple:
+    """요청 목록을 concurrency개 작업자가 나눠 보내고 (지연 시간 목록, 오류 수, 경과 시간)을 반환한다."""
+    latencies = []
+    errors = 0
+    pending = iter(requests)
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+
+        async def worker():
+            nonlocal errors
+            for path, headers in pending:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path, headers=headers)
+                    await response.aread()
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def benchmark(base_url: str, args) -> list:
+    samples = sample_ids()
+    concurrency_levels = [int(value) for value in args.concurrency.split(",")]
+    results = []
+    with httpx.Client(base_url=base_url, timeout=60) as metrics_client:
+        for operation_id, ratio, make_request in SCENARIOS:
+            if args.only and args.only not in operation_id:
+                continue
+            count = max(int(args.requests * ratio), args.min_requests)
+            for concurrency in concurrency_levels:
+                rng = make_rng(args.seed)
+                requests = [make_request(rng, samples) for _ in range(count)]
+                # 워밍업: 연결, 페이지 캐시, 지연 초기화 비용을 측정에서 뺀다.
+                asyncio.run(run_load(base_url, requests[: args.warmup], concurrency))
+
+                before = sql_query_totals(metrics_client).get(operation_id, [0, 0])
+                latencies, errors, elapsed = asyncio.run(
+                    run_load(base_url, requests, concurrency)
+                )
+                after = sql_query_totals(metrics_client).get(operation_id, [0, 0])
+
+                row = {"target": operation_id, "concurrency": concurrency}
+                row.update(summarize(latencies, elapsed, errors))
+                served = after[1] - before[1]
+                row["queries_per_request"] = (
+                    round((after[0] - before[0]) / served, 2) if served else None
+                )
+                results.append(row)
+                print_table([row], header=not results[:-1])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드포인트 부하·지연 시간 벤치마크")
+    parser.add_argument(
+        "--url", help="이미 실행 중인 서버의 기본 URL(생략하면 uvicorn을 직접 실행)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="uvicorn 워커 프로세스 수"
+    )
+    parser.add_argument(
+        "--concurrency", default="1,8,32", help="쉼표로 구분한 동시 요청 수 목록"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="측정 구간별 요청 수")
+    parser.add_argument(
+        "--min-requests", type=int, default=10, help="무거운 엔드포인트의 최소 요청 수"
+    )
+    parser.add_argument("--warmup", type=int, default=10, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--seed", type=int, default=7, help="파라미터 조합 난수 시드")
+    parser.add_argument(
+        "--only", help="operation_id에 이 문자열이 포함된 엔드포인트만 측정"
+    )
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    meta = environment(
+        {
+            "workers": args.workers if not args.url else None,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "seed": args.seed,
+            "server_env": {
+                key: value
+                for key, value in os.environ.items()
+                if key.startswith("SWC_")
+            },
+        }
+    )
+    if args.url:
+        results = benchmark(args.url, args)
+    else:
+        with local_server(args.workers) as url:
+            results = benchmark(url, args)
+    print(f"결과 저장: {write_results('endpoints', meta, results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
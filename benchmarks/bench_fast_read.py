@@ -0,0 +1,62 @@
+"""빠른 조회(fast read) 경로 벤치마크
+
+같은 목록 요청을 ORM + response_model 경로와 빠른 조회 경로로 반복 호출해
+요청당 평균 처리 시간과 속도 향상 비율을 비교한다. 두 응답 본문이 같은지도 함께 확인한다.
+
+사용 예시:
+    python benchmarks/bench_fast_read.py
+    python benchmarks/bench_fast_read.py --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# API 소스(src)를 기준으로 실행한다. 데이터베이스 경로가 작업 디렉토리 기준이다.
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+os.chdir(SRC_DIR)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import config  # noqa: E402
+from main import app  # noqa: E402
+
+URLS = [
+    "/v0/players/?limit=1000",
+    "/v0/performances/?limit=10000",
+    "/v0/teams/?limit=500",
+    "/v0/leagues/?limit=500",
+]
+
+
+def measure(client: TestClient, url: str, fast_read: bool, repeat: int):
+    """요청당 평균 시간(ms)과 마지막 응답 본문을 반환한다."""
+    config.FAST_READ = fast_read
+    client.get(url)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(url)
+    elapsed = time.perf_counter() - start
+    return elapsed / repeat * 1000, response.content
+
+
+def main():
+    parser = argparse.ArgumentParser(description="빠른 조회 경로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="URL별 반복 횟수")
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    print(f"{'URL':<34}{'ORM(ms)':>10}{'fast(ms)':>10}{'speedup':>9}  동일 응답")
+    for url in URLS:
+        orm_ms, orm_body = measure(client, url, False, args.repeat)
+        fast_ms, fast_body = measure(client, url, True, args.repeat)
+        print(
+            f"{url:<34}{orm_ms:>10.2f}{fast_ms:>10.2f}{orm_ms / fast_ms:>8.1f}x"
+            f"  {orm_body == fast_body}"
+        )
+
+
+if __name__ == "__main__":
+    main()
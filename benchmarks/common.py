@@ -0,0 +1,136 @@
+"""벤치마크 공통 유틸리티
+
+지연 시간 분포 요약, 실행 환경 정보 수집, 결과 JSON 저장을 담당한다.
+결과 파일은 릴리스 간 비교(compare.py)를 위해 항상 같은 구조로 저장한다.
+"""
+
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.normpath(os.path.join(BENCHMARK_DIR, "..", "src"))
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+DATABASE_PATH = os.path.join(SRC_DIR, "fantasy_data.db")
+
+# 결과 파일 구조가 바뀌면 올린다.
+RESULT_SCHEMA_VERSION = 1
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """정렬된 값에서 p 백분위수(0~100)를 선형 보간으로 구한다."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize(latencies: list, elapsed: float, errors: int = 0) -> dict:
+    """요청(호출)별 지연 시간(초) 목록과 전체 경과 시간으로 결과 지표를 만든다."""
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "requests": count,
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "mean_ms": round(sum(values) / count * 1000, 3) if count else 0.0,
+        "max_ms": round(values[-1] * 1000, 3) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def sample_ids(database_path: str = DATABASE_PATH) -> dict:
+    """파라미터 조합을 만들 때 사용할 실제 ID·이름·주차 값을 데이터베이스에서 읽는다."""
+    with sqlite3.connect(f"file:{database_path}?mode=ro", uri=True) as conn:
+
+        def column(sql):
+            return [row[0] for row in conn.execute(sql)]
+
+        return {
+            "player_ids": column("SELECT player_id FROM player"),
+            "first_names": column("SELECT DISTINCT first_name FROM player"),
+            "last_names": column("SELECT DISTINCT last_name FROM player"),
+            "team_ids": column("SELECT team_id FROM team"),
+            "team_names": column("SELECT DISTINCT team_name FROM team"),
+            "league_ids": column("SELECT league_id FROM league"),
+            "week_numbers": column("SELECT DISTINCT week_number FROM performance"),
+            "change_dates": column(
+                "SELECT DISTINCT last_changed_date FROM performance"
+            ),
+            "player_count": conn.execute("SELECT count(*) FROM player").fetchone()[0],
+            "performance_count": conn.execute(
+                "SELECT count(*) FROM performance"
+            ).fetchone()[0],
+        }
+
+
+def environment(extra: dict = None) -> dict:
+    """결과를 재현·비교할 수 있도록 실행 환경을 기록한다."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARK_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    info = {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "database_bytes": (
+            os.path.getsize(DATABASE_PATH) if os.path.exists(DATABASE_PATH) else None
+        ),
+    }
+    info.update(extra or {})
+    return info
+
+
+def write_results(suite: str, meta: dict, results: list, output: str = None) -> str:
+    """결과를 JSON 파일로 저장하고 경로를 반환한다. output이 없으면 results/에 시각 이름으로 저장한다."""
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{suite}-{stamp}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"suite": suite, "meta": meta, "results": results}, f, indent=2)
+        f.write("\n")
+    return output
+
+
+def print_table(results: list, header: bool = True):
+    """결과를 사람이 읽기 쉬운 표로 출력한다."""
+    if header:
+        print(
+            f"{'target':<40}{'conc':>5}{'p50':>9}{'p95':>9}{'p99':>9}"
+            f"{'rps':>10}{'q/req':>7}{'err':>5}"
+        )
+    for row in results:
+        queries = row.get("queries_per_request")
+        print(
+            f"{row['target']:<40}{row['concurrency']:>5}"
+            f"{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+            f"{row['throughput_rps']:>10.1f}"
+            f"{'-' if queries is None else f'{queries:.1f}':>7}{row['errors']:>5}"
+        )
+
+
+def make_rng(seed: int) -> random.Random:
+    """실행마다 같은 파라미터 조합을 재현하기 위한 난수 생성기"""
+    return random.Random(seed)
@@ -0,0 +1,89 @@
+"""벤치마크 결과 비교
+
+같은 스위트(endpoints 또는 crud)의 결과 JSON 두 개를 (대상, 동시성) 기준으로 맞춰
+p50/p95/p99 지연 시간, 처리량, 요청당 SQL 실행 수의 변화를 출력한다.
+p95가 --threshold 비율 이상 느려진 항목이 있으면 종료 코드 1을 반환하므로 CI에서도 사용할 수 있다.
+
+사용 예시:
+    python benchmarks/compare.py results/endpoints-before.json results/endpoints-after.json
+    python benchmarks/compare.py before.json after.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> tuple:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["suite"], {
+        (row["target"], row["concurrency"]): row for row in data["results"]
+    }
+
+
+def _change(old: float, new: float) -> str:
+    if not old:
+        return "     -"
+    return f"{(new - old) / old:+6.0%}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline", help="기준 결과 JSON")
+    parser.add_argument("candidate", help="비교할 결과 JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="회귀로 판단할 p95 증가 비율(기본값 0.1 = 10%%)",
+    )
+    args = parser.parse_args()
+
+    baseline_suite, baseline = load(args.baseline)
+    candidate_suite, candidate = load(args.candidate)
+    if baseline_suite != candidate_suite:
+        sys.exit(
+            f"서로 다른 스위트는 비교할 수 없습니다: {baseline_suite} / {candidate_suite}"
+        )
+
+    print(
+        f"{'target':<40}{'conc':>5}{'p50':>8}{'p95':>8}{'p99':>8}{'rps':>8}"
+        f"{'q/req':>12}"
+    )
+    regressions = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        old, new = baseline[key], candidate[key]
+        old_queries = old.get("queries_per_request")
+        new_queries = new.get("queries_per_request")
+        if old_queries is None or new_queries is None:
+            queries = "-"
+        else:
+            queries = f"{old_queries:g}→{new_queries:g}"
+        print(
+            f"{key[0]:<40}{key[1]:>5}"
+            f"{_change(old['p50_ms'], new['p50_ms']):>8}"
+            f"{_change(old['p95_ms'], new['p95_ms']):>8}"
+            f"{_change(old['p99_ms'], new['p99_ms']):>8}"
+            f"{_change(old['throughput_rps'], new['throughput_rps']):>8}"
+            f"{queries:>12}"
+        )
+        if old["p95_ms"] and new["p95_ms"] > old["p95_ms"] * (1 + args.threshold):
+            regressions.append(key)
+        elif (new_queries or 0) > (old_queries or 0):
+            # 요청당 SQL 수 증가는 N+1 같은 구조적 회귀이므로 지연 시간과 관계없이 표시한다.
+            regressions.append(key)
+
+    for key in sorted(baseline.keys() ^ candidate.keys()):
+        print(f"{key[0]:<40}{key[1]:>5}  (한쪽 결과에만 있음)")
+
+    if regressions:
+        print(
+            f"\n회귀 {len(regressions)}건: "
+            + ", ".join(f"{t}@{c}" for t, c in regressions)
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
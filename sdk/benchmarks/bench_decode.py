@@ -0,0 +1,142 @@
+"""SDK 응답 디코딩 마이크로벤치마크
+
+목록 API 응답 한 페이지를 스키마 객체 리스트로 만드는 CPU 비용을 디코딩 방식별로 측정한다.
+네트워크 없이 미리 만든 httpx.Response로 측정하므로 결과는 순수한 파싱·검증 비용이다.
+
+- baseline: 0.0.2 방식. call_api가 디버그 로그 문자열을 만들려고 response.json()을 호출하고
+            (로그 레벨과 관계없이 f-string이 평가됨), list_leagues가 JSON을 다시 파싱한 뒤
+            행마다 Model(**row)로 검증한다.
+- sdk     : 현재 SWCClient.decode_models
+
+사용 예시:
+    python benchmarks/bench_decode.py
+    python benchmarks/bench_decode.py --rows 1000 --repeat 200
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import httpx
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+from swcpy import SWCClient, SWCConfig  # noqa: E402
+from swcpy.schemas import League, Performance, Player  # noqa: E402
+
+logger = logging.getLogger("bench_decode")
+
+
+def performance_rows(count: int) -> list:
+    start = date(2023, 9, 9)
+    return [
+        {
+            "performance_id": i,
+            "player_id": 1001 + i % 500,
+            "week_number": f"2023{i % 17 + 1:02d}",
+            "fantasy_points": round(i * 0.37 % 30, 1),
+            "last_changed_date": (start + timedelta(days=i % 120)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def player_rows(count: int, performances: int = 17) -> list:
+    return [
+        {
+            "player_id": 1001 + i,
+            "gsis_id": f"00-00{10000 + i}",
+            "first_name": "Aaron",
+            "last_name": "Rodgers",
+            "position": "QB",
+            "last_changed_date": "2024-04-18",
+            "performances": [
+                dict(row, player_id=1001 + i) for row in performance_rows(performances)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def league_rows(count: int, teams: int = 12) -> list:
+    return [
+        {
+            "league_id": 5001 + i,
+            "league_name": "Pigskin Prodigal Fantasy League",
+            "scoring_type": "PPR",
+            "last_changed_date": "2024-04-25",
+            "teams": [
+                {
+                    "league_id": 5001 + i,
+                    "team_id": 1001 + i * teams + t,
+                    "team_name": "Roaring Kitties",
+                    "last_changed_date": "2024-04-23",
+                }
+                for t in range(teams)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def make_response(rows: list) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json"},
+        content=json.dumps(rows).encode(),
+        request=httpx.Request("GET", "http://bench/"),
+    )
+
+
+def baseline_decode(response: httpx.Response, model) -> list:
+    # 0.0.2의 call_api 디버그 로그와 list_leagues의 디코딩을 그대로 재현한다.
+    logger.debug(f"Response JSON: {response.json()}")
+    return [model(**row) for row in response.json()]
+
+
+def measure(decode, response, model, repeat: int) -> float:
+    """한 페이지 디코딩의 평균 CPU 시간(마이크로초)"""
+    decode(response, model)
+    start = time.process_time()
+    for _ in range(repeat):
+        decode(response, model)
+    return (time.process_time() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SDK 응답 디코딩 마이크로벤치마크")
+    parser.add_argument("--rows", type=int, default=100, help="페이지당 행 수")
+    parser.add_argument("--repeat", type=int, default=100, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    # 디버그 로그가 꺼진 일반적인 운영 환경을 가정한다.
+    logging.basicConfig(level=logging.WARNING)
+    client = SWCClient(SWCConfig(swc_base_url="http://bench", backoff=False))
+    cases = [
+        ("performances", Performance, performance_rows(args.rows * 10)),
+        ("players", Player, player_rows(args.rows)),
+        ("leagues", League, league_rows(args.rows)),
+    ]
+
+    print(
+        f"{'schema':<14}{'rows':>7}{'KiB':>8}{'baseline µs':>14}{'sdk µs':>10}{'speedup':>9}"
+    )
+    for name, model, rows in cases:
+        response = make_response(rows)
+        baseline = measure(baseline_decode, response, model, args.repeat)
+        current = measure(client.decode_models, response, model, args.repeat)
+        print(
+            f"{name:<14}{len(rows):>7}{len(response.content) / 1024:>8.0f}"
+            f"{baseline:>14.0f}{current:>10.0f}{baseline / current:>8.1f}x"
+        )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
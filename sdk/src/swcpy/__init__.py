@@ -1,4 +1,5 @@
 from .swc_client import SWCClient
+from .swc_async_client import AsyncSWCClient
 from .swc_config import SWCConfig
 
 # . 은 상대 임포트
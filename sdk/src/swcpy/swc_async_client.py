@@ -0,0 +1,407 @@
+import asyncio
+import httpx
+import swcpy.swc_config as config
+from .schemas import (
+    ChangeBatch,
+    Counts,
+    LeaderboardEntry,
+    League,
+    Performance,
+    Player,
+    PlayerSeasonStats,
+    Team,
+)
+from .swc_client import BaseSWCClient, client_options, raise_for_retryable_status
+from .swc_pagination import aiter_pages
+from typing import AsyncIterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSWCClient(BaseSWCClient):
+    """
+    asyncio 기반 SportsWorldCentral API 클라이언트 클래스
+
+    SWCClient와 같은 메서드를 코루틴으로 제공한다. 하나의 httpx.AsyncClient 연결 풀을 공유하고,
+    동시에 보내는 요청 수를 세마포어(SWCConfig의 max_concurrency)로 제한하므로
+    한 이벤트 루프에서 수백 개의 요청을 동시에 실행해도 연결 풀 대기 시간 초과가 나지 않는다.
+    재시도(backoff)는 SWCClient와 같은 설정으로 비동기 대기(asyncio.sleep)를 사용한다.
+
+    사용 예시:
+        async with AsyncSWCClient(SWCConfig()) as client:
+            leagues = await client.list_leagues()
+    """
+
+    def __init__(
+        self,
+        input_config: config.SWCConfig,
+        transport: httpx.AsyncBaseTransport = None,
+    ):
+        """
+        설정 객체를 통해 클라이언트 내부 속성, 연결 풀, 동시 요청 제한을 초기화한다.
+
+        transport를 지정하면 네트워크 대신 해당 전송 계층(예: 테스트용 httpx.MockTransport)을 사용한다.
+        """
+        super().__init__(input_config)
+        self.max_concurrency = input_config.swc_max_concurrency
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.http_client = httpx.AsyncClient(
+            **client_options(input_config), transport=transport
+        )
+
+    async def close(self):
+        """연결 풀의 모든 연결을 닫는다. 닫은 뒤에는 API를 호출할 수 없다."""
+        await self.http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def call_api(
+        self,
+        api_endpoint: str,
+        api_params: dict = None,
+        response_format: str = None,
+    ) -> httpx.Response:
+        """
+        API를 호출하고 오류를 로깅한다.
+
+        세마포어는 요청 한 번을 보내는 동안만 잡으므로, 재시도 대기 중인 호출이 다른 요청을 막지 않는다.
+        재시도할 상태 코드의 응답은 SWCClient.call_api처럼 httpx.HTTPStatusError로 바꾼다.
+        """
+
+        try:
+            async with self.semaphore:
+                response = await self.http_client.get(
+                    api_endpoint,
+                    **self.request_options(api_endpoint, api_params, response_format),
+                )
+            raise_for_retryable_status(response)
+            logger.debug(
+                "Response: %s, %d bytes",
+                response.headers.get("content-type"),
+                len(response.content),
+            )
+            return response
+
+        # 기타 요청 관련 예외 처리
+        except httpx.RequestError as e:
+            logger.error("Request error occurred: %s", e)
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.warning("Retryable status: %s", e.response.status_code)
+            raise
+
+    async def get_health_check(self) -> httpx.Response:
+        """API가 정상적으로 동작하는지 상태를 확인한다(SWCClient.get_health_check 참고)."""
+
+        logger.debug("상태 확인 진입")
+        return await self.call_api(self.HEALTH_CHECK_ENDPOINT, response_format="json")
+
+    async def list_leagues(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+        league_name: str = None,
+    ) -> List[League]:
+        """리그 정보를 조건에 따라 필터링해 반환한다(SWCClient.list_leagues 참고)."""
+        logger.debug("리그 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+            "league_name": league_name,
+        }
+
+        response = await self.call_api(self.LIST_LEAGUES_ENDPOINT, params)
+        return self.decode_models(response, League)
+
+    async def get_counts(self) -> Counts:
+        """리그·팀·선수·퍼포먼스 개수를 반환한다."""
+        logger.debug("개수 조회 진입")
+
+        response = await self.call_api(self.GET_COUNTS_ENDPOINT, response_format="json")
+        return self.decode_model(response, Counts)
+
+    async def iter_pages(
+        self, resource: str, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> AsyncIterator[list]:
+        """목록 리소스를 페이지 단위로 반환한다(SWCClient.iter_pages 참고)."""
+        endpoint, model, count_field = self.paginated_resource(resource, filters)
+        total = getattr(await self.get_counts(), count_field) if count_field else None
+
+        async def fetch_page(skip: int, limit: int) -> list:
+            params = {"skip": skip, "limit": limit, **filters}
+            return self.decode_models(await self.call_api(endpoint, params), model)
+
+        async for page in aiter_pages(fetch_page, page_size, total, prefetch):
+            yield page
+
+    async def iter_leagues(
+        self, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> AsyncIterator[League]:
+        """모든 리그를 하나씩 반환한다."""
+        async for page in self.iter_pages("leagues", page_size, prefetch, **filters):
+            for league in page:
+                yield league
+
+    async def iter_teams(
+        self, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> AsyncIterator[Team]:
+        """모든 팀을 하나씩 반환한다."""
+        async for page in self.iter_pages("teams", page_size, prefetch, **filters):
+            for team in page:
+                yield team
+
+    async def iter_players(
+        self, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> AsyncIterator[Player]:
+        """모든 선수를 하나씩 반환한다."""
+        async for page in self.iter_pages("players", page_size, prefetch, **filters):
+            for player in page:
+                yield player
+
+    async def iter_performances(
+        self, page_size: int = 1000, prefetch: int = 4, **filters
+    ) -> AsyncIterator[Performance]:
+        """모든 퍼포먼스를 하나씩 반환한다."""
+        async for page in self.iter_pages(
+            "performances", page_size, prefetch, **filters
+        ):
+            for performance in page:
+                yield performance
+
+    async def list_players(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+        first_name: str = None,
+        last_name: str = None,
+    ) -> List[Player]:
+        """선수 정보를 조건에 따라 필터링해 반환한다(SWCClient.list_players 참고)."""
+        logger.debug("선수 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+            "first_name": first_name,
+            "last_name": last_name,
+        }
+
+        response = await self.call_api(self.LIST_PLAYERS_ENDPOINT, params)
+        return self.decode_models(response, Player)
+
+    async def get_player_by_id(self, player_id: int) -> Player:
+        """player_id에 해당하는 선수 한 명을 반환한다."""
+        logger.debug("선수 단건 조회 진입")
+
+        endpoint = self.GET_PLAYER_ENDPOINT.format(player_id=player_id)
+        response = await self.call_api(endpoint, response_format="json")
+        return self.decode_model(response, Player)
+
+    async def list_performances(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+    ) -> List[Performance]:
+        """주차별 선수 퍼포먼스를 조건에 따라 필터링해 반환한다."""
+        logger.debug("퍼포먼스 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+        }
+
+        response = await self.call_api(self.LIST_PERFORMANCES_ENDPOINT, params)
+        return self.decode_models(response, Performance)
+
+    async def get_league_by_id(self, league_id: int) -> League:
+        """league_id에 해당하는 리그 하나를 반환한다."""
+        logger.debug("리그 단건 조회 진입")
+
+        endpoint = self.GET_LEAGUE_ENDPOINT.format(league_id=league_id)
+        response = await self.call_api(endpoint, response_format="json")
+        return self.decode_model(response, League)
+
+    async def list_teams(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+        team_name: str = None,
+        league_id: int = None,
+    ) -> List[Team]:
+        """팀 정보를 조건에 따라 필터링해 반환한다."""
+        logger.debug("팀 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+            "team_name": team_name,
+            "league_id": league_id,
+        }
+
+        response = await self.call_api(self.LIST_TEAMS_ENDPOINT, params)
+        return self.decode_models(response, Team)
+
+    async def get_by_ids(
+        self, resource: str, ids: List[int], chunk_size: int = None
+    ) -> list:
+        """
+        여러 ID를 요청한 순서대로 반환한다(SWCClient.get_by_ids 참고).
+        나눈 요청은 같은 이벤트 루프에서 동시에 보내며, 동시 요청 수는 세마포어가 제한한다.
+        """
+        endpoint, batch_model, id_attr = self.BATCH_RESOURCES[resource]
+
+        async def fetch(chunk: list):
+            params = {"ids": ",".join(map(str, chunk))}
+            response = await self.call_api(endpoint, params, response_format="json")
+            return self.decode_batch(response, batch_model)
+
+        batches = await asyncio.gather(
+            *(fetch(chunk) for chunk in self.id_chunks(ids, chunk_size))
+        )
+        return self.merge_batches(ids, batches, id_attr)
+
+    async def get_players_by_ids(
+        self, player_ids: List[int], chunk_size: int = None
+    ) -> List[Optional[Player]]:
+        """여러 선수를 요청한 ID 순서대로 반환한다."""
+        return await self.get_by_ids("players", player_ids, chunk_size)
+
+    async def get_teams_by_ids(
+        self, team_ids: List[int], chunk_size: int = None
+    ) -> List[Optional[Team]]:
+        """여러 팀을 요청한 ID 순서대로 반환한다."""
+        return await self.get_by_ids("teams", team_ids, chunk_size)
+
+    async def get_leagues_by_ids(
+        self, league_ids: List[int], chunk_size: int = None
+    ) -> List[Optional[League]]:
+        """여러 리그를 요청한 ID 순서대로 반환한다."""
+        return await self.get_by_ids("leagues", league_ids, chunk_size)
+
+    async def get_player_season_stats(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        season: str = None,
+        position: str = None,
+        minimum_week_number: str = None,
+        maximum_week_number: str = None,
+    ) -> List[PlayerSeasonStats]:
+        """선수별 시즌 누적 성적을 총점 내림차순으로 반환한다."""
+        logger.debug("선수 시즌 성적 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "season": season,
+            "position": position,
+            "minimum_week_number": minimum_week_number,
+            "maximum_week_number": maximum_week_number,
+        }
+
+        response = await self.call_api(
+            self.LIST_SEASON_STATS_ENDPOINT, params, response_format="json"
+        )
+        return self.decode_models(response, PlayerSeasonStats)
+
+    async def get_leaderboard(
+        self,
+        week_number: str = None,
+        season: str = None,
+        position: str = None,
+        k: int = 25,
+    ) -> List[LeaderboardEntry]:
+        """주차(또는 시즌) 판타지 포인트 상위 k명을 순위와 함께 반환한다."""
+        logger.debug("리더보드 조회 진입")
+
+        params = {
+            "week_number": week_number,
+            "season": season,
+            "position": position,
+            "k": k,
+        }
+
+        response = await self.call_api(
+            self.GET_LEADERBOARD_ENDPOINT, params, response_format="json"
+        )
+        return self.decode_models(response, LeaderboardEntry)
+
+    async def get_changes(self, token: str = None, limit: int = 500) -> ChangeBatch:
+        """token 이후의 변경을 최대 limit개 반환한다(SWCClient.get_changes 참고)."""
+        logger.debug("변경 피드 조회 진입")
+
+        params = {"token": token, "limit": limit}
+        response = await self.call_api(
+            self.LIST_CHANGES_ENDPOINT, params, response_format="json"
+        )
+        return self.decode_model(response, ChangeBatch)
+
+    async def export_players(
+        self, export_format: str = "ndjson", minimum_last_changed_date: str = None
+    ) -> bytes:
+        """선수 전체를 NDJSON 또는 CSV 파일 내용으로 반환한다."""
+        return await self.get_file(
+            self.EXPORT_PLAYERS_ENDPOINT,
+            {
+                "format": export_format,
+                "minimum_last_changed_date": minimum_last_changed_date,
+            },
+        )
+
+    async def export_performances(
+        self, export_format: str = "ndjson", minimum_last_changed_date: str = None
+    ) -> bytes:
+        """퍼포먼스 전체를 NDJSON 또는 CSV 파일 내용으로 반환한다."""
+        return await self.get_file(
+            self.EXPORT_PERFORMANCES_ENDPOINT,
+            {
+                "format": export_format,
+                "minimum_last_changed_date": minimum_last_changed_date,
+            },
+        )
+
+    async def get_bulk_file(self, file_name: str) -> bytes:
+        """API 서버가 만든 대용량 파일을 반환한다."""
+        return await self.get_file(
+            self.GET_BULK_FILE_ENDPOINT.format(file_name=file_name)
+        )
+
+    async def get_metrics(self) -> str:
+        """서버 계측 지표(Prometheus 텍스트 형식)를 반환한다."""
+        return (await self.get_file(self.METRICS_ENDPOINT)).decode()
+
+    async def get_file(self, api_endpoint: str, api_params: dict = None) -> bytes:
+        """파일(바이트)을 반환하는 엔드포인트를 호출한다."""
+        logger.debug("파일 조회 진입")
+
+        response = await self.call_api(api_endpoint, api_params, response_format="json")
+        response.raise_for_status()
+        return response.content
+
+    async def get_bulk_player_file(self) -> bytes:
+        """대용량 선수 데이터 파일을 반환한다."""
+
+        logger.debug("대용량 선수 파일 조회 진입")
+
+        player_file_path = self.BULK_FILE_BASE_URL + self.BULK_FILE_NAMES["players"]
+        async with self.semaphore:
+            response = await self.http_client.get(
+                player_file_path, follow_redirects=True
+            )
+
+        if response.status_code == 200:
+            logger.debug("파일 다운로드 성공")
+            return response.content
@@ -1,23 +1,92 @@
 import httpx
 import swcpy.swc_config as config
-from .schemas import League, Team, Player, Performance
-from typing import List
+from .schemas import (
+    ChangeBatch,
+    Counts,
+    LeaderboardEntry,
+    League,
+    LeagueBatch,
+    Performance,
+    Player,
+    PlayerBatch,
+    PlayerSeasonStats,
+    Team,
+    TeamBatch,
+)
+from .swc_pagination import iter_pages
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import TypeAdapter
+from typing import Iterator, List, Optional
 import backoff
+import functools
+import importlib.util
 import logging
 
+try:
+    import msgpack
+except ImportError:  # 선택 의존성: pip install swcpy[msgpack]
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2는 h2 패키지가 있을 때만 사용할 수 있다(선택 의존성: pip install swcpy[http2]).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# pyarrow는 Arrow 응답 형식과 as_table 디코딩에만 필요하다(선택 의존성: pip install swcpy[arrow]).
+# 불러오는 비용이 크므로 실제로 디코딩할 때 불러온다.
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# 일시적인 서버 상태를 뜻하므로 call_api가 예외로 바꿔 백오프로 재시도하는 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def import_pyarrow():
+    """Arrow 디코딩 경로에서 pyarrow를 불러온다. 설치되지 않았으면 ValueError를 발생시킨다."""
+    if not PYARROW_AVAILABLE:
+        raise ValueError("Arrow 형식을 사용하려면 pyarrow 패키지를 설치하세요.")
+    import pyarrow
+
+    return pyarrow
 
-class SWCClient:
+
+@functools.lru_cache(maxsize=None)
+def list_adapter(model) -> TypeAdapter:
     """
-    SportsWorldCentral API와 상호 작용하는 클라이언트 클래스
+    스키마별 List[스키마] 검증기. 검증 스키마를 만드는 비용이 크므로 스키마마다 한 번만 만든다.
+    """
+    return TypeAdapter(List[model])
 
-    이 SDK 클래스는 SWC 판타지 풋볼 API를 보다 쉽게 사용할 수 있도록 설계됐다.
-    모든 API 기능을 지원하며, 데이터 검증이 완료된 타입을 반환한다.
 
-    사용 예시:
-        client = SWCClient()
-        response = client.get_health_check()
+def raise_for_retryable_status(response: httpx.Response):
+    """재시도할 상태 코드의 응답이면 httpx.HTTPStatusError를 발생시킨다."""
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        response.raise_for_status()
+
+
+def client_options(input_config: config.SWCConfig) -> dict:
+    """
+    설정 객체로 httpx 클라이언트(동기·비동기 공통)의 연결 풀과 제한 시간 옵션을 만든다.
+    """
+    return {
+        "base_url": input_config.swc_base_url,
+        "timeout": httpx.Timeout(
+            input_config.swc_timeout, connect=input_config.swc_connect_timeout
+        ),
+        "limits": httpx.Limits(
+            max_connections=input_config.swc_max_connections,
+            max_keepalive_connections=input_config.swc_max_keepalive_connections,
+            keepalive_expiry=input_config.swc_keepalive_expiry,
+        ),
+        "http2": input_config.swc_http2 and HTTP2_AVAILABLE,
+    }
+
+
+class BaseSWCClient:
+    """
+    동기(SWCClient)·비동기(AsyncSWCClient) 클라이언트가 공유하는 부분
+
+    엔드포인트 정의, 설정 해석, 재시도(backoff) 설정, 요청 헤더 구성, 응답 디코딩을 담당한다.
+    실제 HTTP 호출(call_api)은 하위 클래스가 구현한다.
     """
 
     # 주요 API 엔드포인트 정의
@@ -27,6 +96,42 @@ class SWCClient:
     LIST_PERFORMANCES_ENDPOINT = "/v0/performances/"
     LIST_TEAMS_ENDPOINT = "/v0/teams/"
     GET_COUNTS_ENDPOINT = "/v0/counts/"
+    GET_PLAYER_ENDPOINT = "/v0/players/{player_id}"
+    GET_LEAGUE_ENDPOINT = "/v0/leagues/{league_id}"
+    BATCH_PLAYERS_ENDPOINT = "/v0/players/batch/"
+    BATCH_TEAMS_ENDPOINT = "/v0/teams/batch/"
+    BATCH_LEAGUES_ENDPOINT = "/v0/leagues/batch/"
+    LIST_SEASON_STATS_ENDPOINT = "/v0/season_stats/"
+    GET_LEADERBOARD_ENDPOINT = "/v0/leaderboard/"
+    LIST_CHANGES_ENDPOINT = "/v0/changes/"
+    EXPORT_PLAYERS_ENDPOINT = "/v0/export/players/"
+    EXPORT_PERFORMANCES_ENDPOINT = "/v0/export/performances/"
+    GET_BULK_FILE_ENDPOINT = "/v0/bulk/{file_name}"
+    METRICS_ENDPOINT = "/metrics"
+
+    # 일괄 조회(multi-get) 리소스: (엔드포인트, 응답 스키마, ID 필드)
+    BATCH_RESOURCES = {
+        "players": (BATCH_PLAYERS_ENDPOINT, PlayerBatch, "player_id"),
+        "teams": (BATCH_TEAMS_ENDPOINT, TeamBatch, "team_id"),
+        "leagues": (BATCH_LEAGUES_ENDPOINT, LeagueBatch, "league_id"),
+    }
+    # 일괄 조회 요청 하나에 담을 수 있는 최대 ID 수(서버 제한)
+    MAX_BATCH_IDS = 500
+
+    # 자동 페이지 반복을 지원하는 목록 리소스: (엔드포인트, 스키마, /v0/counts/의 개수 필드)
+    PAGINATED_RESOURCES = {
+        "leagues": (LIST_LEAGUES_ENDPOINT, League, "league_count"),
+        "teams": (LIST_TEAMS_ENDPOINT, Team, "team_count"),
+        "players": (LIST_PLAYERS_ENDPOINT, Player, "player_count"),
+        "performances": (LIST_PERFORMANCES_ENDPOINT, Performance, "performace_count"),
+    }
+
+    # 응답 형식별 Accept 헤더 값
+    RESPONSE_MEDIA_TYPES = {
+        "json": "application/json",
+        "arrow": "application/vnd.apache.arrow.stream",
+        "msgpack": "application/msgpack",
+    }
 
     BULK_FILE_BASE_URL = (
         "https://raw.githubusercontent.com/hs20789"
@@ -51,13 +156,29 @@ class SWCClient:
     def __init__(self, input_config: config.SWCConfig):
         """설정 객체를 통해 클라이언트 내부 속성을 초기화한다."""
 
-        logger.debug(f"Bulk file base URL: {self.BULK_FILE_BASE_URL}")
-        logger.debug(f"Input config: {input_config}")
+        logger.debug("Bulk file base URL: %s", self.BULK_FILE_BASE_URL)
+        logger.debug("Input config: %s", input_config)
 
         self.swc_base_url = input_config.swc_base_url
         self.backoff = input_config.swc_backoff
         self.backoff_max_time = input_config.swc_backoff_max_time
         self.bulk_file_format = input_config.swc_bulk_file_format
+        self.response_format = input_config.swc_response_format.lower()
+        self.max_connections = input_config.swc_max_connections
+
+        if self.response_format not in self.RESPONSE_MEDIA_TYPES:
+            raise ValueError(
+                f"지원하지 않는 응답 형식입니다: {self.response_format}"
+                " ('json', 'arrow', 'msgpack' 중 선택)"
+            )
+        if self.response_format == "msgpack" and msgpack is None:
+            raise ValueError(
+                "msgpack 응답 형식을 사용하려면 msgpack 패키지를 설치하세요."
+            )
+        if self.response_format == "arrow" and not PYARROW_AVAILABLE:
+            raise ValueError(
+                "Arrow 응답 형식을 사용하려면 pyarrow 패키지를 설치하세요."
+            )
 
         # 대용량 데이터 파일 이름 사전 초기화
         self.BULK_FILE_NAMES = {
@@ -68,6 +189,8 @@ class SWCClient:
             "team_players": "team_player_data",
         }
 
+        # backoff.on_exception은 코루틴 함수도 감싸므로 비동기 클라이언트에도 그대로 적용된다.
+        # call_api는 RETRYABLE_STATUS_CODES 응답만 HTTPStatusError로 바꾸므로 404 등은 재시도하지 않는다.
         if self.backoff:
             self.call_api = backoff.on_exception(
                 wait_gen=backoff.expo,
@@ -86,34 +209,194 @@ class SWCClient:
                 key: value + ".csv" for key, value in self.BULK_FILE_NAMES.items()
             }
 
-        logger.debug(f"Bulk file dictionary: {self.BULK_FILE_NAMES}")
+        logger.debug("Bulk file dictionary: %s", self.BULK_FILE_NAMES)
 
-    def call_api(
-        self,
-        api_endpoint: str,
-        api_params: dict = None,
-    ) -> httpx.Response:
-        """API를 호출하고 오류를 로깅한다."""
+        if input_config.swc_http2 and not HTTP2_AVAILABLE:
+            logger.debug("h2 패키지가 없어 HTTP/1.1을 사용합니다.")
+
+    def request_options(
+        self, api_endpoint: str, api_params: dict = None, response_format: str = None
+    ) -> dict:
+        """
+        API 요청의 매개 변수와 헤더를 만든다.
+
+        response_format('json', 'arrow', 'msgpack')에 맞는 Accept 헤더로 요청하며,
+        지정하지 않으면 설정(SWCConfig)의 응답 형식을 사용한다.
+        """
 
         # None 값을 제거해 유요한 매개 변수만 요청에 포함
         if api_params:
             api_params = {
                 key: val for key, val in api_params.items() if val is not None
             }
+        logger.debug(
+            "base_url: %s, api_endpoint: %s, api_params: %s",
+            self.swc_base_url,
+            api_endpoint,
+            api_params,
+        )
+        accept = self.RESPONSE_MEDIA_TYPES[response_format or self.response_format]
+        return {"params": api_params, "headers": {"Accept": accept}}
+
+    def paginated_resource(self, resource: str, filters: dict) -> tuple:
+        """
+        페이지 반복할 리소스의 (엔드포인트, 스키마, 개수 필드)를 반환한다.
+        필터 조건이 있으면 전체 개수로 페이지 범위를 정할 수 없으므로 개수 필드는 None이다.
+        """
+        if resource not in self.PAGINATED_RESOURCES:
+            raise ValueError(
+                f"페이지 반복을 지원하지 않는 리소스입니다: {resource}"
+                f" ({', '.join(self.PAGINATED_RESOURCES)} 중 선택)"
+            )
+        endpoint, model, count_field = self.PAGINATED_RESOURCES[resource]
+        if any(value is not None for value in filters.values()):
+            count_field = None
+        return endpoint, model, count_field
+
+    def id_chunks(self, ids: list, chunk_size: int = None) -> list:
+        """중복을 뺀 ID 목록을 일괄 조회 요청 하나에 담을 수 있는 크기로 나눈다."""
+        chunk_size = min(chunk_size or self.MAX_BATCH_IDS, self.MAX_BATCH_IDS)
+        unique_ids = list(dict.fromkeys(ids))
+        return [
+            unique_ids[start : start + chunk_size]
+            for start in range(0, len(unique_ids), chunk_size)
+        ]
+
+    def decode_batch(self, response: httpx.Response, batch_model):
+        """일괄 조회 응답을 본문 바이트에서 바로 검증한다."""
+        response.raise_for_status()
+        return batch_model.model_validate_json(response.content)
+
+    @staticmethod
+    def merge_batches(ids: list, batches: list, id_attr: str) -> list:
+        """
+        일괄 조회 결과를 요청한 ID 순서로 합친다. 찾지 못한 ID 자리는 None이다.
+        """
+        by_id = {
+            getattr(item, id_attr): item for batch in batches for item in batch.items
+        }
+        return [by_id.get(id) for id in ids]
 
-        try:
-            # httpx.Client를 사용해 API 요청 수행
-            with httpx.Client(base_url=self.swc_base_url) as client:
-                logger.debug(
-                    f"base_url: {self.swc_base_url}, api_endpoint: {api_endpoint}, api_params: {api_params}"
+    def decode_model(self, response: httpx.Response, model):
+        """단건 API 응답을 본문 바이트에서 바로 스키마 객체로 검증한다."""
+        response.raise_for_status()
+        return model.model_validate_json(response.content)
+
+    def decode_models(self, response: httpx.Response, model) -> list:
+        """
+        목록 API 응답을 스키마 객체의 리스트로 검증한다.
+
+        JSON 응답은 파이썬 객체로 먼저 바꾸지 않고 본문 바이트를 pydantic-core가 한 번에 파싱·검증한다.
+        Arrow·MessagePack 응답은 행 딕셔너리로 디코딩한 뒤 리스트 전체를 한 번에 검증한다.
+        """
+        adapter = list_adapter(model)
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith(self.RESPONSE_MEDIA_TYPES["json"]):
+            response.raise_for_status()
+            return adapter.validate_json(response.content)
+        return adapter.validate_python(self.decode_response(response))
+
+    def decode_response(self, response: httpx.Response, as_table: bool = False):
+        """
+        목록 API 응답 본문을 Content-Type에 맞게 디코딩한다.
+
+        반환값:
+        - as_table이 False이면 행 딕셔너리의 리스트
+        - as_table이 True이면 pyarrow.Table(Arrow 응답은 복사 없이, 그 외는 변환해서 만든다)
+          DataFrame이 필요하면 반환값에 to_pandas()를 호출한다.
+        """
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "")
+
+        if content_type.startswith(self.RESPONSE_MEDIA_TYPES["arrow"]):
+            pa = import_pyarrow()
+            table = pa.ipc.open_stream(response.content).read_all()
+            return table if as_table else table.to_pylist()
+
+        if content_type.startswith(self.RESPONSE_MEDIA_TYPES["msgpack"]):
+            if msgpack is None:
+                raise ValueError(
+                    "msgpack 응답을 디코딩하려면 msgpack 패키지를 설치하세요."
                 )
-                response = client.get(api_endpoint, params=api_params)
-                logger.debug(f"Response JSON: {response.json()}")
-                return response
+            rows = msgpack.unpackb(response.content)
+        else:
+            rows = response.json()
+        return import_pyarrow().Table.from_pylist(rows) if as_table else rows
+
+
+class SWCClient(BaseSWCClient):
+    """
+    SportsWorldCentral API와 상호 작용하는 클라이언트 클래스
+
+    이 SDK 클래스는 SWC 판타지 풋볼 API를 보다 쉽게 사용할 수 있도록 설계됐다.
+    모든 API 기능을 지원하며, 데이터 검증이 완료된 타입을 반환한다.
+
+    클라이언트는 연결 풀을 가진 httpx.Client 하나를 만들어 모든 호출에서 재사용한다.
+    keep-alive 연결을 재사용하므로 호출마다 DNS 조회, TCP·TLS 핸드셰이크 비용이 들지 않는다.
+    사용이 끝나면 close()를 호출하거나 with 문으로 사용해 연결을 정리한다.
+
+    사용 예시:
+        with SWCClient(SWCConfig()) as client:
+            response = client.get_health_check()
+    """
+
+    def __init__(
+        self, input_config: config.SWCConfig, transport: httpx.BaseTransport = None
+    ):
+        """
+        설정 객체를 통해 클라이언트 내부 속성과 연결 풀을 초기화한다.
+
+        transport를 지정하면 네트워크 대신 해당 전송 계층(예: 테스트용 httpx.MockTransport)을 사용한다.
+        """
+        super().__init__(input_config)
+        self.http_client = httpx.Client(
+            **client_options(input_config), transport=transport
+        )
+
+    def close(self):
+        """연결 풀의 모든 연결을 닫는다. 닫은 뒤에는 API를 호출할 수 없다."""
+        self.http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def call_api(
+        self,
+        api_endpoint: str,
+        api_params: dict = None,
+        response_format: str = None,
+    ) -> httpx.Response:
+        """
+        API를 호출하고 오류를 로깅한다.
+
+        응답 형식은 request_options를 참고한다. 압축(gzip, zstd)된 응답은 httpx가 자동으로 해제한다.
+        RETRYABLE_STATUS_CODES(429, 502, 503, 504) 응답은 httpx.HTTPStatusError로 바꿔
+        백오프가 켜져 있으면 재시도하고, 재시도를 포기하면 그 예외를 그대로 발생시킨다.
+        """
+
+        try:
+            # 연결 풀을 가진 httpx.Client를 재사용해 API 요청 수행
+            response = self.http_client.get(
+                api_endpoint,
+                **self.request_options(api_endpoint, api_params, response_format),
+            )
+            raise_for_retryable_status(response)
+            logger.debug(
+                "Response: %s, %d bytes",
+                response.headers.get("content-type"),
+                len(response.content),
+            )
+            return response
 
         # 기타 요청 관련 예외 처리
         except httpx.RequestError as e:
-            logger.error(f"Request error occurred: {str(e)}")
+            logger.error("Request error occurred: %s", e)
+            raise
+        except httpx.HTTPStatusError as e:
+            logger.warning("Retryable status: %s", e.response.status_code)
             raise
 
     def get_health_check(self) -> httpx.Response:
@@ -132,7 +415,7 @@ class SWCClient:
 
         logger.debug("상태 확인 진입")
         endpoint_url = self.HEALTH_CHECK_ENDPOINT
-        return self.call_api(endpoint_url)
+        return self.call_api(endpoint_url, response_format="json")
 
     def list_leagues(
         self,
@@ -160,7 +443,301 @@ class SWCClient:
         }
 
         response = self.call_api(self.LIST_LEAGUES_ENDPOINT, params)
-        return [League(**league) for league in response.json()]
+        return self.decode_models(response, League)
+
+    def get_counts(self) -> Counts:
+        """리그·팀·선수·퍼포먼스 개수를 반환한다."""
+        logger.debug("개수 조회 진입")
+
+        response = self.call_api(self.GET_COUNTS_ENDPOINT, response_format="json")
+        return self.decode_model(response, Counts)
+
+    def iter_pages(
+        self, resource: str, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> Iterator[list]:
+        """
+        목록 리소스('leagues', 'teams', 'players', 'performances')를 처음부터 끝까지 페이지 단위로 반환한다.
+
+        필터가 없으면 /v0/counts/로 전체 개수를 먼저 조회해 페이지 범위를 정하고,
+        호출자가 현재 페이지를 처리하는 동안 다음 prefetch개 페이지를 연결 풀에서 동시에 받아 둔다.
+        filters는 목록 엔드포인트의 쿼리 매개 변수(예: minimum_last_changed_date)로 그대로 전달된다.
+
+        반환값:
+        - 검증된 스키마 객체 리스트(페이지)의 이터레이터
+        """
+        endpoint, model, count_field = self.paginated_resource(resource, filters)
+        total = getattr(self.get_counts(), count_field) if count_field else None
+
+        def fetch_page(skip: int, limit: int) -> list:
+            params = {"skip": skip, "limit": limit, **filters}
+            return self.decode_models(self.call_api(endpoint, params), model)
+
+        yield from iter_pages(fetch_page, page_size, total, prefetch)
+
+    def iter_leagues(
+        self, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> Iterator[League]:
+        """모든 리그를 하나씩 반환한다(페이지 처리는 iter_pages 참고)."""
+        for page in self.iter_pages("leagues", page_size, prefetch, **filters):
+            yield from page
+
+    def iter_teams(
+        self, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> Iterator[Team]:
+        """모든 팀을 하나씩 반환한다(페이지 처리는 iter_pages 참고)."""
+        for page in self.iter_pages("teams", page_size, prefetch, **filters):
+            yield from page
+
+    def iter_players(
+        self, page_size: int = 100, prefetch: int = 4, **filters
+    ) -> Iterator[Player]:
+        """모든 선수를 하나씩 반환한다(페이지 처리는 iter_pages 참고)."""
+        for page in self.iter_pages("players", page_size, prefetch, **filters):
+            yield from page
+
+    def iter_performances(
+        self, page_size: int = 1000, prefetch: int = 4, **filters
+    ) -> Iterator[Performance]:
+        """모든 퍼포먼스를 하나씩 반환한다(페이지 처리는 iter_pages 참고)."""
+        for page in self.iter_pages("performances", page_size, prefetch, **filters):
+            yield from page
+
+    def list_players(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+        first_name: str = None,
+        last_name: str = None,
+    ) -> List[Player]:
+        """
+        선수 정보를 조건에 따라 필터링해 반환한다.
+
+        반환값:
+        - schemas.Player 객체의 리스트(각 선수의 퍼포먼스 포함)
+        """
+        logger.debug("선수 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+            "first_name": first_name,
+            "last_name": last_name,
+        }
+
+        response = self.call_api(self.LIST_PLAYERS_ENDPOINT, params)
+        return self.decode_models(response, Player)
+
+    def get_player_by_id(self, player_id: int) -> Player:
+        """player_id에 해당하는 선수 한 명을 반환한다. 없는 ID면 httpx.HTTPStatusError(404)가 발생한다."""
+        logger.debug("선수 단건 조회 진입")
+
+        endpoint = self.GET_PLAYER_ENDPOINT.format(player_id=player_id)
+        response = self.call_api(endpoint, response_format="json")
+        return self.decode_model(response, Player)
+
+    def list_performances(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+    ) -> List[Performance]:
+        """
+        주차별 선수 퍼포먼스를 조건에 따라 필터링해 반환한다.
+
+        반환값:
+        - schemas.Performance 객체의 리스트
+        """
+        logger.debug("퍼포먼스 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+        }
+
+        response = self.call_api(self.LIST_PERFORMANCES_ENDPOINT, params)
+        return self.decode_models(response, Performance)
+
+    def get_league_by_id(self, league_id: int) -> League:
+        """league_id에 해당하는 리그 하나를 반환한다. 없는 ID면 httpx.HTTPStatusError(404)가 발생한다."""
+        logger.debug("리그 단건 조회 진입")
+
+        endpoint = self.GET_LEAGUE_ENDPOINT.format(league_id=league_id)
+        response = self.call_api(endpoint, response_format="json")
+        return self.decode_model(response, League)
+
+    def list_teams(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        minimum_last_changed_date: str = None,
+        team_name: str = None,
+        league_id: int = None,
+    ) -> List[Team]:
+        """
+        팀 정보를 조건에 따라 필터링해 반환한다.
+
+        반환값:
+        - schemas.Team 객체의 리스트(각 팀의 선수 포함)
+        """
+        logger.debug("팀 정보 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "minimum_last_changed_date": minimum_last_changed_date,
+            "team_name": team_name,
+            "league_id": league_id,
+        }
+
+        response = self.call_api(self.LIST_TEAMS_ENDPOINT, params)
+        return self.decode_models(response, Team)
+
+    def get_by_ids(self, resource: str, ids: List[int], chunk_size: int = None) -> list:
+        """
+        여러 ID를 일괄 조회 엔드포인트로 가져와 요청한 ID 순서대로 반환한다.
+
+        ID가 서버 제한(500개)보다 많으면 나눠서 연결 풀로 동시에 요청한다.
+        찾지 못한 ID 자리에는 None이 들어가므로 반환 리스트는 항상 ids와 길이가 같다.
+        """
+        endpoint, batch_model, id_attr = self.BATCH_RESOURCES[resource]
+        chunks = self.id_chunks(ids, chunk_size)
+
+        def fetch(chunk: list):
+            params = {"ids": ",".join(map(str, chunk))}
+            response = self.call_api(endpoint, params, response_format="json")
+            return self.decode_batch(response, batch_model)
+
+        if len(chunks) <= 1:
+            batches = [fetch(chunk) for chunk in chunks]
+        else:
+            workers = min(len(chunks), self.max_connections)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                batches = list(pool.map(fetch, chunks))
+        return self.merge_batches(ids, batches, id_attr)
+
+    def get_players_by_ids(
+        self, player_ids: List[int], chunk_size: int = None
+    ) -> List[Optional[Player]]:
+        """여러 선수를 요청한 ID 순서대로 반환한다(get_by_ids 참고)."""
+        return self.get_by_ids("players", player_ids, chunk_size)
+
+    def get_teams_by_ids(
+        self, team_ids: List[int], chunk_size: int = None
+    ) -> List[Optional[Team]]:
+        """여러 팀을 요청한 ID 순서대로 반환한다(get_by_ids 참고)."""
+        return self.get_by_ids("teams", team_ids, chunk_size)
+
+    def get_leagues_by_ids(
+        self, league_ids: List[int], chunk_size: int = None
+    ) -> List[Optional[League]]:
+        """여러 리그를 요청한 ID 순서대로 반환한다(get_by_ids 참고)."""
+        return self.get_by_ids("leagues", league_ids, chunk_size)
+
+    def get_player_season_stats(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        season: str = None,
+        position: str = None,
+        minimum_week_number: str = None,
+        maximum_week_number: str = None,
+    ) -> List[PlayerSeasonStats]:
+        """선수별 시즌 누적 성적을 총점 내림차순으로 반환한다."""
+        logger.debug("선수 시즌 성적 조회 진입")
+
+        params = {
+            "skip": skip,
+            "limit": limit,
+            "season": season,
+            "position": position,
+            "minimum_week_number": minimum_week_number,
+            "maximum_week_number": maximum_week_number,
+        }
+
+        response = self.call_api(
+            self.LIST_SEASON_STATS_ENDPOINT, params, response_format="json"
+        )
+        return self.decode_models(response, PlayerSeasonStats)
+
+    def get_leaderboard(
+        self,
+        week_number: str = None,
+        season: str = None,
+        position: str = None,
+        k: int = 25,
+    ) -> List[LeaderboardEntry]:
+        """주차(또는 시즌) 판타지 포인트 상위 k명을 순위와 함께 반환한다."""
+        logger.debug("리더보드 조회 진입")
+
+        params = {
+            "week_number": week_number,
+            "season": season,
+            "position": position,
+            "k": k,
+        }
+
+        response = self.call_api(
+            self.GET_LEADERBOARD_ENDPOINT, params, response_format="json"
+        )
+        return self.decode_models(response, LeaderboardEntry)
+
+    def get_changes(self, token: str = None, limit: int = 500) -> ChangeBatch:
+        """
+        token 이후의 변경을 최대 limit개 반환한다.
+        다음 호출에는 반환값의 next_token을 넘기고, has_more가 False가 될 때까지 반복한다.
+        """
+        logger.debug("변경 피드 조회 진입")
+
+        params = {"token": token, "limit": limit}
+        response = self.call_api(
+            self.LIST_CHANGES_ENDPOINT, params, response_format="json"
+        )
+        return self.decode_model(response, ChangeBatch)
+
+    def export_players(
+        self, export_format: str = "ndjson", minimum_last_changed_date: str = None
+    ) -> bytes:
+        """선수 전체를 NDJSON 또는 CSV 파일 내용으로 반환한다."""
+        return self.get_file(
+            self.EXPORT_PLAYERS_ENDPOINT,
+            {
+                "format": export_format,
+                "minimum_last_changed_date": minimum_last_changed_date,
+            },
+        )
+
+    def export_performances(
+        self, export_format: str = "ndjson", minimum_last_changed_date: str = None
+    ) -> bytes:
+        """퍼포먼스 전체를 NDJSON 또는 CSV 파일 내용으로 반환한다."""
+        return self.get_file(
+            self.EXPORT_PERFORMANCES_ENDPOINT,
+            {
+                "format": export_format,
+                "minimum_last_changed_date": minimum_last_changed_date,
+            },
+        )
+
+    def get_bulk_file(self, file_name: str) -> bytes:
+        """
+        API 서버가 만든 대용량 파일(예: player_data.parquet, performance_data.arrow)을 반환한다.
+        """
+        return self.get_file(self.GET_BULK_FILE_ENDPOINT.format(file_name=file_name))
+
+    def get_metrics(self) -> str:
+        """서버 계측 지표(Prometheus 텍스트 형식)를 반환한다."""
+        return self.get_file(self.METRICS_ENDPOINT).decode()
+
+    def get_file(self, api_endpoint: str, api_params: dict = None) -> bytes:
+        """파일(바이트)을 반환하는 엔드포인트를 호출한다."""
+        logger.debug("파일 조회 진입")
+
+        response = self.call_api(api_endpoint, api_params, response_format="json")
+        response.raise_for_status()
+        return response.content
 
     def get_bulk_player_file(self) -> bytes:
         """대용량 선수 데이터 파일을 반환한다."""
@@ -168,7 +745,8 @@ class SWCClient:
         logger.debug("대용량 선수 파일 조회 진입")
 
         player_file_path = self.BULK_FILE_BASE_URL + self.BULK_FILE_NAMES["players"]
-        response = httpx.get(player_file_path, follow_redirects=True)
+        # 절대 URL이므로 기본 URL과 관계없이 같은 연결 풀로 내려받는다.
+        response = self.http_client.get(player_file_path, follow_redirects=True)
 
         if response.status_code == 200:
             logger.debug("파일 다운로드 성공")
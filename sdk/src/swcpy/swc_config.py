@@ -16,6 +16,14 @@ class SWCConfig:
     swc_backoff: bool
     swc_backoff_max_time: int
     swc_bulk_file_format: str
+    swc_response_format: str
+    swc_timeout: float
+    swc_connect_timeout: float
+    swc_max_connections: int
+    swc_max_keepalive_connections: int
+    swc_keepalive_expiry: float
+    swc_http2: bool
+    swc_max_concurrency: int
 
     def __init__(
         self,
@@ -23,6 +31,14 @@ class SWCConfig:
         backoff: bool = True,
         backoff_max_time: int = 30,
         bulk_file_format: str = "csv",
+        response_format: str = "json",
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        max_concurrency: int = None,
     ):
         """
         __init__의 Docstring
@@ -33,9 +49,17 @@ class SWCConfig:
         인수:
         - swc_base_url (선택): 모든 API 호출에 사용할 기본 URL.
                                 직접 전달하거나 환경 변수(SWC_API_BASE_URL)로 지정 가능.
-        - backoff: 오류 발생 시 SDK가 백오프 전략으로 재시도할지 여부를 설정하는 부울 값.
+        - backoff: 연결 오류나 일시적인 서버 응답(429, 502, 503, 504) 시 SDK가 백오프 전략으로 재시도할지 여부를 설정하는 부울 값.
         - backoff_max_time: API 호출 재시도를 중단하기 전까지의 최대 시간(초 단위).
         - bulf_file_format: 대용량 데이터 파일 형식. 'csv' 또는 'parquet' 중 선택
+        - response_format: 목록 API 응답 형식. 'json', 'arrow'(Arrow IPC 스트림), 'msgpack' 중 선택
+        - timeout: 응답 읽기·요청 쓰기·연결 풀 대기의 제한 시간(초 단위)
+        - connect_timeout: 서버 연결(TCP/TLS 핸드셰이크)의 제한 시간(초 단위)
+        - max_connections: 연결 풀이 동시에 열 수 있는 최대 연결 수
+        - max_keepalive_connections: 요청이 끝난 뒤에도 재사용을 위해 열어 두는 최대 연결 수
+        - keepalive_expiry: 쉬고 있는 연결을 닫기 전까지 유지하는 시간(초 단위)
+        - http2: 서버가 지원하면 HTTP/2를 사용할지 여부. h2 패키지가 없으면 HTTP/1.1을 사용한다.
+        - max_concurrency: 비동기 클라이언트가 동시에 보내는 최대 요청 수. 지정하지 않으면 max_connections와 같다.
         """
 
         self.swc_base_url = swc_base_url or os.getenv("SWC_API_BASE_URL")
@@ -49,6 +73,14 @@ class SWCConfig:
         self.swc_backoff = backoff
         self.swc_backoff_max_time = backoff_max_time
         self.swc_bulk_file_format = bulk_file_format
+        self.swc_response_format = response_format
+        self.swc_timeout = timeout
+        self.swc_connect_timeout = connect_timeout
+        self.swc_max_connections = max_connections
+        self.swc_max_keepalive_connections = max_keepalive_connections
+        self.swc_keepalive_expiry = keepalive_expiry
+        self.swc_http2 = http2
+        self.swc_max_concurrency = max_concurrency or max_connections
 
     def str(self):
         """
@@ -59,4 +91,4 @@ class SWCConfig:
         이 메서드는 로깅이나 디버깅 시 설정 값을 출력하는 데 사용된다.
         명시적으로 정의하지 않으면 기본 문자열 표현이 사용되며, 정보가 부족할 수 있다.
         """
-        return f"{self.swc_base_url} {self.swc_backoff} {self.swc_backoff_max_time} {self.swc_bulk_file_format}"
+        return f"{self.swc_base_url} {self.swc_backoff} {self.swc_backoff_max_time} {self.swc_bulk_file_format} {self.swc_response_format} {self.swc_timeout} {self.swc_max_connections} {self.swc_http2}"
@@ -0,0 +1,72 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def iter_pages(fetch_page, page_size: int, total: int = None, prefetch: int = 4):
+    """
+    skip/limit 목록 API를 페이지 단위로 끝까지 읽는 제너레이터
+
+    fetch_page(skip, limit)는 한 페이지의 항목 리스트를 반환하는 함수다.
+    현재 페이지를 호출자에게 넘긴 동안 다음 prefetch개 페이지를 스레드 풀에서 미리 받아 두므로,
+    메모리에는 많아야 prefetch + 1개 페이지만 올라온다.
+
+    total(전체 항목 수)을 알면 그 범위 안의 페이지만 요청한다. 범위의 마지막 페이지까지 가득 차 있으면
+    그 사이 데이터가 늘어난 것이므로 짧은 페이지가 나올 때까지 계속 읽는다.
+    total을 모르면(필터 조건이 있는 경우) 짧은 페이지가 나올 때까지 읽으며, 끝을 넘어 미리 요청한 페이지는 버린다.
+    """
+    pool = ThreadPoolExecutor(max_workers=prefetch + 1)
+    pending = deque()
+    next_skip = 0
+    try:
+        while True:
+            while len(pending) <= prefetch and (total is None or next_skip < total):
+                pending.append(pool.submit(fetch_page, next_skip, page_size))
+                next_skip += page_size
+            if not pending:
+                return
+            page = pending.popleft().result()
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            if not pending:
+                logger.debug("계획한 범위를 넘어 데이터가 더 있어 계속 읽습니다.")
+                total = None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch_page, page_size: int, total: int = None, prefetch: int = 4):
+    """
+    iter_pages의 asyncio 버전
+
+    fetch_page(skip, limit)는 한 페이지의 항목 리스트를 반환하는 코루틴 함수이며,
+    다음 prefetch개 페이지는 같은 이벤트 루프의 태스크로 미리 받아 둔다.
+    """
+    pending = deque()
+    next_skip = 0
+    try:
+        while True:
+            while len(pending) <= prefetch and (total is None or next_skip < total):
+                pending.append(asyncio.ensure_future(fetch_page(next_skip, page_size)))
+                next_skip += page_size
+            if not pending:
+                return
+            page = await pending.popleft()
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            if not pending:
+                logger.debug("계획한 범위를 넘어 데이터가 더 있어 계속 읽습니다.")
+                total = None
+    finally:
+        # 중간에 멈추면 미리 요청한 페이지를 취소하고, 취소가 끝날 때까지 기다린다.
+        # 기다리지 않으면 태스크가 닫힌 연결 풀을 쓰거나, 실패한 태스크의 예외가 회수되지 않았다는 경고가 남는다.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
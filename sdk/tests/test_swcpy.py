@@ -1,6 +1,15 @@
+import asyncio
+import contextlib
+import httpx
+import subprocess
+import sys
+import warnings
+import pyarrow as pa
 import pytest
-from swcpy import SWCClient
+from swcpy import AsyncSWCClient, SWCClient
 from swcpy import SWCConfig
+from swcpy.swc_client import client_options, list_adapter
+from swcpy.swc_pagination import aiter_pages
 from swcpy.schemas import League, Team, Player, Performance
 from io import BytesIO
 import pyarrow.parquet as pq
@@ -51,3 +60,377 @@ def test_bulk_player_file_parquet():
 
     player_df = player_table.to_pandas()
     assert len(player_df) == 1018
+
+
+def _arrow_stream(rows: list) -> bytes:
+    table = pa.Table.from_pylist(rows)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+LEAGUE_ROWS = [
+    {
+        "league_id": 5001,
+        "league_name": "Pigskin Prodigal Fantasy League",
+        "scoring_type": "PPR",
+        "last_changed_date": "2024-04-25",
+        "teams": [],
+    }
+]
+
+
+def test_decode_arrow_response():
+    """Arrow IPC 스트림 응답을 행 리스트와 pyarrow.Table로 디코딩하는지 테스트"""
+    client = SWCClient(SWCConfig(swc_base_url=BASE_URL, response_format="arrow"))
+    response = httpx.Response(
+        200,
+        headers={"content-type": "application/vnd.apache.arrow.stream"},
+        content=_arrow_stream([{"player_id": 1001, "fantasy_points": 20.0}]),
+        request=httpx.Request("GET", BASE_URL + "/v0/performances/"),
+    )
+    assert client.decode_response(response) == [
+        {"player_id": 1001, "fantasy_points": 20.0}
+    ]
+    assert client.decode_response(response, as_table=True).num_rows == 1
+
+
+def test_import_does_not_load_pyarrow():
+    """pyarrow는 선택 의존성이므로 SDK를 불러올 때는 불러오지 않는지 테스트"""
+    code = "import sys, swcpy; assert 'pyarrow' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_decode_msgpack_response():
+    """MessagePack 응답을 JSON 응답과 같은 행 리스트로 디코딩하는지 테스트"""
+    msgpack = pytest.importorskip("msgpack")
+    client = SWCClient(SWCConfig(swc_base_url=BASE_URL, response_format="msgpack"))
+    response = httpx.Response(
+        200,
+        headers={"content-type": "application/msgpack"},
+        content=msgpack.packb(LEAGUE_ROWS),
+        request=httpx.Request("GET", BASE_URL + "/v0/leagues/"),
+    )
+    rows = client.decode_response(response)
+    assert rows == LEAGUE_ROWS
+    assert League(**rows[0]).league_id == 5001
+
+
+def test_decode_models_validates_raw_json():
+    """JSON 목록 응답을 본문 바이트에서 한 번에 검증하고, 스키마별 검증기를 재사용하는지 테스트"""
+    client = SWCClient(SWCConfig(swc_base_url=BASE_URL))
+    response = httpx.Response(
+        200,
+        json=LEAGUE_ROWS,
+        request=httpx.Request("GET", BASE_URL + "/v0/leagues/"),
+    )
+    leagues = client.decode_models(response, League)
+    assert [league.league_id for league in leagues] == [5001]
+    assert leagues[0] == League(**LEAGUE_ROWS[0])
+    assert list_adapter(League) is list_adapter(League)
+
+
+def test_invalid_response_format():
+    """지원하지 않는 응답 형식은 설정 단계에서 거부하는지 테스트"""
+    with pytest.raises(ValueError):
+        SWCClient(SWCConfig(swc_base_url=BASE_URL, response_format="xml"))
+
+
+def test_client_reuses_pooled_connection():
+    """여러 호출이 같은 연결 풀(httpx.Client)을 사용하고, with 문이 끝나면 닫히는지 테스트"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=LEAGUE_ROWS)
+
+    config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+    with SWCClient(config, transport=httpx.MockTransport(handler)) as client:
+        http_client = client.http_client
+        assert len(client.list_leagues()) == 1
+        assert client.list_leagues(skip=1)[0].league_id == 5001
+        assert client.http_client is http_client
+    assert http_client.is_closed
+    assert [request.url.params.get("skip") for request in requests] == ["0", "1"]
+
+
+def test_client_pool_options():
+    """SWCConfig의 제한 시간과 연결 풀 설정이 httpx 클라이언트에 반영되는지 테스트"""
+    config = SWCConfig(
+        swc_base_url=BASE_URL,
+        timeout=7.0,
+        connect_timeout=2.0,
+        max_connections=3,
+        http2=False,
+    )
+    with SWCClient(config) as client:
+        assert client.http_client.timeout.connect == 2.0
+        assert client.http_client.timeout.read == 7.0
+    options = client_options(config)
+    assert options["limits"].max_connections == 3
+    assert options["http2"] is False
+
+
+def test_async_client_bounds_concurrency():
+    """비동기 클라이언트가 동시에 보내는 요청 수를 max_concurrency로 제한하는지 테스트"""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=LEAGUE_ROWS)
+
+    async def fetch_all():
+        config = SWCConfig(swc_base_url=BASE_URL, backoff=False, max_concurrency=4)
+        async with AsyncSWCClient(
+            config, transport=httpx.MockTransport(handler)
+        ) as client:
+            pages = await asyncio.gather(
+                *(client.list_leagues(skip=skip) for skip in range(20))
+            )
+        assert client.http_client.is_closed
+        return pages
+
+    pages = asyncio.run(fetch_all())
+    assert len(pages) == 20
+    assert all(page[0].league_id == 5001 for page in pages)
+    assert peak == 4
+
+
+def test_async_client_retries_with_backoff():
+    """비동기 클라이언트가 연결 오류를 백오프로 재시도하는지 테스트"""
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"message": "API 상태 확인 성공"})
+
+    async def check():
+        config = SWCConfig(swc_base_url=BASE_URL, backoff_max_time=5)
+        async with AsyncSWCClient(
+            config, transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.get_health_check()
+
+    response = asyncio.run(check())
+    assert response.status_code == 200
+    assert len(attempts) == 2
+
+
+def _flaky_handler(status_codes: list, attempts: list):
+    """status_codes 순서대로 오류 응답을 보낸 뒤 200으로 응답하는 API"""
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) <= len(status_codes):
+            return httpx.Response(status_codes[len(attempts) - 1])
+        return httpx.Response(200, json={"message": "API 상태 확인 성공"})
+
+    return handler
+
+
+def test_client_retries_retryable_status():
+    """429·5xx 게이트웨이 응답은 백오프로 재시도하는지 테스트(동기·비동기)"""
+    config = SWCConfig(swc_base_url=BASE_URL, backoff_max_time=5)
+    attempts = []
+    transport = httpx.MockTransport(_flaky_handler([429], attempts))
+    with SWCClient(config, transport=transport) as client:
+        assert client.get_health_check().status_code == 200
+    assert len(attempts) == 2
+
+    async def check():
+        transport = httpx.MockTransport(_flaky_handler([503], attempts))
+        async with AsyncSWCClient(config, transport=transport) as client:
+            return await client.get_health_check()
+
+    attempts.clear()
+    assert asyncio.run(check()).status_code == 200
+    assert len(attempts) == 2
+
+
+def test_client_does_not_retry_client_errors():
+    """재시도해도 결과가 같은 404는 재시도하지 않고, 재시도를 끄면 503도 바로 예외가 되는지 테스트"""
+    attempts = []
+    transport = httpx.MockTransport(_flaky_handler([404], attempts))
+    with SWCClient(SWCConfig(swc_base_url=BASE_URL), transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_player_by_id(1001)
+    assert len(attempts) == 1
+
+    attempts.clear()
+    config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+    transport = httpx.MockTransport(_flaky_handler([503], attempts))
+    with SWCClient(config, transport=transport) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_health_check()
+    assert len(attempts) == 1
+
+
+def _paged_leagues_handler(count: int, requests: list):
+    """skip/limit 페이지와 /v0/counts/를 흉내 내는 리그 목록 API"""
+    leagues = [dict(LEAGUE_ROWS[0], league_id=5001 + i) for i in range(count)]
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/v0/counts/":
+            return httpx.Response(
+                200,
+                json={
+                    "league_count": count,
+                    "team_count": 0,
+                    "player_count": 0,
+                    "performace_count": 0,
+                },
+            )
+        skip = int(request.url.params["skip"])
+        limit = int(request.url.params["limit"])
+        return httpx.Response(200, json=leagues[skip : skip + limit])
+
+    return handler
+
+
+def test_iter_leagues_plans_pages_from_counts():
+    """전체 개수로 페이지 범위를 정해 모든 리그를 순서대로 반환하는지 테스트"""
+    requests = []
+    config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+    transport = httpx.MockTransport(_paged_leagues_handler(23, requests))
+    with SWCClient(config, transport=transport) as client:
+        leagues = list(client.iter_leagues(page_size=5, prefetch=3))
+    assert [league.league_id for league in leagues] == list(range(5001, 5024))
+    # 개수 조회 1번 + 페이지 5번. 전체 개수를 넘는 페이지는 요청하지 않는다.
+    assert len(requests) == 6
+
+
+def test_iter_leagues_with_filter_stops_at_short_page():
+    """필터가 있으면 짧은 페이지가 나올 때까지 읽는지 테스트"""
+    requests = []
+    config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+    transport = httpx.MockTransport(_paged_leagues_handler(12, requests))
+    with SWCClient(config, transport=transport) as client:
+        pages = list(
+            client.iter_pages("leagues", page_size=5, prefetch=0, league_name="Pigskin")
+        )
+        assert [len(page) for page in pages] == [5, 5, 2]
+        assert all(
+            request.url.params["league_name"] == "Pigskin" for request in requests
+        )
+        with pytest.raises(ValueError):
+            next(client.iter_pages("coaches"))
+
+
+def test_async_iter_leagues():
+    """비동기 클라이언트의 페이지 반복이 모든 리그를 순서대로 반환하는지 테스트"""
+
+    async def collect():
+        config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+        transport = httpx.MockTransport(_paged_leagues_handler(23, []))
+        async with AsyncSWCClient(config, transport=transport) as client:
+            return [league async for league in client.iter_leagues(page_size=5)]
+
+    leagues = asyncio.run(collect())
+    assert [league.league_id for league in leagues] == list(range(5001, 5024))
+
+
+def test_aiter_pages_cleans_up_prefetched_pages():
+    """중간에 반복을 멈추면 미리 요청한 페이지 태스크를 모두 정리하는지 테스트"""
+    started = []
+
+    async def fetch_page(skip, limit):
+        started.append(asyncio.current_task())
+        if skip:
+            await asyncio.sleep(0)
+            raise httpx.ConnectError("connection refused")
+        return list(range(limit))
+
+    async def first_page():
+        pages = aiter_pages(fetch_page, page_size=5, total=50)
+        async with contextlib.aclosing(pages):
+            async for page in pages:
+                break
+        # 제너레이터를 닫은 직후에는 미리 요청한 태스크가 모두 끝나 있어야 한다.
+        assert len(started) == 5
+        assert all(task.done() for task in started)
+        return page
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert asyncio.run(first_page()) == list(range(5))
+
+
+PLAYER_ROW = {
+    "player_id": 1001,
+    "gsis_id": "00-0023459",
+    "first_name": "Aaron",
+    "last_name": "Rodgers",
+    "position": "QB",
+    "last_changed_date": "2024-04-18",
+    "performances": [],
+}
+
+
+def _batch_players_handler(known_ids: set, requests: list):
+    """선수 일괄 조회 API를 흉내 낸다(없는 ID는 missing_ids로 반환)."""
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path != "/v0/players/batch/":
+            return httpx.Response(404, json={"detail": "선수를 찾을 수 없습니다"})
+        ids = [int(id) for id in request.url.params["ids"].split(",")]
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    dict(PLAYER_ROW, player_id=id) for id in ids if id in known_ids
+                ],
+                "missing_ids": [id for id in ids if id not in known_ids],
+            },
+        )
+
+    return handler
+
+
+def test_get_players_by_ids_keeps_input_order():
+    """여러 요청으로 나눈 일괄 조회 결과를 입력 순서대로 합치는지 테스트"""
+    requests = []
+    ids = [1005, 9999, 1001, 1003, 1005, 1002]
+    config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+    transport = httpx.MockTransport(
+        _batch_players_handler({1001, 1002, 1003, 1005}, requests)
+    )
+    with SWCClient(config, transport=transport) as client:
+        players = client.get_players_by_ids(ids, chunk_size=2)
+        # 중복을 뺀 5개 ID를 2개씩 나눠 3번 요청한다.
+        assert len(requests) == 3
+        assert [player.player_id if player else None for player in players] == [
+            1005,
+            None,
+            1001,
+            1003,
+            1005,
+            1002,
+        ]
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_player_by_id(1001)
+
+
+def test_async_get_players_by_ids_keeps_input_order():
+    """비동기 일괄 조회가 입력 순서대로 결과를 반환하는지 테스트"""
+    ids = list(range(1001, 1021))
+
+    async def fetch():
+        config = SWCConfig(swc_base_url=BASE_URL, backoff=False)
+        transport = httpx.MockTransport(_batch_players_handler(set(ids[::2]), []))
+        async with AsyncSWCClient(config, transport=transport) as client:
+            return await client.get_players_by_ids(list(reversed(ids)), chunk_size=3)
+
+    players = asyncio.run(fetch())
+    assert [player.player_id if player else None for player in players] == [
+        id if id in ids[::2] else None for id in reversed(ids)
+    ]
@@ -0,0 +1,179 @@
+"""선수 시즌 성적 집계
+
+week_number는 "YYYYWW" 형식(예: 202301)이므로 앞 네 자리를 시즌으로 사용한다.
+시즌 전체 집계는 player_season_summary 테이블에 미리 저장해 두고, 변경된 선수의 행만 다시 계산한다.
+performance·player 테이블의 트리거가 행이 바뀔 때마다 해당 선수를 player_season_summary_dirty에
+기록하며, API는 데이터가 바뀐 뒤 처음 요약을 읽을 때 기록된 선수만 다시 계산한다(main.get_summary_db).
+
+사용 예시:
+    python analytics.py           # 변경된 선수의 요약만 갱신
+    python analytics.py --full    # 요약 테이블 전체를 다시 생성
+"""
+
+import argparse
+import math
+
+from sqlalchemy import create_engine, delete, func, insert, select, text
+
+import models
+
+# 한 번에 다시 계산하는 선수 수
+REFRESH_BATCH_SIZE = 500
+
+
+def season_of(week_number: str) -> str:
+    return week_number[:4]
+
+
+def aggregate_performances(rows) -> list:
+    """
+    (player_id, position, week_number, fantasy_points, last_changed_date) 행을
+    (선수, 시즌)별 요약 딕셔너리로 집계한다. 행은 player_id, week_number 순서로 정렬되어 있어야 한다.
+    """
+    summaries = {}
+    for player_id, position, week_number, points, last_changed_date in rows:
+        key = (player_id, season_of(week_number))
+        summary = summaries.get(key)
+        if summary is None:
+            summary = summaries[key] = {
+                "player_id": player_id,
+                "season": key[1],
+                "position": position,
+                "games_played": 0,
+                "total_points": 0.0,
+                "sum_squares": 0.0,
+                "max_points": points,
+                "max_week_number": week_number,
+                "min_points": points,
+                "min_week_number": week_number,
+                "last_changed_date": last_changed_date,
+            }
+        summary["games_played"] += 1
+        summary["total_points"] += points
+        summary["sum_squares"] += points * points
+        # 동점이면 앞선 주차를 유지한다.
+        if points > summary["max_points"]:
+            summary["max_points"], summary["max_week_number"] = points, week_number
+        if points < summary["min_points"]:
+            summary["min_points"], summary["min_week_number"] = points, week_number
+        summary["last_changed_date"] = max(
+            summary["last_changed_date"], last_changed_date
+        )
+
+    for summary in summaries.values():
+        games = summary["games_played"]
+        average = summary["total_points"] / games
+        variance = summary.pop("sum_squares") / games - average * average
+        summary["average_points"] = average
+        # 모표준편차. 부동소수점 오차로 음수가 되는 경우를 막는다.
+        summary["stddev_points"] = math.sqrt(max(variance, 0.0))
+    return list(summaries.values())
+
+
+def select_performance_rows():
+    """집계에 필요한 퍼포먼스 행을 선수, 주차 순서로 읽는 SELECT 문"""
+    return (
+        select(
+            models.Performance.player_id,
+            models.Player.position,
+            models.Performance.week_number,
+            models.Performance.fantasy_points,
+            models.Performance.last_changed_date,
+        )
+        .join(models.Player, models.Player.player_id == models.Performance.player_id)
+        .order_by(models.Performance.player_id, models.Performance.week_number)
+    )
+
+
+def summary_trigger_statements() -> list:
+    """퍼포먼스·선수 행이 바뀔 때 영향을 받은 선수를 player_season_summary_dirty에 기록하는 트리거 DDL 목록"""
+    dirty = models.PlayerSeasonSummaryDirty.__tablename__
+
+    def mark(alias: str) -> str:
+        # 이미 기록된 선수는 REPLACE가 기존 행을 지우고 새 mark로 다시 기록한다.
+        return f"INSERT OR REPLACE INTO {dirty} (player_id) VALUES ({alias}.player_id)"
+
+    bodies = {
+        ("performance", "INSERT"): [mark("NEW")],
+        # 퍼포먼스가 다른 선수로 옮겨지면 이전 선수도 다시 계산한다.
+        ("performance", "UPDATE"): [mark("OLD"), mark("NEW")],
+        ("performance", "DELETE"): [mark("OLD")],
+        # 포지션이 바뀌거나 선수가 삭제되면 요약도 바뀐다.
+        ("player", "UPDATE"): [mark("OLD"), mark("NEW")],
+        ("player", "DELETE"): [mark("OLD")],
+    }
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {dirty}_{table}_{event.lower()} "
+        f"AFTER {event} ON {table} BEGIN {'; '.join(body)}; END"
+        for (table, event), body in bodies.items()
+    ]
+
+
+def install_summary_triggers(conn):
+    """시즌 요약 변경 기록 트리거를 설치한다. 이미 있으면 건너뛴다."""
+    for statement in summary_trigger_statements():
+        conn.execute(text(statement))
+
+
+def refresh_player_season_summary(conn, full: bool = False) -> int:
+    """
+    player_season_summary를 갱신하고 다시 계산한 선수 수를 반환한다.
+
+    트리거가 player_season_summary_dirty에 기록한 선수만 다시 계산한 뒤, 읽은 시점까지의 기록을 지운다.
+    변경일과 관계없이 트리거가 기록하므로 같은 날의 수정, 과거 날짜로 기록된 보정 행, 삭제도 빠지지 않는다.
+    요약 테이블이 비어 있거나 full이 True이면 전체를 다시 만든다.
+    """
+    summary = models.PlayerSeasonSummary.__table__
+    dirty = models.PlayerSeasonSummaryDirty.__table__
+    marks = conn.execute(select(dirty.c.mark, dirty.c.player_id)).all()
+    # 읽은 뒤에 기록된 변경(더 큰 mark)은 남겨 두어 다음 갱신에서 처리한다.
+    high_mark = max((mark for mark, _ in marks), default=0)
+
+    if full or conn.scalar(select(summary.c.player_id).limit(1)) is None:
+        # 전체 재생성: 퍼포먼스를 한 번 순회하며 모든 선수를 집계한다.
+        summaries = aggregate_performances(conn.execute(select_performance_rows()))
+        conn.execute(delete(summary))
+        if summaries:
+            conn.execute(insert(summary), summaries)
+        refreshed = len({row["player_id"] for row in summaries})
+    else:
+        player_ids = sorted({player_id for _, player_id in marks})
+        for start in range(0, len(player_ids), REFRESH_BATCH_SIZE):
+            batch = player_ids[start : start + REFRESH_BATCH_SIZE]
+            rows = conn.execute(
+                select_performance_rows().filter(
+                    models.Performance.player_id.in_(batch)
+                )
+            )
+            summaries = aggregate_performances(rows)
+            # 퍼포먼스가 모두 사라진 시즌의 요약도 함께 지워지도록 선수 단위로 교체한다.
+            conn.execute(delete(summary).filter(summary.c.player_id.in_(batch)))
+            if summaries:
+                conn.execute(insert(summary), summaries)
+        refreshed = len(player_ids)
+
+    if marks:
+        conn.execute(delete(dirty).filter(dirty.c.mark <= high_mark))
+    return refreshed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SWC 선수 시즌 요약 테이블 갱신")
+    parser.add_argument(
+        "--database",
+        default="./fantasy_data.db",
+        help="갱신할 SQLite 데이터베이스 파일 경로",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="요약 테이블 전체를 다시 생성"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{args.database}")
+    with engine.begin() as conn:
+        refreshed = refresh_player_season_summary(conn, full=args.full)
+    print(f"다시 계산한 선수 수: {refreshed}")
+
+
+if __name__ == "__main__":
+    main()
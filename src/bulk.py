@@ -0,0 +1,199 @@
+"""대용량(bulk) 데이터 파일 생성
+
+fantasy_data.db의 각 테이블을 Parquet, Arrow IPC, CSV 파일로 만들어 BULK_DIR에 저장한다.
+테이블마다 (행 수, change_log의 마지막 seq)를 버전으로 기록해 두고, 버전이 바뀐 테이블의
+파일만 다시 만든다.
+
+사용 예시:
+    python bulk.py            # 변경된 테이블의 파일만 다시 생성
+    python bulk.py --force    # 모든 파일을 다시 생성
+"""
+
+import argparse
+import json
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from sqlalchemy import Date, Float, Integer, func, select
+
+import config
+import models
+from database import engine, get_data_version
+
+# 파일 이름(확장자 제외)별 원본 테이블
+BULK_TABLES = {
+    "player_data": models.Player.__table__,
+    "league_data": models.League.__table__,
+    "performance_data": models.Performance.__table__,
+    "team_data": models.Team.__table__,
+    "team_player_data": models.TeamPlayer.__table__,
+}
+
+# 확장자별 응답 미디어 타입
+BULK_FORMATS = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 한 번에 읽어 레코드 배치로 변환하는 행 수
+BULK_BATCH_SIZE = 100_000
+
+MANIFEST_FILE = "manifest.json"
+
+_build_lock = threading.Lock()
+# 마지막으로 파일 최신 여부를 확인한 시점의 데이터 버전
+_checked_version = None
+
+
+def _arrow_type(column):
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    if isinstance(column.type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def arrow_schema(table) -> pa.Schema:
+    """SQLAlchemy 테이블 정의로 Arrow 스키마를 만든다."""
+    return pa.schema(
+        [pa.field(c.name, _arrow_type(c), nullable=c.nullable) for c in table.columns]
+    )
+
+
+def table_version(conn, table) -> list:
+    """
+    테이블의 (행 수, 마지막 변경 seq)를 파일 재생성 여부 판단용 버전으로 반환한다.
+
+    change_log.seq는 행이 추가·수정·삭제될 때마다 증가하므로(changes.py 참고),
+    일 단위인 last_changed_date와 달리 같은 날의 수정이나 행 수가 그대로인 삭제·추가도 버전을 바꾼다.
+    """
+    count = conn.scalar(select(func.count()).select_from(table))
+    last_seq = conn.scalar(
+        select(func.max(models.ChangeLog.seq)).where(
+            models.ChangeLog.table_name == table.name
+        )
+    )
+    return [count, last_seq]
+
+
+def _read_manifest() -> dict:
+    try:
+        with open(os.path.join(config.BULK_DIR, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest: dict):
+    path = os.path.join(config.BULK_DIR, MANIFEST_FILE)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def build_bulk_files(conn, name: str):
+    """
+    테이블 하나를 한 번 읽으면서 모든 형식의 파일을 함께 쓴다.
+
+    배치 단위로 기록하므로 테이블 전체를 메모리에 올리지 않으며,
+    임시 파일에 쓴 뒤 교체하므로 내려받는 중인 파일이 깨지지 않는다.
+    """
+    table = BULK_TABLES[name]
+    schema = arrow_schema(table)
+    paths = {
+        fmt: os.path.join(config.BULK_DIR, f"{name}.{fmt}") for fmt in BULK_FORMATS
+    }
+    tmp = {fmt: path + ".tmp" for fmt, path in paths.items()}
+
+    order = [c for c in table.primary_key.columns]
+    result = conn.execution_options(yield_per=BULK_BATCH_SIZE).execute(
+        select(table).order_by(*order)
+    )
+
+    with pq.ParquetWriter(tmp["parquet"], schema) as parquet_writer, pa.OSFile(
+        tmp["arrow"], "wb"
+    ) as arrow_sink, pa.ipc.new_file(
+        arrow_sink, schema
+    ) as arrow_writer, pa_csv.CSVWriter(
+        tmp["csv"], schema
+    ) as csv_writer:
+        for rows in result.partitions():
+            batch = pa.RecordBatch.from_arrays(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(zip(*rows), schema)
+                ],
+                schema=schema,
+            )
+            parquet_writer.write_batch(batch)
+            arrow_writer.write_batch(batch)
+            csv_writer.write_batch(batch)
+
+    for fmt, path in paths.items():
+        os.replace(tmp[fmt], path)
+
+
+def refresh_bulk_files(force: bool = False) -> list:
+    """버전이 바뀌었거나 파일이 없는 테이블의 파일을 다시 만들고, 다시 만든 이름 목록을 반환한다."""
+    os.makedirs(config.BULK_DIR, exist_ok=True)
+    rebuilt = []
+    with _build_lock, engine.connect() as conn:
+        manifest = _read_manifest()
+        for name, table in BULK_TABLES.items():
+            version = table_version(conn, table)
+            exists = all(
+                os.path.exists(os.path.join(config.BULK_DIR, f"{name}.{fmt}"))
+                for fmt in BULK_FORMATS
+            )
+            if force or not exists or manifest.get(name) != version:
+                build_bulk_files(conn, name)
+                manifest[name] = version
+                rebuilt.append(name)
+        if rebuilt:
+            _write_manifest(manifest)
+    return rebuilt
+
+
+def ensure_bulk_file(path: str):
+    """
+    데이터 버전이 마지막 확인 이후 바뀐 경우에만 테이블 버전을 확인해 파일을 갱신한다.
+
+    데이터가 그대로이고 파일이 있으면 쿼리 없이 바로 반환하므로, 요청마다 호출해도 부담이 없다.
+    """
+    global _checked_version
+    version = get_data_version()
+    if version == _checked_version and os.path.exists(path):
+        return
+    refresh_bulk_files()
+    _checked_version = version
+
+
+def bulk_file_path(file_name: str):
+    """요청한 파일 이름이 유효하면 (파일 경로, 미디어 타입)을, 아니면 None을 반환한다."""
+    name, _, fmt = file_name.rpartition(".")
+    if name not in BULK_TABLES or fmt not in BULK_FORMATS:
+        return None
+    return os.path.join(config.BULK_DIR, file_name), BULK_FORMATS[fmt]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SWC 대용량 데이터 파일 생성")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="변경 여부와 관계없이 모든 파일을 다시 생성",
+    )
+    args = parser.parse_args()
+
+    rebuilt = refresh_bulk_files(force=args.force)
+    print(f"다시 생성한 파일: {', '.join(rebuilt) if rebuilt else '없음'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""데이터 버전 기반 인메모리 캐시"""
+
+import threading
+
+
+class VersionedCache:
+    """
+    계산 결과를 데이터 버전과 함께 메모리에 보관하는 캐시
+
+    저장할 때의 데이터 버전과 현재 데이터 버전이 같으면 저장된 값을 그대로 반환하고,
+    다르면 값을 다시 계산한다. 데이터가 바뀌지 않는 동안 반복 요청은 데이터베이스를 거치지 않는다.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        """key에 대한 값이 version 기준으로 최신이면 반환하고, 아니면 None을 반환한다."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        return None
+
+    def set(self, key, version, value):
+        """값을 계산에 사용한 데이터 버전과 함께 저장한다."""
+        with self._lock:
+            self._entries[key] = (version, value)
+
+    def get_or_compute(self, key, version, compute):
+        """key에 대한 값이 version 기준으로 최신이면 반환하고, 아니면 compute()로 다시 계산한다."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        with self._lock:
+            # 다른 스레드가 먼저 계산을 마쳤다면 그 결과를 사용한다.
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            value = compute()
+            self._entries[key] = (version, value)
+            return value
+
+    def clear(self):
+        """저장된 값을 모두 비운다."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,90 @@
+"""변경 피드(changes feed)
+
+추적 대상 테이블(league, team, player, team_player, performance)에 SQLite 트리거를 달아
+행이 추가·수정·삭제될 때마다 change_log 테이블에 (테이블, 행 키, 작업)을 기록한다.
+last_changed_date는 일 단위라 같은 날 바뀐 행을 구분할 수 없지만, change_log.seq는 쓰기마다 증가하므로
+클라이언트는 마지막으로 받은 seq 이후의 변경만 정확히 받아 갈 수 있다.
+
+트리거 설치와 기존 행 채우기(backfill)는 migrate.upgrade가 실행한다.
+"""
+
+from sqlalchemy import text
+
+import models
+
+# 추적 대상 테이블 -> 기본 키 컬럼 이름(부모 테이블이 먼저 오도록 정렬)
+TRACKED_TABLES = {
+    table.name: tuple(column.name for column in table.primary_key)
+    for table in models.Base.metadata.sorted_tables
+    if table.name in ("league", "team", "player", "team_player", "performance")
+}
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+
+def _key_sql(table_name: str, alias: str) -> str:
+    """트리거 안에서 행 키 문자열을 만드는 SQL 식(예: NEW.team_id || ',' || NEW.player_id)"""
+    return " || ',' || ".join(
+        f"CAST({alias}.{column} AS TEXT)" for column in TRACKED_TABLES[table_name]
+    )
+
+
+def _record_sql(table_name: str, alias: str, operation: str) -> str:
+    # (테이블, 행 키)가 이미 있으면 REPLACE가 기존 행을 지우고 새 seq로 다시 기록한다.
+    return (
+        "INSERT OR REPLACE INTO change_log (table_name, row_key, operation) "
+        f"VALUES ('{table_name}', {_key_sql(table_name, alias)}, '{operation}')"
+    )
+
+
+def trigger_statements() -> list:
+    """추적 대상 테이블마다 INSERT/UPDATE/DELETE 후에 change_log를 기록하는 트리거 DDL 목록"""
+    statements = []
+    for table_name in TRACKED_TABLES:
+        old_key = _key_sql(table_name, "OLD")
+        new_key = _key_sql(table_name, "NEW")
+        bodies = {
+            "INSERT": _record_sql(table_name, "NEW", UPSERT),
+            # 기본 키 자체가 바뀌면 이전 키는 삭제로 기록한다.
+            "UPDATE": (
+                f"{_record_sql(table_name, 'NEW', UPSERT)}; "
+                "INSERT OR REPLACE INTO change_log (table_name, row_key, operation) "
+                f"SELECT '{table_name}', {old_key}, '{DELETE}' "
+                f"WHERE {old_key} <> {new_key}"
+            ),
+            "DELETE": _record_sql(table_name, "OLD", DELETE),
+        }
+        for event, body in bodies.items():
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS change_log_{table_name}_{event.lower()} "
+                f"AFTER {event} ON {table_name} BEGIN {body}; END"
+            )
+    return statements
+
+
+def install_change_log(conn) -> int:
+    """
+    트리거를 설치하고, change_log에 아직 없는 기존 행을 upsert로 채운 뒤 채운 행 수를 반환한다.
+    이미 기록된 행은 건너뛰므로 여러 번 실행해도 안전하다.
+    """
+    for statement in trigger_statements():
+        conn.execute(text(statement))
+    backfilled = 0
+    for table_name, columns in TRACKED_TABLES.items():
+        key = " || ',' || ".join(f"CAST({column} AS TEXT)" for column in columns)
+        result = conn.execute(
+            text(
+                "INSERT OR IGNORE INTO change_log (table_name, row_key, operation) "
+                f"SELECT '{table_name}', {key}, '{UPSERT}' FROM {table_name} "
+                f"ORDER BY {', '.join(columns)}"
+            )
+        )
+        backfilled += result.rowcount
+    return backfilled
+
+
+def parse_row_key(table_name: str, row_key: str) -> dict:
+    """change_log.row_key 문자열을 {기본 키 컬럼: 값} 딕셔너리로 되돌린다."""
+    columns = TRACKED_TABLES[table_name]
+    return dict(zip(columns, (int(value) for value in row_key.split(","))))
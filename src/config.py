@@ -0,0 +1,62 @@
+"""API 서버 설정
+
+운영 환경마다 달라지는 값을 한곳에 모아 둔다. 모든 값은 환경 변수로 재정의할 수 있다.
+"""
+
+import os
+
+# HTTP 캐시
+# - 클라이언트, CDN, 리버스 프록시가 응답을 재검증 없이 재사용할 수 있는 시간(초)
+CACHE_MAX_AGE = int(os.getenv("SWC_CACHE_MAX_AGE", "60"))
+
+# 대용량(bulk) 파일
+# - 서버가 생성한 Parquet / Arrow IPC / CSV 파일을 저장하는 디렉토리
+BULK_DIR = os.getenv("SWC_BULK_DIR", "./bulk")
+
+# 빠른 조회(fast read)
+# - 목록 엔드포인트에서 ORM 객체 생성과 Pydantic 검증을 건너뛰고 Core 조회 결과를 바로 인코딩
+FAST_READ = os.getenv("SWC_FAST_READ", "true").lower() == "true"
+
+# 응답 압축
+# - 본문이 이 크기(바이트) 이상일 때만 Accept-Encoding에 따라 zstd 또는 gzip으로 압축한다.
+COMPRESS_MIN_SIZE = int(os.getenv("SWC_COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("SWC_GZIP_LEVEL", "6"))
+ZSTD_LEVEL = int(os.getenv("SWC_ZSTD_LEVEL", "3"))
+
+# 계측(metrics)
+# - 실행 시간이 이 값(초) 이상인 SQL 문은 문장과 파라미터를 slow query 로그로 남긴다.
+SLOW_QUERY_SECONDS = float(os.getenv("SWC_SLOW_QUERY_SECONDS", "0.1"))
+
+# 요청 프로파일링
+# - true일 때만 프로파일링 미들웨어를 등록한다(false면 요청 처리 경로에 아무 코드도 추가되지 않음).
+PROFILING = os.getenv("SWC_PROFILING", "false").lower() == "true"
+# - 이 요청 헤더 값이 1 또는 true인 요청을 프로파일링한다.
+PROFILE_HEADER = os.getenv("SWC_PROFILE_HEADER", "X-Profile")
+# - 헤더와 관계없이 무작위로 프로파일링할 요청 비율(0.0 ~ 1.0)
+PROFILE_SAMPLE_RATE = float(os.getenv("SWC_PROFILE_SAMPLE_RATE", "0"))
+# - cprofile(함수별 통계, .prof) 또는 sample(스택 샘플링, 접힌 스택 .folded)
+PROFILE_MODE = os.getenv("SWC_PROFILE_MODE", "cprofile")
+# - sample 방식의 스택 수집 간격(초)
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("SWC_PROFILE_SAMPLE_INTERVAL", "0.001"))
+# - 프로파일 결과 파일을 저장하는 디렉토리
+PROFILE_DIR = os.getenv("SWC_PROFILE_DIR", "./profiles")
+# - PROFILE_DIR에 남길 최대 프로파일 파일 수. 넘으면 오래된 파일부터 지운다(0이면 제한 없음).
+PROFILE_MAX_FILES = int(os.getenv("SWC_PROFILE_MAX_FILES", "100"))
+# - true이면 프로파일링하는 동안 다른 요청을 멈춰 세워 결과에 해당 요청만 담기게 한다(그동안 지연 시간 증가).
+PROFILE_ISOLATE = os.getenv("SWC_PROFILE_ISOLATE", "false").lower() == "true"
+
+# 데이터베이스 엔진 프로필
+# - default : 데이터베이스 파일을 읽기/쓰기로 연다.
+# - readonly: 파일을 읽기 전용·불변(immutable)으로 열어 잠금과 변경 감지를 생략한다.
+# - memory  : 시작할 때 SQLite 백업 API로 파일 전체를 메모리로 복사해 메모리에서만 읽는다.
+DB_PROFILE = os.getenv("SWC_DB_PROFILE", "default")
+DB_PATH = os.getenv("SWC_DB_PATH", "./fantasy_data.db")
+# - true이면 서버가 시작할 때 migrate.upgrade로 인덱스, 변경 피드 트리거, 파생 테이블을 만든다.
+#   readonly 프로필은 파일을 바꿀 수 없으므로 미리 python migrate.py를 실행해 두어야 한다.
+AUTO_MIGRATE = os.getenv("SWC_AUTO_MIGRATE", "true").lower() == "true"
+# - 메모리 맵 I/O 크기(바이트). 0이면 사용하지 않는다.
+DB_MMAP_SIZE = int(os.getenv("SWC_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+# - 연결당 페이지 캐시 크기(KiB)
+DB_CACHE_SIZE_KIB = int(os.getenv("SWC_DB_CACHE_SIZE_KIB", str(64 * 1024)))
+# - 저널 모드(예: WAL). 지정하지 않으면 데이터베이스 파일의 설정을 그대로 사용한다.
+DB_JOURNAL_MODE = os.getenv("SWC_DB_JOURNAL_MODE")
@@ -0,0 +1,27 @@
+"""
+테스트 공통 설정
+
+저장소의 fantasy_data.db에는 원본 데이터만 들어 있으므로, 테스트 세션마다 임시 사본을 만들어
+migrate.upgrade로 인덱스·변경 피드·파생 테이블을 만든 뒤 그 사본으로 테스트한다.
+config가 데이터베이스 경로를 읽기 전에 환경 변수를 바꿔야 하므로 다른 모듈보다 먼저 실행된다.
+"""
+
+import os
+import shutil
+import tempfile
+
+_test_dir = tempfile.mkdtemp(prefix="swc-test-")
+TEST_DATABASE_PATH = os.path.join(_test_dir, "fantasy_data.db")
+shutil.copy(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fantasy_data.db"),
+    TEST_DATABASE_PATH,
+)
+os.environ["SWC_DB_PATH"] = TEST_DATABASE_PATH
+
+import migrate  # noqa: E402
+
+migrate.upgrade_file(TEST_DATABASE_PATH)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_test_dir, ignore_errors=True)
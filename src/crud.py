@@ -1,24 +1,64 @@
 """SQLAlchemy 쿼리 함수"""
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session, selectinload
+from collections.abc import Mapping
 from datetime import date
 
-import models
+import changes, models
+from analytics import aggregate_performances, select_performance_rows
 
+# 엔드포인트별 관계 로딩 전략
+# 응답 스키마가 중첩해서 직렬화하는 관계를 미리 일괄 로딩해, 행마다 SELECT가 추가로 실행되는
+# N+1 문제를 막는다. selectinload는 페이지 전체의 관계를 IN 쿼리 한 번으로 가져온다.
+PLAYER_LOAD_OPTIONS = (selectinload(models.Player.performances),)
+TEAM_LOAD_OPTIONS = (selectinload(models.Team.players),)
+LEAGUE_LOAD_OPTIONS = (selectinload(models.League.teams),)
 
-def get_player(db: Session, player_id: int):
-    return db.query(models.Player).filter(models.Player.player_id == player_id).first()
 
+def _paginate(
+    query,
+    id_column,
+    date_column,
+    skip: int,
+    limit: int,
+    min_last_changed_date: date = None,
+    after: tuple = None,
+):
+    """
+    정렬 순서를 고정하고 skip/limit 또는 keyset(after) 방식으로 페이지를 자른다.
 
-def get_players(
-    db: Session,
+    min_last_changed_date가 있으면 (last_changed_date, 기본 키), 없으면 기본 키 순서로 정렬한다.
+    after가 주어지면 해당 키 다음 행부터 읽으므로, 페이지가 깊어져도 앞쪽 행을 건너뛰는 비용이 없다.
+    """
+    order = (date_column, id_column) if min_last_changed_date else (id_column,)
+    if after is not None:
+        if len(order) == 1:
+            query = query.filter(id_column > after[0])
+        else:
+            query = query.filter(tuple_(*order) > tuple_(*after))
+    return query.order_by(*order).offset(skip).limit(limit)
+
+
+# 쿼리 구성 함수
+# 동기(crud)와 비동기(crud_async) 조회 함수가 같은 SELECT 문을 사용하도록 쿼리 구성을 분리한다.
+def select_player(player_id: int):
+    return (
+        select(models.Player)
+        .options(*PLAYER_LOAD_OPTIONS)
+        .filter(models.Player.player_id == player_id)
+    )
+
+
+def select_players(
     skip: int = 0,
     limit: int = 100,
     min_last_changed_date: date = None,
     last_name: str = None,
     first_name: str = None,
+    after: tuple = None,
 ):
-    query = db.query(models.Player)
+    query = select(models.Player).options(*PLAYER_LOAD_OPTIONS)
 
     if min_last_changed_date:
         query = query.filter(models.Player.last_changed_date >= min_last_changed_date)
@@ -26,73 +66,493 @@ def get_players(
         query = query.filter(models.Player.first_name == first_name)
     if last_name:
         query = query.filter(models.Player.last_name == last_name)
-    return query.offset(skip).limit(limit).all()
+    return _paginate(
+        query,
+        models.Player.player_id,
+        models.Player.last_changed_date,
+        skip,
+        limit,
+        min_last_changed_date,
+        after,
+    )
 
 
-def get_performances(
-    db: Session, skip: int = 0, limit: int = 100, min_last_changed_date: date = None
+def select_performances(
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    after: tuple = None,
 ):
-    query = db.query(models.Performance)
+    query = select(models.Performance)
     if min_last_changed_date:
         query = query.filter(
             models.Performance.last_changed_date >= min_last_changed_date
         )
-    return query.offset(skip).limit(limit).all()
+    return _paginate(
+        query,
+        models.Performance.performance_id,
+        models.Performance.last_changed_date,
+        skip,
+        limit,
+        min_last_changed_date,
+        after,
+    )
 
 
-def get_league(db: Session, league_id: int = None):
-    return db.query(models.League).filter(models.League.league_id == league_id).first()
+def select_league(league_id: int = None):
+    return (
+        select(models.League)
+        .options(*LEAGUE_LOAD_OPTIONS)
+        .filter(models.League.league_id == league_id)
+    )
 
 
-def get_leagues(
-    db: Session,
+def select_leagues(
     skip: int = 0,
     limit: int = 100,
     min_last_changed_date: date = None,
     league_name: str = None,
+    after: tuple = None,
 ):
-    query = db.query(models.League).options(joinedload(models.League.teams))
+    query = select(models.League).options(*LEAGUE_LOAD_OPTIONS)
     if min_last_changed_date:
         query = query.filter(models.League.last_changed_date >= min_last_changed_date)
     if league_name:
         query = query.filter(models.League.league_name == league_name)
-    return query.offset(skip).limit(limit).all()
+    return _paginate(
+        query,
+        models.League.league_id,
+        models.League.last_changed_date,
+        skip,
+        limit,
+        min_last_changed_date,
+        after,
+    )
 
 
-def get_teams(
-    db: Session,
+def select_teams(
     skip: int = 0,
     limit: int = 100,
     min_last_changed_date: date = None,
     team_name: str = None,
     league_id: int = None,
+    after: tuple = None,
 ):
-    query = db.query(models.Team)
+    query = select(models.Team).options(*TEAM_LOAD_OPTIONS)
     if min_last_changed_date:
         query = query.filter(models.Team.last_changed_date >= min_last_changed_date)
     if team_name:
         query = query.filter(models.Team.team_name == team_name)
     if league_id:
         query = query.filter(models.Team.league_id == league_id)
-    return query.offset(skip).limit(limit).all()
+    return _paginate(
+        query,
+        models.Team.team_id,
+        models.Team.last_changed_date,
+        skip,
+        limit,
+        min_last_changed_date,
+        after,
+    )
+
+
+# 여러 ID 일괄 조회(multi-get) 한 번에 받을 수 있는 최대 ID 수
+MAX_BATCH_IDS = 500
+
+
+def _select_by_ids(model, id_column, load_options, ids: list):
+    """ID 목록에 해당하는 행을 IN 쿼리 한 번으로 읽고, 관계는 load_options로 일괄 로딩한다."""
+    return (
+        select(model)
+        .options(*load_options)
+        .filter(id_column.in_(ids))
+        .order_by(id_column)
+    )
+
+
+def select_players_by_ids(ids: list):
+    return _select_by_ids(
+        models.Player, models.Player.player_id, PLAYER_LOAD_OPTIONS, ids
+    )
+
+
+def select_teams_by_ids(ids: list):
+    return _select_by_ids(models.Team, models.Team.team_id, TEAM_LOAD_OPTIONS, ids)
+
+
+def select_leagues_by_ids(ids: list):
+    return _select_by_ids(
+        models.League, models.League.league_id, LEAGUE_LOAD_OPTIONS, ids
+    )
+
+
+def order_by_ids(rows, ids: list, id_attr: str) -> dict:
+    """
+    조회 결과를 요청한 ID 순서로 다시 정렬하고, 찾지 못한 ID를 함께 반환한다.
+
+    행은 ORM 객체 또는 딕셔너리(빠른 조회 경로)일 수 있다.
+    """
+    by_id = {
+        (row[id_attr] if isinstance(row, Mapping) else getattr(row, id_attr)): row
+        for row in rows
+    }
+    return {
+        "items": [by_id[id] for id in ids if id in by_id],
+        "missing_ids": [id for id in ids if id not in by_id],
+    }
+
+
+def select_count(model):
+    return select(func.count()).select_from(model)
+
+
+def select_counts():
+    """리그·팀·선수·퍼포먼스 개수를 한 번에 집계하는 SELECT 문"""
+    return select(
+        select_count(models.League).scalar_subquery().label("league_count"),
+        select_count(models.Team).scalar_subquery().label("team_count"),
+        select_count(models.Player).scalar_subquery().label("player_count"),
+        select_count(models.Performance).scalar_subquery().label("performace_count"),
+    )
+
+
+def select_player_season_stats(
+    skip: int = 0,
+    limit: int = 100,
+    season: str = None,
+    position: str = None,
+):
+    """요약 테이블에서 시즌 누적 점수 내림차순으로 선수 시즌 성적을 읽는 SELECT 문"""
+    summary = models.PlayerSeasonSummary
+    query = select(summary)
+    if season:
+        query = query.filter(summary.season == season)
+    if position:
+        query = query.filter(summary.position == position)
+    return (
+        query.order_by(summary.total_points.desc(), summary.player_id)
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+def select_week_range_performances(
+    season: str = None,
+    position: str = None,
+    min_week_number: str = None,
+    max_week_number: str = None,
+):
+    """주차 범위 집계에 필요한 퍼포먼스 행을 읽는 SELECT 문"""
+    query = select_performance_rows()
+    if season:
+        query = query.filter(
+            models.Performance.week_number.between(f"{season}00", f"{season}99")
+        )
+    if position:
+        query = query.filter(models.Player.position == position)
+    if min_week_number:
+        query = query.filter(models.Performance.week_number >= min_week_number)
+    if max_week_number:
+        query = query.filter(models.Performance.week_number <= max_week_number)
+    return query
+
+
+def rank_season_stats(summaries: list, skip: int, limit: int) -> list:
+    """집계 결과를 요약 테이블 조회와 같은 순서(누적 점수 내림차순)로 정렬해 페이지를 자른다."""
+    summaries.sort(key=lambda row: (-row["total_points"], row["player_id"]))
+    return summaries[skip : skip + limit]
+
+
+# 리더보드 조회 컬럼(순위는 조회 결과 순서로 매긴다)
+LEADERBOARD_PLAYER_COLUMNS = (
+    models.Player.player_id,
+    models.Player.first_name,
+    models.Player.last_name,
+    models.Player.position,
+)
+
+
+def select_weekly_leaderboard(week_number: str, position: str = None, k: int = 25):
+    """
+    주차별 판타지 포인트 상위 k명을 읽는 SELECT 문
+
+    (week_number, fantasy_points 내림차순, performance_id) 인덱스를 순서대로 읽다가 k행을 채우면 멈추므로,
+    조회 비용은 테이블 크기가 아니라 k(와 포지션 필터의 선택도)에 비례한다.
+    """
+    query = (
+        select(
+            *LEADERBOARD_PLAYER_COLUMNS,
+            models.Performance.fantasy_points,
+        )
+        .join(models.Player, models.Player.player_id == models.Performance.player_id)
+        .filter(models.Performance.week_number == week_number)
+    )
+    if position:
+        query = query.filter(models.Player.position == position)
+    return query.order_by(
+        models.Performance.fantasy_points.desc(), models.Performance.performance_id
+    ).limit(k)
+
+
+def select_latest_season():
+    return select(func.max(models.PlayerSeasonSummary.season))
+
+
+def select_season_leaderboard(season, position: str = None, k: int = 25):
+    """
+    시즌 누적 판타지 포인트 상위 k명을 요약 테이블에서 읽는 SELECT 문
+
+    season에는 시즌 문자열이나 select_latest_season() 같은 스칼라 서브쿼리를 넘길 수 있다.
+    (season[, position], total_points 내림차순, player_id) 인덱스 순서대로 k행만 읽는다.
+    """
+    summary = models.PlayerSeasonSummary
+    query = (
+        select(
+            *LEADERBOARD_PLAYER_COLUMNS,
+            summary.total_points.label("fantasy_points"),
+        )
+        .join(models.Player, models.Player.player_id == summary.player_id)
+        .filter(summary.season == season)
+    )
+    if position:
+        query = query.filter(summary.position == position)
+    return query.order_by(summary.total_points.desc(), summary.player_id).limit(k)
+
+
+def select_leaderboard(
+    week_number: str = None, season: str = None, position: str = None, k: int = 25
+):
+    """주차가 있으면 주간 리더보드, 없으면 시즌(기본값: 최신 시즌) 리더보드 SELECT 문"""
+    if week_number:
+        return select_weekly_leaderboard(week_number, position, k)
+    if not season:
+        season = select_latest_season().scalar_subquery()
+    return select_season_leaderboard(season, position, k)
+
+
+def rank_rows(rows) -> list:
+    """점수 순으로 정렬된 행에 1부터 순위를 붙인다."""
+    return [{"rank": rank, **row._mapping} for rank, row in enumerate(rows, start=1)]
+
+
+# 변경 피드 한 번에 반환할 수 있는 최대 변경 수
+MAX_CHANGES = 1000
+
+
+def select_changes(after_seq: int, limit: int):
+    """seq가 after_seq보다 큰 변경 기록을 seq 순서로 limit개 읽는 SELECT 문"""
+    return (
+        select(
+            models.ChangeLog.seq,
+            models.ChangeLog.table_name,
+            models.ChangeLog.row_key,
+            models.ChangeLog.operation,
+        )
+        .filter(models.ChangeLog.seq > after_seq)
+        .order_by(models.ChangeLog.seq)
+        .limit(limit)
+    )
+
+
+def select_changed_rows(table_name: str, keys: list):
+    """기본 키 튜플 목록에 해당하는 행의 현재 상태를 IN 쿼리 한 번으로 읽는 SELECT 문"""
+    table = models.Base.metadata.tables[table_name]
+    key_columns = [table.c[name] for name in changes.TRACKED_TABLES[table_name]]
+    if len(key_columns) == 1:
+        condition = key_columns[0].in_([key[0] for key in keys])
+    else:
+        condition = tuple_(*key_columns).in_(keys)
+    return select(table).filter(condition)
+
+
+def changed_keys(entries: list) -> dict:
+    """변경 기록에서 현재 상태를 읽어야 하는(upsert) 행의 기본 키를 테이블별로 모은다."""
+    keys = {}
+    for entry in entries:
+        if entry.operation == changes.UPSERT:
+            key = changes.parse_row_key(entry.table_name, entry.row_key)
+            keys.setdefault(entry.table_name, []).append(tuple(key.values()))
+    return keys
+
+
+def key_of(table_name: str, row: Mapping) -> tuple:
+    return tuple(row[name] for name in changes.TRACKED_TABLES[table_name])
+
+
+def build_changes(entries: list, rows: dict, after_seq: int, limit: int) -> dict:
+    """
+    변경 기록과 테이블별 현재 행({테이블: {기본 키 튜플: 행}})으로 변경 피드 응답을 만든다.
+
+    entries는 limit보다 하나 더 읽은 결과이며, 넘친 행이 있으면 다음 배치가 있다는 뜻이다.
+    upsert 기록의 행이 그 사이 삭제됐다면 delete로 전달한다(삭제 기록이 뒤에 다시 전달되더라도
+    클라이언트는 같은 삭제를 한 번 더 적용할 뿐이다).
+    """
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    items = []
+    for entry in entries:
+        key = changes.parse_row_key(entry.table_name, entry.row_key)
+        data = None
+        if entry.operation == changes.UPSERT:
+            data = rows.get(entry.table_name, {}).get(tuple(key.values()))
+        items.append(
+            {
+                "seq": entry.seq,
+                "table_name": entry.table_name,
+                "operation": changes.UPSERT if data is not None else changes.DELETE,
+                "key": key,
+                "data": data,
+            }
+        )
+    return {
+        "changes": items,
+        "last_seq": entries[-1].seq if entries else after_seq,
+        "has_more": has_more,
+    }
+
+
+def get_player(db: Session, player_id: int):
+    return db.scalars(select_player(player_id)).first()
+
+
+def get_players(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    last_name: str = None,
+    first_name: str = None,
+    after: tuple = None,
+):
+    query = select_players(
+        skip, limit, min_last_changed_date, last_name, first_name, after
+    )
+    return db.scalars(query).all()
+
+
+def get_performances(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    after: tuple = None,
+):
+    query = select_performances(skip, limit, min_last_changed_date, after)
+    return db.scalars(query).all()
+
+
+def get_league(db: Session, league_id: int = None):
+    return db.scalars(select_league(league_id)).first()
+
+
+def get_leagues(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    league_name: str = None,
+    after: tuple = None,
+):
+    query = select_leagues(skip, limit, min_last_changed_date, league_name, after)
+    return db.scalars(query).all()
+
+
+def get_teams(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    team_name: str = None,
+    league_id: int = None,
+    after: tuple = None,
+):
+    query = select_teams(
+        skip, limit, min_last_changed_date, team_name, league_id, after
+    )
+    return db.scalars(query).all()
+
+
+def get_players_by_ids(db: Session, ids: list):
+    """ID 목록의 선수를 요청 순서대로 반환한다."""
+    players = db.scalars(select_players_by_ids(ids)).all()
+    return order_by_ids(players, ids, "player_id")
+
+
+def get_teams_by_ids(db: Session, ids: list):
+    """ID 목록의 팀을 요청 순서대로 반환한다."""
+    teams = db.scalars(select_teams_by_ids(ids)).all()
+    return order_by_ids(teams, ids, "team_id")
+
+
+def get_leagues_by_ids(db: Session, ids: list):
+    """ID 목록의 리그를 요청 순서대로 반환한다."""
+    leagues = db.scalars(select_leagues_by_ids(ids)).all()
+    return order_by_ids(leagues, ids, "league_id")
 
 
 # 분석 쿼리
 def get_player_count(db: Session):
-    query = db.query(models.Player)
-    return query.count()
+    return db.scalar(select_count(models.Player))
 
 
 def get_team_count(db: Session):
-    query = db.query(models.Team)
-    return query.count()
+    return db.scalar(select_count(models.Team))
 
 
 def get_league_count(db: Session):
-    query = db.query(models.League)
-    return query.count()
+    return db.scalar(select_count(models.League))
 
 
 def get_performance_count(db: Session):
-    query = db.query(models.Performance)
-    return query.count()
+    return db.scalar(select_count(models.Performance))
+
+
+def get_counts(db: Session):
+    """리그·팀·선수·퍼포먼스 개수를 한 번의 쿼리로 집계한다."""
+    return db.execute(select_counts()).one()
+
+
+def get_player_season_stats(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    season: str = None,
+    position: str = None,
+    min_week_number: str = None,
+    max_week_number: str = None,
+):
+    """
+    선수 시즌 성적을 누적 점수 내림차순으로 반환한다.
+
+    주차 범위가 없으면 요약 테이블을 그대로 읽고,
+    주차 범위가 있으면 해당 주차의 퍼포먼스만 읽어 집계한다.
+    """
+    if not (min_week_number or max_week_number):
+        query = select_player_season_stats(skip, limit, season, position)
+        return db.scalars(query).all()
+    query = select_week_range_performances(
+        season, position, min_week_number, max_week_number
+    )
+    return rank_season_stats(aggregate_performances(db.execute(query)), skip, limit)
+
+
+def get_leaderboard(
+    db: Session,
+    week_number: str = None,
+    season: str = None,
+    position: str = None,
+    k: int = 25,
+):
+    """판타지 포인트 상위 k명을 순위와 함께 반환한다."""
+    return rank_rows(db.execute(select_leaderboard(week_number, season, position, k)))
+
+
+# 변경 피드
+def get_changes(db: Session, after_seq: int = 0, limit: int = 500) -> dict:
+    """seq가 after_seq보다 큰 변경을 최대 limit개, 바뀐 행의 현재 상태와 함께 반환한다."""
+    entries = db.execute(select_changes(after_seq, limit + 1)).all()
+    rows = {}
+    for table_name, keys in changed_keys(entries[:limit]).items():
+        result = db.execute(select_changed_rows(table_name, keys)).mappings()
+        rows[table_name] = {key_of(table_name, row): dict(row) for row in result}
+    return build_changes(entries, rows, after_seq, limit)
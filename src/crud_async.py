@@ -0,0 +1,184 @@
+"""SQLAlchemy 비동기 쿼리 함수
+
+crud 모듈의 함수와 이름과 인자가 같으며, AsyncSession을 받아 이벤트 루프를 막지 않고 조회한다.
+SELECT 문은 crud 모듈의 쿼리 구성 함수를 그대로 사용한다.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+
+import models
+from analytics import aggregate_performances
+from crud import (
+    build_changes,
+    changed_keys,
+    key_of,
+    order_by_ids,
+    rank_rows,
+    rank_season_stats,
+    select_changed_rows,
+    select_changes,
+    select_count,
+    select_counts,
+    select_league,
+    select_leaderboard,
+    select_leagues,
+    select_leagues_by_ids,
+    select_performances,
+    select_player,
+    select_player_season_stats,
+    select_players,
+    select_players_by_ids,
+    select_teams,
+    select_teams_by_ids,
+    select_week_range_performances,
+)
+
+
+async def get_player(db: AsyncSession, player_id: int):
+    return (await db.scalars(select_player(player_id))).first()
+
+
+async def get_players(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    last_name: str = None,
+    first_name: str = None,
+    after: tuple = None,
+):
+    query = select_players(
+        skip, limit, min_last_changed_date, last_name, first_name, after
+    )
+    return (await db.scalars(query)).all()
+
+
+async def get_performances(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    after: tuple = None,
+):
+    query = select_performances(skip, limit, min_last_changed_date, after)
+    return (await db.scalars(query)).all()
+
+
+async def get_league(db: AsyncSession, league_id: int = None):
+    return (await db.scalars(select_league(league_id))).first()
+
+
+async def get_leagues(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    league_name: str = None,
+    after: tuple = None,
+):
+    query = select_leagues(skip, limit, min_last_changed_date, league_name, after)
+    return (await db.scalars(query)).all()
+
+
+async def get_teams(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    min_last_changed_date: date = None,
+    team_name: str = None,
+    league_id: int = None,
+    after: tuple = None,
+):
+    query = select_teams(
+        skip, limit, min_last_changed_date, team_name, league_id, after
+    )
+    return (await db.scalars(query)).all()
+
+
+async def get_players_by_ids(db: AsyncSession, ids: list):
+    """ID 목록의 선수를 요청 순서대로 반환한다."""
+    players = (await db.scalars(select_players_by_ids(ids))).all()
+    return order_by_ids(players, ids, "player_id")
+
+
+async def get_teams_by_ids(db: AsyncSession, ids: list):
+    """ID 목록의 팀을 요청 순서대로 반환한다."""
+    teams = (await db.scalars(select_teams_by_ids(ids))).all()
+    return order_by_ids(teams, ids, "team_id")
+
+
+async def get_leagues_by_ids(db: AsyncSession, ids: list):
+    """ID 목록의 리그를 요청 순서대로 반환한다."""
+    leagues = (await db.scalars(select_leagues_by_ids(ids))).all()
+    return order_by_ids(leagues, ids, "league_id")
+
+
+# 분석 쿼리
+async def get_player_count(db: AsyncSession):
+    return await db.scalar(select_count(models.Player))
+
+
+async def get_team_count(db: AsyncSession):
+    return await db.scalar(select_count(models.Team))
+
+
+async def get_league_count(db: AsyncSession):
+    return await db.scalar(select_count(models.League))
+
+
+async def get_performance_count(db: AsyncSession):
+    return await db.scalar(select_count(models.Performance))
+
+
+async def get_counts(db: AsyncSession):
+    """리그·팀·선수·퍼포먼스 개수를 한 번의 쿼리로 집계한다."""
+    return (await db.execute(select_counts())).one()
+
+
+async def get_player_season_stats(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    season: str = None,
+    position: str = None,
+    min_week_number: str = None,
+    max_week_number: str = None,
+):
+    """
+    선수 시즌 성적을 누적 점수 내림차순으로 반환한다.
+
+    주차 범위가 없으면 요약 테이블을 그대로 읽고,
+    주차 범위가 있으면 해당 주차의 퍼포먼스만 읽어 집계한다.
+    """
+    if not (min_week_number or max_week_number):
+        query = select_player_season_stats(skip, limit, season, position)
+        return (await db.scalars(query)).all()
+    query = select_week_range_performances(
+        season, position, min_week_number, max_week_number
+    )
+    rows = await db.execute(query)
+    return rank_season_stats(aggregate_performances(rows), skip, limit)
+
+
+async def get_leaderboard(
+    db: AsyncSession,
+    week_number: str = None,
+    season: str = None,
+    position: str = None,
+    k: int = 25,
+):
+    """판타지 포인트 상위 k명을 순위와 함께 반환한다."""
+    rows = await db.execute(select_leaderboard(week_number, season, position, k))
+    return rank_rows(rows)
+
+
+# 변경 피드
+async def get_changes(db: AsyncSession, after_seq: int = 0, limit: int = 500) -> dict:
+    """seq가 after_seq보다 큰 변경을 최대 limit개, 바뀐 행의 현재 상태와 함께 반환한다."""
+    entries = (await db.execute(select_changes(after_seq, limit + 1))).all()
+    rows = {}
+    for table_name, keys in changed_keys(entries[:limit]).items():
+        result = (await db.execute(select_changed_rows(table_name, keys))).mappings()
+        rows[table_name] = {key_of(table_name, row): dict(row) for row in result}
+    return build_changes(entries, rows, after_seq, limit)
@@ -3,14 +3,162 @@
 # SQLAlchemy 전체를 한 번에 가져올 수도 있지만, 여러 라이브러리 간 중복 함수로 인해 발생할 수 있는
 # 충돌을 방지하기 위해 필요한 함수만 명시적으로 가져오는 것이 권장된다.
 
-from sqlalchemy import create_engine
+import os
+import sqlite3
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./fantasy_data.db"
+import config, metrics
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+DB_PROFILES = ("default", "readonly", "memory")
+
+# memory 프로필에서 모든 연결이 공유하는 인메모리 데이터베이스 이름
+MEMORY_DATABASE_NAME = "swc_memory"
+
+# 데이터 버전 표식을 만들 때 확인하는 데이터베이스 파일 경로
+DATABASE_PATH = config.DB_PATH
+
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+
+
+def _file_signature() -> tuple:
+    signature = []
+    for path in (DATABASE_PATH, DATABASE_PATH + "-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def database_url(profile: str, driver: str = "sqlite") -> str:
+    """엔진 프로필에 맞는 SQLAlchemy 연결 URL을 만든다."""
+    if profile not in DB_PROFILES:
+        raise ValueError(f"알 수 없는 데이터베이스 프로필: {profile}")
+    if profile == "readonly":
+        # immutable=1: 파일이 바뀌지 않는다고 보고 잠금과 변경 감지를 모두 생략한다.
+        return f"{driver}:///file:{DATABASE_PATH}?mode=ro&immutable=1&uri=true"
+    if profile == "memory":
+        # cache=shared: 같은 프로세스의 모든 연결이 하나의 인메모리 데이터베이스를 공유한다.
+        return (
+            f"{driver}:///file:{MEMORY_DATABASE_NAME}?mode=memory&cache=shared&uri=true"
+        )
+    return f"{driver}:///{DATABASE_PATH}"
+
+
+def connection_pragmas(profile: str) -> list:
+    """새 연결마다 실행할 PRAGMA 목록"""
+    pragmas = [f"PRAGMA cache_size = -{config.DB_CACHE_SIZE_KIB}"]
+    if profile != "memory":
+        pragmas.append(f"PRAGMA mmap_size = {config.DB_MMAP_SIZE}")
+    if profile == "default" and config.DB_JOURNAL_MODE:
+        pragmas.append(f"PRAGMA journal_mode = {config.DB_JOURNAL_MODE}")
+    if profile != "default":
+        # API는 쓰기를 하지 않으므로, 실수로 쓰기가 실행되면 오류를 낸다.
+        pragmas.append("PRAGMA query_only = ON")
+    return pragmas
+
+
+def apply_pragmas(engine, profile: str):
+    """엔진이 새 DBAPI 연결을 만들 때마다 프로필의 PRAGMA를 적용한다."""
+    pragmas = connection_pragmas(profile)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+# memory 프로필에서 인메모리 데이터베이스를 유지하는 연결
+# 공유 캐시 인메모리 데이터베이스는 마지막 연결이 닫히면 사라지므로, 프로세스가 끝날 때까지 열어 둔다.
+_memory_keeper = None
+_memory_version = None
+
+
+def load_into_memory():
+    """SQLite 백업 API로 데이터베이스 파일 전체를 공유 인메모리 데이터베이스에 복사한다."""
+    global _memory_keeper
+    if _memory_keeper is not None:
+        return
+    _memory_keeper = sqlite3.connect(
+        f"file:{MEMORY_DATABASE_NAME}?mode=memory&cache=shared",
+        uri=True,
+        check_same_thread=False,
+    )
+    reload_into_memory()
+
+
+def reload_into_memory():
+    """파일이 바뀐 뒤(예: 시작할 때의 마이그레이션) 인메모리 데이터베이스를 파일 내용으로 다시 채운다."""
+    global _memory_version
+    if _memory_keeper is None:
+        return
+    source = sqlite3.connect(f"file:{DATABASE_PATH}?mode=ro", uri=True)
+    try:
+        _memory_version = _file_signature()
+        source.backup(_memory_keeper)
+    finally:
+        source.close()
+
+
+def create_profile_engine(profile: str):
+    """프로필에 맞는 동기 엔진을 만든다."""
+    if profile == "memory":
+        load_into_memory()
+    # 인메모리 URL도 파일과 같이 연결 풀을 사용해, 여러 연결이 동시에 읽을 수 있게 한다.
+    engine = create_engine(
+        database_url(profile),
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+    )
+    apply_pragmas(engine, profile)
+    metrics.instrument_engine(engine)
+    return engine
+
+
+def create_async_profile_engine(profile: str):
+    """프로필에 맞는 비동기 엔진을 만든다."""
+    if profile == "memory":
+        load_into_memory()
+    engine = create_async_engine(
+        database_url(profile, "sqlite+aiosqlite"), poolclass=AsyncAdaptedQueuePool
+    )
+    # 비동기 엔진의 연결 이벤트는 내부 동기 엔진(sync_engine)에 등록한다.
+    apply_pragmas(engine.sync_engine, profile)
+    metrics.instrument_engine(engine.sync_engine)
+    return engine
+
+
+engine = create_profile_engine(config.DB_PROFILE)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# API 요청 처리에 사용하는 비동기 엔진
+# aiosqlite가 SQLite 호출을 별도 스레드에서 수행하므로, 쿼리를 기다리는 동안 이벤트 루프가
+# 다른 요청을 처리할 수 있다. 세션이 닫힌 뒤에도 응답 직렬화가 가능하도록 커밋 시 만료하지 않는다.
+async_engine = create_async_profile_engine(config.DB_PROFILE)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def get_data_version() -> tuple:
+    """
+    데이터베이스 파일과 WAL 파일의 수정 시각·크기로 만든 데이터 버전 표식을 반환한다.
+
+    SQLite는 커밋할 때마다 두 파일 중 하나를 반드시 갱신하므로, 표식이 같으면 데이터도 같다고 볼 수 있다.
+    쿼리 없이 파일 상태만 확인하므로 매 요청마다 호출해도 비용이 거의 없다.
+    memory 프로필에서는 메모리로 복사한 시점의 표식을 그대로 사용한다.
+    """
+    if _memory_version is not None:
+        return _memory_version
+    return _file_signature()
+
+
 Base = declarative_base()
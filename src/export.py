@@ -0,0 +1,67 @@
+"""대용량 스트리밍 내보내기(NDJSON / CSV)
+
+테이블 전체를 한 번에 메모리에 올리지 않고, 서버 측 커서에서 EXPORT_BATCH_SIZE 행씩 읽어
+곧바로 응답 본문으로 흘려보낸다. 첫 배치를 읽는 즉시 전송이 시작된다.
+"""
+
+import csv
+import io
+from datetime import date
+
+import orjson
+from sqlalchemy import select
+
+from database import AsyncSessionLocal
+from fast_read import PERFORMANCE_COLUMNS, PLAYER_COLUMNS
+
+# 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+# 내보내기 형식별 응답 미디어 타입
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 내보내기 대상별 컬럼(응답 스키마의 필드 순서와 같음)
+EXPORT_COLUMNS = {
+    "performances": PERFORMANCE_COLUMNS,
+    "players": PLAYER_COLUMNS,
+}
+
+
+def select_export(resource: str, min_last_changed_date: date = None):
+    """내보내기 대상 테이블을 기본 키 순서로 읽는 SELECT 문"""
+    columns = EXPORT_COLUMNS[resource]
+    table = columns[0].table
+    query = select(*columns)
+    if min_last_changed_date:
+        query = query.filter(table.c.last_changed_date >= min_last_changed_date)
+    return query.order_by(columns[0])
+
+
+def _encode_ndjson(keys, rows) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(keys, row))) + b"\n" for row in rows)
+
+
+def _encode_csv(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+async def stream_export(resource: str, fmt: str, min_last_changed_date: date = None):
+    """
+    내보내기 데이터를 배치 단위로 인코딩해 생성하는 비동기 제너레이터
+
+    응답이 전송되는 동안 세션이 유지되어야 하므로, 요청 종속성 대신 자체 세션을 연다.
+    """
+    keys = [column.key for column in EXPORT_COLUMNS[resource]]
+    if fmt == "csv":
+        yield _encode_csv([keys])
+
+    async with AsyncSessionLocal() as db:
+        query = select_export(resource, min_last_changed_date)
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield _encode_csv(rows) if fmt == "csv" else _encode_ndjson(keys, rows)
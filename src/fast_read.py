@@ -0,0 +1,209 @@
+"""목록 엔드포인트용 빠른 조회(fast read) 경로
+
+ORM 객체를 만들지 않고 SQLAlchemy Core로 필요한 컬럼만 튜플로 읽은 뒤,
+중첩 구조(선수 → 퍼포먼스, 팀 → 선수, 리그 → 팀)를 한 번의 그룹화로 조립해 orjson으로 바로 인코딩한다.
+컬럼 순서와 중첩 순서는 응답 스키마(schemas.py) 및 ORM 관계 정렬과 같으므로,
+응답 본문은 ORM + response_model 경로와 바이트 단위로 동일하다.
+
+읽을 컬럼과 펼칠 관계를 인자로 받으므로, fields/expand 파라미터로 응답 모양을 줄인 요청도
+이 경로에서 처리한다. 요청하지 않은 관계는 조회 자체를 하지 않는다.
+"""
+
+from collections import defaultdict
+
+import orjson
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+
+# 응답 스키마의 필드 순서를 따르는 조회 컬럼
+PERFORMANCE_COLUMNS = (
+    models.Performance.performance_id,
+    models.Performance.player_id,
+    models.Performance.week_number,
+    models.Performance.fantasy_points,
+    models.Performance.last_changed_date,
+)
+PLAYER_COLUMNS = (
+    models.Player.player_id,
+    models.Player.gsis_id,
+    models.Player.first_name,
+    models.Player.last_name,
+    models.Player.position,
+    models.Player.last_changed_date,
+)
+TEAM_COLUMNS = (
+    models.Team.league_id,
+    models.Team.team_id,
+    models.Team.team_name,
+    models.Team.last_changed_date,
+)
+LEAGUE_COLUMNS = (
+    models.League.league_id,
+    models.League.league_name,
+    models.League.scoring_type,
+    models.League.last_changed_date,
+)
+
+# 리소스별로 expand 파라미터로 펼칠 수 있는 관계(기본값은 모두 펼침)
+PLAYER_RELATIONSHIPS = ("performances",)
+TEAM_RELATIONSHIPS = ("players",)
+LEAGUE_RELATIONSHIPS = ("teams",)
+
+# 중첩 관계를 조회할 때 IN 절 하나에 넣는 최대 ID 수(selectinload와 같은 값)
+IN_BATCH_SIZE = 500
+
+
+def _keys(columns) -> list:
+    return [column.key for column in columns]
+
+
+def _names(value: str) -> set:
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def select_fieldset(
+    columns, relationships: tuple, fields: str = None, expand: str = None, required=()
+) -> tuple:
+    """
+    fields/expand 파라미터(쉼표 구분)를 읽을 컬럼과 펼칠 관계로 변환한다.
+
+    - fields가 None이면 모든 컬럼을, 아니면 지정한 컬럼만 스키마 순서대로 읽는다.
+      fields에 관계 이름을 넣으면 그 관계를 펼친 것으로 본다.
+    - expand가 None이면 fields가 없을 때는 모든 관계를, 있을 때는 fields에 든 관계만 펼친다.
+      빈 문자열이면 아무 관계도 펼치지 않는다.
+    - required 컬럼(커서·관계 연결에 필요한 키)은 요청하지 않아도 함께 읽고, 응답에서 뺄 키로 돌려준다.
+
+    fields가 비어 있거나(쉼표뿐인 경우 포함) 알 수 없는 필드나 관계가 있으면 ValueError를 발생시킨다.
+    반환값: (읽을 컬럼, 펼칠 관계, 응답에서 뺄 키 집합)
+    """
+    names = _names(fields) if fields is not None else None
+    expand_names = _names(expand) if expand is not None else None
+
+    if names is not None:
+        if not names:
+            raise ValueError("선택한 필드가 없음")
+        unknown = names - set(_keys(columns)) - set(relationships)
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+    if expand_names is not None:
+        unknown = expand_names - set(relationships)
+        if unknown:
+            raise ValueError(f"펼칠 수 없는 관계: {', '.join(sorted(unknown))}")
+
+    if expand_names is None:
+        expand_names = set(relationships) if names is None else names
+    expanded = tuple(name for name in relationships if name in expand_names)
+
+    if names is None:
+        return columns, expanded, set()
+    selected = tuple(
+        column for column in columns if column.key in names or column.key in required
+    )
+    return selected, expanded, set(_keys(selected)) - names
+
+
+def drop_fields(rows: list, keys: set) -> list:
+    """행 딕셔너리에서 요청하지 않은 키를 제거한다."""
+    if keys:
+        for row in rows:
+            for key in keys:
+                del row[key]
+    return rows
+
+
+async def read_rows(db: AsyncSession, query, columns) -> list:
+    """ORM 엔티티 SELECT 문의 조건·정렬·페이지는 그대로 두고, 지정한 컬럼만 딕셔너리로 읽는다."""
+    keys = _keys(columns)
+    result = await db.execute(query.with_only_columns(*columns))
+    return [dict(zip(keys, row)) for row in result]
+
+
+async def attach_children(
+    db: AsyncSession, parents: list, parent_key: str, attr: str, query, link_column
+):
+    """
+    부모 행들의 자식 행을 IN 쿼리로 한꺼번에 읽어 부모 딕셔너리의 attr에 붙인다.
+
+    query는 자식 컬럼 앞에 부모 ID(link_column)를 parent_id라는 이름으로 함께 선택하는 SELECT 문이다.
+    """
+    children = defaultdict(list)
+    ids = [parent[parent_key] for parent in parents]
+    keys = [column.key for column in query.selected_columns][1:]
+    for start in range(0, len(ids), IN_BATCH_SIZE):
+        batch = query.where(link_column.in_(ids[start : start + IN_BATCH_SIZE]))
+        for parent_id, *values in await db.execute(batch):
+            children[parent_id].append(dict(zip(keys, values)))
+    for parent in parents:
+        parent[attr] = children.get(parent[parent_key], [])
+    return parents
+
+
+async def read_players(
+    db: AsyncSession,
+    query,
+    columns=PLAYER_COLUMNS,
+    expand=PLAYER_RELATIONSHIPS,
+) -> list:
+    """선수 목록과 각 선수의 퍼포먼스를 두 번의 쿼리로 읽는다."""
+    players = await read_rows(db, query, columns)
+    if "performances" not in expand:
+        return players
+    performances = select(
+        models.Performance.player_id.label("parent_id"), *PERFORMANCE_COLUMNS
+    ).order_by(models.Performance.player_id, models.Performance.performance_id)
+    return await attach_children(
+        db,
+        players,
+        "player_id",
+        "performances",
+        performances,
+        models.Performance.player_id,
+    )
+
+
+async def read_performances(
+    db: AsyncSession, query, columns=PERFORMANCE_COLUMNS
+) -> list:
+    return await read_rows(db, query, columns)
+
+
+async def read_teams(
+    db: AsyncSession, query, columns=TEAM_COLUMNS, expand=TEAM_RELATIONSHIPS
+) -> list:
+    """팀 목록과 각 팀의 소속 선수를 두 번의 쿼리로 읽는다."""
+    teams = await read_rows(db, query, columns)
+    if "players" not in expand:
+        return teams
+    players = (
+        select(models.TeamPlayer.team_id.label("parent_id"), *PLAYER_COLUMNS)
+        .join(models.Player, models.Player.player_id == models.TeamPlayer.player_id)
+        .order_by(models.TeamPlayer.team_id, models.Player.player_id)
+    )
+    return await attach_children(
+        db, teams, "team_id", "players", players, models.TeamPlayer.team_id
+    )
+
+
+async def read_leagues(
+    db: AsyncSession, query, columns=LEAGUE_COLUMNS, expand=LEAGUE_RELATIONSHIPS
+) -> list:
+    """리그 목록과 각 리그의 팀을 두 번의 쿼리로 읽는다."""
+    leagues = await read_rows(db, query, columns)
+    if "teams" not in expand:
+        return leagues
+    teams = select(models.Team.league_id.label("parent_id"), *TEAM_COLUMNS).order_by(
+        models.Team.league_id, models.Team.team_id
+    )
+    return await attach_children(
+        db, leagues, "league_id", "teams", teams, models.Team.league_id
+    )
+
+
+def json_response(rows, headers: dict = None) -> Response:
+    """행 목록(또는 행 하나)을 orjson으로 인코딩한 JSON 응답을 만든다."""
+    return Response(
+        content=orjson.dumps(rows), media_type="application/json", headers=headers
+    )
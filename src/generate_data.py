@@ -0,0 +1,356 @@
+"""합성 데이터베이스 생성기
+
+models.Base 스키마와 호환되는 SQLite 데이터베이스를 원하는 규모로 만든다.
+번들된 fantasy_data.db(선수 약 1천 명)로는 드러나지 않는 오프셋 페이지네이션, 누락 인덱스, N+1 문제를
+운영 규모(퍼포먼스 수천만 행)에서 재현하기 위한 도구다.
+
+- ID 체계와 값 형식은 번들 데이터와 같다(선수·팀 ID는 1001부터, 리그 ID는 5001부터, 주차는 "YYYYWW").
+- 포지션 비율, 포지션별 점수 분포, 선수별 출전 비율, 변경일(last_changed_date) 분포를 실제 데이터와 비슷하게 만든다.
+- 인덱스 없이 테이블만 만든 뒤 Core executemany로 일괄 삽입하고, 적재가 끝나면 migrate.upgrade로
+  인덱스 생성, 선수 시즌 요약 갱신, ANALYZE를 한 번에 실행한다.
+- 같은 --seed면 항상 같은 데이터가 만들어진다.
+
+사용 예시:
+    python generate_data.py --database ./large.db --players 20000 --seasons 5
+    python generate_data.py --database ./huge.db --players 200000 --seasons 10 --leagues 500
+    SWC_DB_PATH=./large.db uvicorn main:app
+"""
+
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.schema import CreateTable
+
+import migrate
+import models
+
+# 한 번의 executemany로 삽입하는 행 수
+INSERT_BATCH_SIZE = 50_000
+
+# 퍼포먼스 행(튜플)의 컬럼 순서
+PERFORMANCE_COLUMNS = (
+    "performance_id",
+    "week_number",
+    "fantasy_points",
+    "player_id",
+    "last_changed_date",
+)
+
+# 포지션별 (선수 비율, 평균 점수, 점수 표준편차, 출전 확률)
+POSITIONS = {
+    "QB": (0.12, 17.0, 7.0, 0.55),
+    "RB": (0.22, 10.0, 6.5, 0.70),
+    "WR": (0.41, 9.0, 6.5, 0.75),
+    "TE": (0.20, 6.0, 4.5, 0.70),
+    "K": (0.05, 8.0, 3.5, 0.80),
+}
+
+FIRST_NAMES = (
+    "Aaron Adam Alex Andre Austin Brandon Brian Bryce Caleb Cameron Chris "
+    "Cole Dak Dalton Daniel David Derek Devin Drew Eric Ezekiel Gabe "
+    "Garrett Isaiah Jake Jalen Jamal James Jared Jaylen Jordan Josh Justin "
+    "Kenneth Kevin Kyle Lamar Malik Marcus Mark Matt Michael Mike Nick "
+    "Patrick Ryan Sam Tavon Travis Trey Tyler Tyreek Zach"
+).split()
+LAST_NAMES = (
+    "Adams Allen Anderson Bailey Baker Bell Brown Carter Clark Cook Davis "
+    "Evans Fields Foster Gibbs Green Hall Harris Hill Howard Jackson "
+    "Johnson Jones Kelce King Lewis Mack Martin Miller Mitchell Moore "
+    "Murray Nelson Parker Prater Reed Robinson Rodgers Smith Stewart Taylor "
+    "Thomas Thompson Turner Walker Ward Washington White Williams Wilson "
+    "Wright Young"
+).split()
+TEAM_ADJECTIVES = (
+    "Roaring Mighty Dallas Golden Iron Flying Midnight Raging Silent "
+    "Thunder Crimson Lucky Rusty Wild"
+).split()
+TEAM_NOUNS = (
+    "Kitties Steers Gurus Hawks Bulldogs Wolves Titans Pigskins Gridders "
+    "Blitzers Sharks Cowboys Rockets Owls"
+).split()
+LEAGUE_WORDS = (
+    "Pigskin Prodigal Recurring Champions Gridiron Gurus Sunday Dynasty "
+    "Keeper Office Family Legends"
+).split()
+SCORING_TYPES = ["PPR", "Half-PPR", "Standard"]
+
+
+def _skewed(rng: random.Random, values: list):
+    """앞쪽 값일수록 자주 뽑는다(흔한 이름이 여러 선수에게 겹치도록)."""
+    return values[int(len(values) * rng.random() ** 2)]
+
+
+def season_start(season: int) -> date:
+    """시즌 1주차 경기일(9월 첫째 목요일)"""
+    day = date(season, 9, 1)
+    return day + timedelta(days=(3 - day.weekday()) % 7)
+
+
+def week_numbers(first_season: int, seasons: int, weeks: int) -> list:
+    """(주차 문자열, 경기일) 목록을 시간 순서로 반환한다."""
+    return [
+        (f"{season}{week:02d}", season_start(season) + timedelta(weeks=week - 1))
+        for season in range(first_season, first_season + seasons)
+        for week in range(1, weeks + 1)
+    ]
+
+
+def generate_leagues(rng: random.Random, count: int, changed: date) -> list:
+    return [
+        {
+            "league_id": 5001 + i,
+            "league_name": " ".join(rng.sample(LEAGUE_WORDS, 2)) + " Fantasy League",
+            "scoring_type": rng.choice(SCORING_TYPES),
+            "last_changed_date": changed - timedelta(days=rng.randrange(0, 120)),
+        }
+        for i in range(count)
+    ]
+
+
+def generate_teams(rng: random.Random, leagues: list, per_league: int) -> list:
+    teams = []
+    for league in leagues:
+        for _ in range(per_league):
+            teams.append(
+                {
+                    "team_id": 1001 + len(teams),
+                    "team_name": f"{rng.choice(TEAM_ADJECTIVES)} {rng.choice(TEAM_NOUNS)}",
+                    "league_id": league["league_id"],
+                    "last_changed_date": league["last_changed_date"]
+                    + timedelta(days=rng.randrange(0, 30)),
+                }
+            )
+    return teams
+
+
+def generate_players(rng: random.Random, count: int, first: date, last: date) -> list:
+    """
+    선수 목록을 만든다. 대부분은 초기 적재일에 만들어지고, 일부는 이후 신규 등록·정보 수정으로
+    더 최근 변경일을 가진다(증분 동기화 조회가 전체가 아닌 일부만 반환하도록).
+    """
+    positions = list(POSITIONS)
+    weights = [POSITIONS[position][0] for position in positions]
+    span = (last - first).days
+    players = []
+    for i in range(count):
+        changed = first
+        if rng.random() < 0.3:
+            changed = first + timedelta(days=int(span * rng.random() ** 0.5))
+        players.append(
+            {
+                "player_id": 1001 + i,
+                "gsis_id": f"00-00{rng.randrange(10000, 40000)}",
+                "first_name": _skewed(rng, FIRST_NAMES),
+                "last_name": _skewed(rng, LAST_NAMES),
+                "position": rng.choices(positions, weights)[0],
+                "last_changed_date": changed,
+            }
+        )
+    return players
+
+
+def generate_team_players(
+    rng: random.Random, teams: list, players: list, roster_size: int
+) -> list:
+    """리그마다 선수 풀에서 중복 없이 로스터를 뽑는다(한 선수가 여러 리그에는 속할 수 있다)."""
+    player_ids = [player["player_id"] for player in players]
+    rows = []
+    by_league = {}
+    for team in teams:
+        by_league.setdefault(team["league_id"], []).append(team)
+    for league_teams in by_league.values():
+        drafted = rng.sample(
+            player_ids, min(len(player_ids), roster_size * len(league_teams))
+        )
+        for index, player_id in enumerate(drafted):
+            team = league_teams[index % len(league_teams)]
+            rows.append(
+                {
+                    "team_id": team["team_id"],
+                    "player_id": player_id,
+                    "last_changed_date": team["last_changed_date"]
+                    + timedelta(days=rng.randrange(0, 60)),
+                }
+            )
+    return rows
+
+
+def generate_performances(rng: random.Random, players: list, weeks: list):
+    """
+    주차 순서로 퍼포먼스 행을 만든다(실제 적재 순서와 같이 performance_id가 주차 순으로 증가).
+    행 수가 수천만에 이르므로 딕셔너리 대신 PERFORMANCE_COLUMNS 순서의 튜플을 만들고,
+    날짜는 SQLAlchemy Date 타입이 저장하는 형식과 같은 ISO 문자열로 미리 바꿔 둔다.
+
+    선수마다 기량(점수 배율)과 출전 확률이 다르고, 점수는 포지션별 정규분포를 0점에서 자른 값이다.
+    변경일은 대개 경기 이틀 뒤이며, 일부 행은 이후 기록 정정으로 더 늦은 변경일을 가진다.
+    """
+    profiles = []
+    for player in players:
+        _, mean, stddev, appearance = POSITIONS[player["position"]]
+        skill = rng.lognormvariate(0, 0.35)
+        profiles.append(
+            (
+                player["player_id"],
+                mean * skill,
+                stddev,
+                min(appearance * rng.uniform(0.6, 1.3), 0.98),
+            )
+        )
+
+    performance_id = 0
+    for week_number, played in weeks:
+        loaded = played + timedelta(days=2)
+        corrections = [(loaded + timedelta(days=day)).isoformat() for day in range(60)]
+        for player_id, mean, stddev, appearance in profiles:
+            if rng.random() >= appearance:
+                continue
+            performance_id += 1
+            changed = corrections[0]
+            if rng.random() < 0.05:
+                changed = corrections[rng.randrange(1, 60)]
+            yield (
+                performance_id,
+                week_number,
+                round(max(rng.gauss(mean, stddev), 0.0), 1),
+                player_id,
+                changed,
+            )
+
+
+def _batches(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _fast_load(dbapi_connection, connection_record):
+    # 새로 만드는 파일이므로 적재 중 중단되면 다시 만들면 된다. 저널과 fsync를 생략해 삽입 속도를 높인다.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = OFF")
+    cursor.execute("PRAGMA synchronous = OFF")
+    cursor.execute("PRAGMA cache_size = -262144")
+    cursor.close()
+
+
+def generate(
+    database: str,
+    leagues: int = 5,
+    teams_per_league: int = 12,
+    roster_size: int = 15,
+    players: int = 1000,
+    seasons: int = 1,
+    weeks: int = 17,
+    first_season: int = 2023,
+    seed: int = 0,
+    log=print,
+) -> dict:
+    """
+    database 경로에 합성 데이터베이스를 만들고 테이블별 행 수를 반환한다.
+    이미 있는 파일에는 쓰지 않는다(ValueError).
+    """
+    if os.path.exists(database):
+        raise ValueError(f"이미 있는 파일입니다: {database}")
+
+    rng = random.Random(seed)
+    schedule = week_numbers(first_season, seasons, weeks)
+    first_date = schedule[0][1] - timedelta(days=30)
+    last_date = schedule[-1][1] + timedelta(days=2)
+
+    engine = create_engine(f"sqlite:///{database}")
+    event.listen(engine, "connect", _fast_load)
+
+    league_rows = generate_leagues(rng, leagues, first_date)
+    team_rows = generate_teams(rng, league_rows, teams_per_league)
+    player_rows = generate_players(rng, players, first_date, last_date)
+    tables = [
+        (models.League, league_rows),
+        (models.Team, team_rows),
+        (models.Player, player_rows),
+        (
+            models.TeamPlayer,
+            generate_team_players(rng, team_rows, player_rows, roster_size),
+        ),
+    ]
+    performance_insert = (
+        f"INSERT INTO {models.Performance.__tablename__} "
+        f"({', '.join(PERFORMANCE_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(PERFORMANCE_COLUMNS))})"
+    )
+
+    counts = {}
+    with engine.begin() as conn:
+        # 인덱스는 적재가 끝난 뒤 한 번에 만든다(행마다 인덱스를 갱신하는 비용을 피한다).
+        for table in models.Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+        for model, rows in tables:
+            start = time.perf_counter()
+            count = 0
+            for batch in _batches(rows, INSERT_BATCH_SIZE):
+                conn.execute(insert(model.__table__), batch)
+                count += len(batch)
+            counts[model.__tablename__] = count
+            log(
+                f"{model.__tablename__}: {count}행 ({time.perf_counter() - start:.1f}초)"
+            )
+
+        # 가장 큰 테이블은 행마다 바인딩 처리를 거치지 않도록 드라이버 executemany로 바로 넣는다.
+        start = time.perf_counter()
+        count = 0
+        rows = generate_performances(rng, player_rows, schedule)
+        for batch in _batches(rows, INSERT_BATCH_SIZE):
+            conn.exec_driver_sql(performance_insert, batch)
+            count += len(batch)
+        counts[models.Performance.__tablename__] = count
+        log(f"performance: {count}행 ({time.perf_counter() - start:.1f}초)")
+
+    start = time.perf_counter()
+    migrate.upgrade(engine)
+    log(f"인덱스·시즌 요약·통계 생성 ({time.perf_counter() - start:.1f}초)")
+    engine.dispose()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SWC 합성 데이터베이스 생성")
+    parser.add_argument(
+        "--database", required=True, help="만들 SQLite 데이터베이스 파일 경로"
+    )
+    parser.add_argument("--leagues", type=int, default=5, help="리그 수")
+    parser.add_argument("--teams-per-league", type=int, default=12, help="리그당 팀 수")
+    parser.add_argument("--roster-size", type=int, default=15, help="팀당 선수 수")
+    parser.add_argument("--players", type=int, default=1000, help="선수 수")
+    parser.add_argument("--seasons", type=int, default=1, help="시즌 수")
+    parser.add_argument("--weeks", type=int, default=17, help="시즌당 주차 수")
+    parser.add_argument("--first-season", type=int, default=2023, help="첫 시즌 연도")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        generate(
+            args.database,
+            leagues=args.leagues,
+            teams_per_league=args.teams_per_league,
+            roster_size=args.roster_size,
+            players=args.players,
+            seasons=args.seasons,
+            weeks=args.weeks,
+            first_season=args.first_season,
+            seed=args.seed,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"생성 완료: {args.database} ({time.perf_counter() - start:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""HTTP 조건부 요청(ETag / Last-Modified / 304) 처리"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+def make_etag(version: tuple, path: str, query: str, media_type: str = "") -> str:
+    """데이터 버전, 요청 URL, 응답 미디어 타입으로 약한(weak) ETag를 만든다."""
+    key = f"{version}|{path}?{query}|{media_type}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def last_modified_of(version: tuple):
+    """데이터 버전 표식에서 가장 최근 파일 수정 시각을 초 단위 UTC datetime으로 반환한다."""
+    mtimes = [entry[0] for entry in version if entry is not None]
+    if not mtimes:
+        return None
+    return datetime.fromtimestamp(max(mtimes) // 1_000_000_000, tz=timezone.utc)
+
+
+def cache_headers(etag: str, last_modified: datetime, max_age: int) -> dict:
+    """
+    200 응답과 304 응답에 공통으로 붙이는 캐시 관련 헤더를 만든다.
+
+    max_age가 None이면 캐시가 응답을 저장하더라도 매번 검증자로 재검증하도록 no-cache를 붙인다.
+    """
+    cache_control = "no-cache" if max_age is None else f"public, max-age={max_age}"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def matches_any(request_headers) -> bool:
+    """If-None-Match: *인지 확인한다. 이 조건은 요청한 표현이 실제로 있을 때만 일치한다."""
+    return (request_headers.get("if-none-match") or "").strip() == "*"
+
+
+def is_not_modified(request_headers, etag: str, last_modified: datetime) -> bool:
+    """
+    요청의 조건부 헤더가 현재 검증자(validator)와 일치하는지 확인한다.
+
+    RFC 9110에 따라 If-None-Match가 있으면 If-Modified-Since는 무시한다.
+    If-None-Match: *는 표현이 있는지 알아야 판단할 수 있으므로 여기서는 일치로 보지 않는다(matches_any 참고).
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if matches_any(request_headers):
+            return False
+        # 약한 비교: W/ 접두사를 떼고 태그 값만 비교한다.
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified <= since
+    return False
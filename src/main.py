@@ -1,18 +1,48 @@
 """FastAPI 컨트롤러"""
 
-from fastapi import Depends, FastAPI, HTTPException, Query
-from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
+from pydantic import TypeAdapter
+import functools
+import time
 
-import crud, schemas
-from database import SessionLocal
+import analytics, bulk, config, crud, crud_async, fast_read, metrics, migrate
+import negotiation, profiling, schemas
+from cache import VersionedCache
+from database import (
+    DATABASE_PATH,
+    AsyncSessionLocal,
+    get_data_version,
+    reload_into_memory,
+)
+from export import EXPORT_MEDIA_TYPES, stream_export
+from http_cache import (
+    cache_headers,
+    is_not_modified,
+    last_modified_of,
+    make_etag,
+    matches_any,
+)
+from pagination import (
+    INT64_MAX,
+    INT64_MIN,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
 
 api_description = """
 이 API는 SportWorldCentral(SWC) 판타지 풋볼 API의 정보를 읽기 전용으로 제공한다.
 제공되는 엔드포인트는 아래와 같다.
 
 ## 분석(analytics)
-API의 상태 및 리그, 팀, 선수 수에 대한 정보를 제공한다.
+API의 상태 및 리그, 팀, 선수 수와 선수별 시즌 성적 집계, 서비스 계측 지표(/metrics)에 대한 정보와
+증분 동기화를 위한 변경 피드(/v0/changes/)를 제공한다.
 
 ## 선수(players)
 NFL 선수 목록을 조회하거나, 특정 player_id를 이용해 개별 선수 정보를 제공한다.
@@ -24,21 +54,250 @@ NFL 선수의 경기 성적과 해당 성적을 기반으로 한 SWC 리그 판
 SWC 판타지 풋볼 리그 전체와 각 리그에 속한 팀에 대한 정보를 제공한다.
 """
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버가 시작할 때 데이터베이스 파일에 인덱스, 변경 피드 트리거, 파생 테이블을 만든다.
+
+    readonly 프로필은 파일을 바꿀 수 없으므로 건너뛰고, memory 프로필은 마이그레이션한 파일을 다시 복사한다.
+    """
+    if config.AUTO_MIGRATE and config.DB_PROFILE != "readonly":
+        await run_in_threadpool(migrate.upgrade_file, DATABASE_PATH)
+        if config.DB_PROFILE == "memory":
+            reload_into_memory()
+    yield
+
+
 # OpenAPI 명세에 추가 세부 정보가 추가된 FastAPI 생성자
 app = FastAPI(
+    lifespan=lifespan,
     description=api_description,
     title="Sports World Central(SWC) Fantasy Football API",
     version="0.1",
 )
 
 
-# 종속성
-def get_db():
-    db = SessionLocal()
+# 데이터가 바뀌기 전까지 집계 결과를 재사용하기 위한 캐시
+counts_cache = VersionedCache()
+
+
+# 공유 캐시에 저장하지 않고 매번 재검증해야 하는 경로
+NO_CACHE_PATHS = {"/v0/changes/"}
+
+
+# 미들웨어
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """
+    데이터 조회 응답에 ETag/Last-Modified/Cache-Control 헤더를 붙이고,
+    클라이언트가 가진 응답이 최신이면 엔드포인트를 실행하지 않고 304를 반환한다.
+
+    검증자는 데이터 버전 표식에서 만들어지므로, 304 응답에는 DB 조회나 직렬화가 전혀 일어나지 않는다.
+    """
+    path = request.url.path
+    # 대용량 파일은 FileResponse가 파일 기준 검증자와 Range 요청을 직접 처리한다.
+    if (
+        request.method not in ("GET", "HEAD")
+        or not path.startswith("/v0/")
+        or path.startswith("/v0/bulk/")
+    ):
+        return await call_next(request)
+
+    version = get_data_version()
+    media_type = negotiation.negotiate(request.headers.get("accept"))
+    etag = make_etag(version, request.url.path, request.url.query, media_type)
+    last_modified = last_modified_of(version)
+    # 클라이언트가 주기적으로 폴링하는 변경 피드는 공유 캐시가 재사용하지 않고 매번 재검증하게 한다.
+    max_age = None if path in NO_CACHE_PATHS else config.CACHE_MAX_AGE
+    headers = cache_headers(etag, last_modified, max_age)
+    headers["Vary"] = negotiation.VARY
+
+    if is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        # If-None-Match: *는 엔드포인트가 표현을 찾은 경우(200)에만 304로 바꾼다.
+        if matches_any(request.headers):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return response
+
+
+@app.middleware("http")
+async def collect_metrics(request: Request, call_next):
+    """
+    엔드포인트별 처리 시간, 응답 크기, 요청당 SQL 실행 수·시간을 기록한다.
+
+    조건부 요청 미들웨어(conditional_get)보다 바깥에 등록되므로 304 응답과 오류 응답도 함께 측정한다.
+    SWC_PROFILING을 켜면 프로파일링 미들웨어가 이보다 바깥에 등록되어 가장 바깥 미들웨어가 된다.
+    """
+    stats = metrics.RequestStats()
+    token = metrics.request_stats.set(stats)
+    start = time.perf_counter()
     try:
-        yield db
+        response = await call_next(request)
+    except Exception:
+        metrics.observe_request(
+            request, Response(status_code=500), time.perf_counter() - start, stats
+        )
+        raise
     finally:
-        db.close()
+        metrics.request_stats.reset(token)
+    metrics.observe_request(request, response, time.perf_counter() - start, stats)
+    return response
+
+
+# 요청 프로파일링은 설정으로 켠 경우에만 등록하므로, 꺼져 있으면 오버헤드가 전혀 없다.
+if config.PROFILING:
+    app.middleware("http")(profiling.profile_request)
+
+
+# 종속성
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 마지막으로 시즌 요약 갱신 여부를 확인한 시점의 데이터 버전
+_summary_checked_version = None
+
+
+async def get_summary_db(db: AsyncSession = Depends(get_async_db)):
+    """
+    시즌 요약 테이블을 읽는 엔드포인트의 세션. 데이터가 바뀐 뒤 처음 요청이면 요약을 먼저 갱신한다.
+
+    트리거가 기록해 둔 선수만 다시 계산하므로 갱신 비용은 바뀐 선수 수에 비례하며,
+    데이터가 그대로이면 쿼리 없이 넘어간다. 쓰기가 막힌 readonly·memory 프로필은 데이터가 바뀌지 않으므로 건너뛴다.
+    """
+    global _summary_checked_version
+    version = get_data_version()
+    if config.DB_PROFILE == "default" and version != _summary_checked_version:
+        await db.run_sync(
+            lambda session: analytics.refresh_player_season_summary(
+                session.connection()
+            )
+        )
+        await db.commit()
+        # 갱신 자체가 데이터 버전을 바꾸므로, 다음 요청은 기록이 비었는지 한 번 더 확인하고 넘어간다.
+        _summary_checked_version = version
+    return db
+
+
+def parse_cursor(cursor: str, minimum_last_changed_date: date):
+    """쿼리 파라미터로 받은 커서를 crud 함수가 사용하는 정렬 키 튜플로 변환한다."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor, by_date=minimum_last_changed_date is not None)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다!")
+
+
+def parse_ids(ids: str) -> list:
+    """쉼표로 구분된 ID 목록을 중복 없이 요청 순서대로 정수 리스트로 변환한다."""
+    try:
+        parsed = list(dict.fromkeys(int(id) for id in ids.split(",") if id.strip()))
+        # SQLite 정수 컬럼 범위를 벗어난 ID는 바인딩 단계에서 500이 되므로 미리 거른다.
+        if any(not INT64_MIN <= id <= INT64_MAX for id in parsed):
+            raise ValueError(ids)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ID는 정수여야 합니다!")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="조회할 ID가 없습니다!")
+    if len(parsed) > crud.MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {crud.MAX_BATCH_IDS}개의 ID만 조회할 수 있습니다!",
+        )
+    return parsed
+
+
+def parse_fieldset(
+    fields: str, expand: str, columns, relationships: tuple, required: tuple
+):
+    """
+    fields/expand 쿼리 파라미터를 빠른 조회 경로가 읽을 컬럼과 펼칠 관계로 변환한다.
+
+    반환값: (읽을 컬럼, 펼칠 관계, 응답에서 뺄 키 집합)
+    """
+    try:
+        return fast_read.select_fieldset(
+            columns, relationships, fields, expand, required
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def set_next_cursor(
+    response: Response, rows: list, limit: int, id_attr: str, by_date: bool
+):
+    """다음 페이지가 있을 수 있으면 응답 헤더에 다음 페이지 커서를 담는다."""
+    cursor = next_cursor(rows, limit, id_attr, by_date)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def use_fast_read(request: Request, fields: str = None, expand: str = None) -> bool:
+    """
+    목록 엔드포인트가 빠른 조회 경로를 사용할지 판단한다.
+
+    응답 모양(fields/expand)을 바꾸거나 JSON 외 형식을 요청하면 설정과 관계없이 이 경로를 사용한다.
+    """
+    return (
+        config.FAST_READ
+        or fields is not None
+        or expand is not None
+        or negotiation.negotiate(request.headers.get("accept")) != negotiation.JSON
+    )
+
+
+def fast_list_response(
+    request: Request,
+    response: Response,
+    rows: list,
+    limit: int,
+    id_attr: str,
+    by_date: bool,
+    hidden: set = frozenset(),
+):
+    """
+    빠른 조회 경로의 행 목록을 다음 페이지 커서 헤더와 함께 응답으로 만든다.
+
+    커서를 만든 뒤에 요청하지 않은 키(hidden)를 응답에서 빼고,
+    Accept/Accept-Encoding 헤더에 맞는 형식과 압축 방식으로 인코딩한다.
+    """
+    set_next_cursor(response, rows, limit, id_attr, by_date)
+    fast_read.drop_fields(rows, hidden)
+    return negotiation.render(rows, request.headers, dict(response.headers))
+
+
+@functools.lru_cache(maxsize=None)
+def list_adapter(schema) -> TypeAdapter:
+    """스키마별 list[스키마] 검증기(검증 스키마를 만드는 비용이 크므로 스키마마다 한 번만 만든다)"""
+    return TypeAdapter(list[schema])
+
+
+def orm_list_response(
+    request: Request,
+    response: Response,
+    items: list,
+    schema,
+    limit: int,
+    id_attr: str,
+    by_date: bool,
+):
+    """
+    ORM 조회 경로의 객체 목록을 응답 스키마로 변환해 빠른 조회 경로와 같은 방식으로 응답한다.
+
+    SWC_FAST_READ=false여도 Accept-Encoding에 따른 압축이 똑같이 적용된다.
+    JSON 외 형식(Accept)을 요청하면 use_fast_read가 빠른 조회 경로를 고르므로 이 경로로 오지 않는다.
+    """
+    set_next_cursor(response, items, limit, id_attr, by_date)
+    adapter = list_adapter(schema)
+    rows = adapter.dump_python(adapter.validate_python(items), mode="json")
+    return negotiation.render(rows, request.headers, dict(response.headers))
 
 
 @app.get(
@@ -53,6 +312,23 @@ async def root():
     return {"message": "API 상태 확인 성공"}
 
 
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="서비스 계측 지표를 Prometheus 텍스트 형식으로 조회합니다.",
+    description=(
+        "엔드포인트(operation_id)별 요청 수·처리 시간·응답 크기 히스토그램, 요청당 SQL 실행 수와 SQLite 처리 시간, "
+        "SQL 문 실행 시간과 느린 SQL 수를 Prometheus 텍스트 형식으로 반환하는 엔드포인트입니다. "
+        "요청당 SQL 실행 수 히스토그램으로 N+1 조회 같은 회귀를 찾을 수 있습니다."
+    ),
+    response_description="Prometheus 텍스트 노출 형식(version 0.0.4)의 지표를 반환합니다.",
+    operation_id="metrics",
+    tags=["analytics"],
+)
+async def read_metrics():
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get(
     "/v0/players/",
     response_model=list[schemas.Player],
@@ -61,13 +337,18 @@ async def root():
         "SWC 선수 목록을 조회하는 엔드포인트입니다. 여러 파라미터로 선수를 필터링할 수 있습니다. "
         "이름은 유일하지 않을 수 있으므로(동명이인 가능) 주의하세요. "
         "skip과 limit를 사용해 페이지네이션을 수행합니다. "
+        "대량 동기화에는 응답의 X-Next-Cursor 헤더 값을 cursor 파라미터로 전달하는 커서 기반 페이지네이션을 권장합니다. "
+        "Accept 헤더로 Arrow IPC 스트림(application/vnd.apache.arrow.stream) 또는 MessagePack(application/msgpack) 응답을 요청할 수 있으며, "
+        "큰 응답은 Accept-Encoding에 따라 zstd 또는 gzip으로 압축됩니다. "
         "또한 Player ID는 내부 식별자이며 순서가 보장되지 않으므로, 개수 계산이나 순번 기반 로직에 사용하지 마세요."
     ),
     response_description="SWC 판타지 풋볼에 등록된 NFL 선수 목록을 반환합니다(팀에 소속되지 않은 선수도 포함될 수 있습니다).",
     operation_id="v0_get_players",
     tags=["players"],
 )
-def read_players(
+async def read_players(
+    request: Request,
+    response: Response,
     skip: int = Query(
         0, description="API 호출 결과의 시작 부분에서 건너뛸(스킵할) 레코드 수입니다."
     ),
@@ -80,17 +361,87 @@ def read_players(
         None, description="조회할 선수의 이름(First name) 필터입니다."
     ),
     last_name: str = Query(None, description="조회할 선수의 성(Last name) 필터입니다."),
-    db: Session = Depends(get_db),
+    cursor: str = Query(
+        None,
+        description=(
+            "이전 응답의 X-Next-Cursor 헤더 값입니다. 지정하면 해당 위치 다음 레코드부터 반환하며, "
+            "skip과 달리 페이지가 깊어져도 조회 비용이 일정합니다."
+        ),
+    ),
+    fields: str = Query(
+        None,
+        description=(
+            "응답에 포함할 필드 목록입니다(쉼표로 구분, 예: player_id,first_name,last_name). "
+            "관계 이름을 넣으면 해당 관계도 포함하며, 생략하면 모든 필드를 반환합니다."
+        ),
+    ),
+    expand: str = Query(
+        None,
+        description=(
+            "응답에 펼쳐 포함할 관계 목록입니다(performances). "
+            "생략하면 fields가 없을 때는 모든 관계를, 있을 때는 fields에 든 관계만 포함합니다. "
+            "빈 값(expand=)이면 관계를 조회하지 않습니다."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    players = crud.get_players(
+    after = parse_cursor(cursor, minimum_last_changed_date)
+    by_date = minimum_last_changed_date is not None
+    if use_fast_read(request, fields, expand):
+        columns, relationships, hidden = parse_fieldset(
+            fields,
+            expand,
+            fast_read.PLAYER_COLUMNS,
+            fast_read.PLAYER_RELATIONSHIPS,
+            ("player_id", "last_changed_date"),
+        )
+        query = crud.select_players(
+            skip, limit, minimum_last_changed_date, last_name, first_name, after
+        )
+        players = await fast_read.read_players(db, query, columns, relationships)
+        return fast_list_response(
+            request, response, players, limit, "player_id", by_date, hidden
+        )
+
+    players = await crud_async.get_players(
         db,
         skip=skip,
         limit=limit,
         min_last_changed_date=minimum_last_changed_date,
         first_name=first_name,
         last_name=last_name,
+        after=after,
     )
-    return players
+    return orm_list_response(
+        request, response, players, schemas.Player, limit, "player_id", by_date
+    )
+
+
+@app.get(
+    "/v0/players/batch/",
+    response_model=schemas.PlayerBatch,
+    summary="여러 선수 ID로 선수 정보를 한 번에 조회합니다.",
+    description=(
+        "쉼표로 구분한 선수 ID 목록(예: ids=1001,1002)에 해당하는 선수를 한 번의 요청으로 조회하는 엔드포인트입니다. "
+        "ID 하나마다 개별 엔드포인트를 호출하는 대신, 서버가 IN 쿼리 한 번과 관계 일괄 로딩으로 전체를 읽습니다. "
+        "결과는 요청한 ID 순서대로 반환되며(중복 ID는 한 번만 포함), 찾지 못한 ID는 missing_ids에 담깁니다."
+    ),
+    response_description="요청 순서대로 정렬된 선수 목록(items)과 찾지 못한 ID 목록(missing_ids)을 반환합니다.",
+    operation_id="v0_get_players_by_ids",
+    tags=["players"],
+)
+async def read_players_batch(
+    ids: str = Query(
+        ...,
+        description=f"조회할 선수 ID 목록입니다(쉼표로 구분, 최대 {crud.MAX_BATCH_IDS}개).",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    id_list = parse_ids(ids)
+    if config.FAST_READ:
+        rows = await fast_read.read_players(db, crud.select_players_by_ids(id_list))
+        return fast_read.json_response(crud.order_by_ids(rows, id_list, "player_id"))
+    return await crud_async.get_players_by_ids(db, id_list)
 
 
 @app.get(
@@ -104,8 +455,40 @@ def read_players(
     operation_id="v0_get_players_by_player_id",
     tags=["players"],
 )
-def get_read_player(player_id: int, db: Session = Depends(get_db)):
-    player = crud.get_player(db, player_id=player_id)
+async def get_read_player(
+    player_id: int,
+    fields: str = Query(
+        None,
+        description=(
+            "응답에 포함할 필드 목록입니다(쉼표로 구분, 예: player_id,first_name,last_name). "
+            "관계 이름을 넣으면 해당 관계도 포함하며, 생략하면 모든 필드를 반환합니다."
+        ),
+    ),
+    expand: str = Query(
+        None,
+        description=(
+            "응답에 펼쳐 포함할 관계 목록입니다(performances). "
+            "생략하면 fields가 없을 때는 모든 관계를, 있을 때는 fields에 든 관계만 포함합니다. "
+            "빈 값(expand=)이면 관계를 조회하지 않습니다."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if fields is not None or expand is not None:
+        columns, relationships, hidden = parse_fieldset(
+            fields,
+            expand,
+            fast_read.PLAYER_COLUMNS,
+            fast_read.PLAYER_RELATIONSHIPS,
+            ("player_id",),
+        )
+        query = crud.select_player(player_id)
+        players = await fast_read.read_players(db, query, columns, relationships)
+        if not players:
+            raise HTTPException(status_code=404, detail="선수를 찾을 수 없습니다!")
+        return fast_read.json_response(fast_read.drop_fields(players, hidden)[0])
+
+    player = await crud_async.get_player(db, player_id=player_id)
     if player is None:
         raise HTTPException(status_code=404, detail="선수를 찾을 수 없습니다!")
     return player
@@ -118,13 +501,18 @@ def get_read_player(player_id: int, db: Session = Depends(get_db)):
     description=(
         "SWC에서 선수들의 주간 퍼포먼스(예: 판타지 포인트 포함) 목록을 조회하는 엔드포인트입니다. "
         "skip과 limit로 페이지네이션을 수행할 수 있습니다. "
+        "대량 동기화에는 응답의 X-Next-Cursor 헤더 값을 cursor 파라미터로 전달하는 커서 기반 페이지네이션을 권장합니다. "
+        "Accept 헤더로 Arrow IPC 스트림(application/vnd.apache.arrow.stream) 또는 MessagePack(application/msgpack) 응답을 요청할 수 있으며, "
+        "큰 응답은 Accept-Encoding에 따라 zstd 또는 gzip으로 압축됩니다. "
         "Performance ID는 내부 식별자이며 순차성이 보장되지 않으므로, 카운팅이나 순번 기반 로직에 사용하지 마세요."
     ),
     response_description="여러 선수의 주간 스코어링 퍼포먼스 목록을 반환합니다.",
     operation_id="v0_get_performances",
     tags=["scoring"],
 )
-def read_performances(
+async def read_performances(
+    request: Request,
+    response: Response,
     skip: int = Query(
         0, description="API 호출 결과의 시작 부분에서 건너뛸(스킵할) 레코드 수입니다."
     ),
@@ -133,12 +521,179 @@ def read_performances(
         None,
         description="이 날짜 이전에 변경된 레코드는 제외하고, 해당 날짜 이후(포함)에 변경된 레코드만 반환합니다.",
     ),
-    db: Session = Depends(get_db),
+    cursor: str = Query(
+        None,
+        description=(
+            "이전 응답의 X-Next-Cursor 헤더 값입니다. 지정하면 해당 위치 다음 레코드부터 반환하며, "
+            "skip과 달리 페이지가 깊어져도 조회 비용이 일정합니다."
+        ),
+    ),
+    fields: str = Query(
+        None,
+        description=(
+            "응답에 포함할 필드 목록입니다(쉼표로 구분, 예: performance_id,fantasy_points). "
+            "생략하면 모든 필드를 반환합니다."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    after = parse_cursor(cursor, minimum_last_changed_date)
+    by_date = minimum_last_changed_date is not None
+    if use_fast_read(request, fields):
+        columns, _, hidden = parse_fieldset(
+            fields,
+            None,
+            fast_read.PERFORMANCE_COLUMNS,
+            (),
+            ("performance_id", "last_changed_date"),
+        )
+        query = crud.select_performances(skip, limit, minimum_last_changed_date, after)
+        performances = await fast_read.read_performances(db, query, columns)
+        return fast_list_response(
+            request, response, performances, limit, "performance_id", by_date, hidden
+        )
+
+    performances = await crud_async.get_performances(
+        db,
+        skip=skip,
+        limit=limit,
+        min_last_changed_date=minimum_last_changed_date,
+        after=after,
+    )
+    return orm_list_response(
+        request,
+        response,
+        performances,
+        schemas.Performance,
+        limit,
+        "performance_id",
+        by_date,
+    )
+
+
+def export_response(resource: str, fmt: str, min_last_changed_date: date):
+    """내보내기 데이터를 내려받기용 스트리밍 응답으로 감싼다."""
+    return StreamingResponse(
+        stream_export(resource, fmt, min_last_changed_date),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{resource}.{fmt}"'},
+    )
+
+
+@app.get(
+    "/v0/export/performances/",
+    summary="선수 주간 퍼포먼스 전체를 NDJSON 또는 CSV로 스트리밍합니다.",
+    description=(
+        "performance 테이블 전체를 페이지네이션 없이 한 번의 요청으로 내려받는 엔드포인트입니다. "
+        "행은 서버 측 커서에서 배치 단위로 읽혀 곧바로 전송되므로, 테이블 크기와 관계없이 "
+        "서버 메모리 사용량이 일정하고 쿼리가 끝나기 전에 첫 데이터가 도착합니다."
+    ),
+    response_description="Performance ID 순서로 정렬된 NDJSON(한 줄에 하나의 JSON 객체) 또는 헤더가 포함된 CSV를 반환합니다.",
+    operation_id="v0_export_performances",
+    tags=["scoring"],
+)
+async def export_performances(
+    export_format: str = Query(
+        "ndjson",
+        alias="format",
+        pattern="^(ndjson|csv)$",
+        description="내보내기 형식(ndjson 또는 csv)입니다.",
+    ),
+    minimum_last_changed_date: date = Query(
+        None,
+        description="이 날짜 이전에 변경된 레코드는 제외하고, 해당 날짜 이후(포함)에 변경된 레코드만 반환합니다.",
+    ),
+):
+    return export_response("performances", export_format, minimum_last_changed_date)
+
+
+@app.get(
+    "/v0/export/players/",
+    summary="SWC 선수 전체를 NDJSON 또는 CSV로 스트리밍합니다.",
+    description=(
+        "player 테이블 전체를 페이지네이션 없이 한 번의 요청으로 내려받는 엔드포인트입니다. "
+        "퍼포먼스는 포함하지 않으며, 필요하면 v0_export_performances를 함께 사용하세요. "
+        "행은 서버 측 커서에서 배치 단위로 읽혀 곧바로 전송됩니다."
+    ),
+    response_description="Player ID 순서로 정렬된 NDJSON 또는 헤더가 포함된 CSV를 반환합니다.",
+    operation_id="v0_export_players",
+    tags=["players"],
+)
+async def export_players(
+    export_format: str = Query(
+        "ndjson",
+        alias="format",
+        pattern="^(ndjson|csv)$",
+        description="내보내기 형식(ndjson 또는 csv)입니다.",
+    ),
+    minimum_last_changed_date: date = Query(
+        None,
+        description="이 날짜 이전에 변경된 레코드는 제외하고, 해당 날짜 이후(포함)에 변경된 레코드만 반환합니다.",
+    ),
 ):
-    performances = crud.get_performances(
-        db, skip=skip, limit=limit, min_last_changed_date=minimum_last_changed_date
+    return export_response("players", export_format, minimum_last_changed_date)
+
+
+@app.get(
+    "/v0/leaderboard/",
+    response_model=list[schemas.LeaderboardEntry],
+    summary="주차 또는 시즌 판타지 포인트 상위 K명의 순위를 조회합니다.",
+    description=(
+        "판타지 포인트가 가장 높은 선수 K명을 순위와 함께 반환하는 엔드포인트입니다. "
+        "week_number를 지정하면 해당 주차의 점수로, 지정하지 않으면 시즌 누적 점수로 순위를 매깁니다. "
+        "시즌을 지정하지 않으면 가장 최근 시즌을 사용하며, position으로 포지션별 순위를 조회할 수 있습니다. "
+        "순위는 인덱스 순서대로 K명만 읽어 계산되므로 응답 시간은 데이터 크기가 아닌 K에 비례합니다."
+    ),
+    response_description="판타지 포인트 내림차순으로 정렬된 상위 K명의 선수 목록을 반환합니다.",
+    operation_id="v0_get_leaderboard",
+    tags=["scoring"],
+)
+async def read_leaderboard(
+    week_number: str = Query(
+        None,
+        description="순위를 매길 주차입니다(예: 202307). 생략하면 시즌 누적 점수를 사용합니다.",
+    ),
+    season: str = Query(
+        None,
+        description="week_number가 없을 때 순위를 매길 시즌입니다(예: 2023). 생략하면 최신 시즌을 사용합니다.",
+    ),
+    position: str = Query(
+        None, description="조회할 선수 포지션 필터입니다(QB, RB, WR, TE, K)."
+    ),
+    k: int = Query(25, ge=1, le=500, description="반환할 상위 선수 수입니다."),
+    db: AsyncSession = Depends(get_summary_db),
+):
+    leaderboard = await crud_async.get_leaderboard(
+        db, week_number=week_number, season=season, position=position, k=k
     )
-    return performances
+    return leaderboard
+
+
+@app.get(
+    "/v0/leagues/batch/",
+    response_model=schemas.LeagueBatch,
+    summary="여러 리그 ID로 리그 정보를 한 번에 조회합니다.",
+    description=(
+        "쉼표로 구분한 리그 ID 목록(예: ids=5001,5002)에 해당하는 리그를 한 번의 요청으로 조회하는 엔드포인트입니다. "
+        "ID 하나마다 개별 엔드포인트를 호출하는 대신, 서버가 IN 쿼리 한 번과 관계 일괄 로딩으로 전체를 읽습니다. "
+        "결과는 요청한 ID 순서대로 반환되며(중복 ID는 한 번만 포함), 찾지 못한 ID는 missing_ids에 담깁니다."
+    ),
+    response_description="요청 순서대로 정렬된 리그 목록(items)과 찾지 못한 ID 목록(missing_ids)을 반환합니다.",
+    operation_id="v0_get_leagues_by_ids",
+    tags=["membership"],
+)
+async def read_leagues_batch(
+    ids: str = Query(
+        ...,
+        description=f"조회할 리그 ID 목록입니다(쉼표로 구분, 최대 {crud.MAX_BATCH_IDS}개).",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    id_list = parse_ids(ids)
+    if config.FAST_READ:
+        rows = await fast_read.read_leagues(db, crud.select_leagues_by_ids(id_list))
+        return fast_read.json_response(crud.order_by_ids(rows, id_list, "league_id"))
+    return await crud_async.get_leagues_by_ids(db, id_list)
 
 
 @app.get(
@@ -150,8 +705,40 @@ def read_performances(
     operation_id="v0_get_league_by_league_id",
     tags=["membership"],
 )
-def read_league(league_id: int, db: Session = Depends(get_db)):
-    league = crud.get_league(db, league_id=league_id)
+async def read_league(
+    league_id: int,
+    fields: str = Query(
+        None,
+        description=(
+            "응답에 포함할 필드 목록입니다(쉼표로 구분, 예: league_id,league_name). "
+            "관계 이름을 넣으면 해당 관계도 포함하며, 생략하면 모든 필드를 반환합니다."
+        ),
+    ),
+    expand: str = Query(
+        None,
+        description=(
+            "응답에 펼쳐 포함할 관계 목록입니다(teams). "
+            "생략하면 fields가 없을 때는 모든 관계를, 있을 때는 fields에 든 관계만 포함합니다. "
+            "빈 값(expand=)이면 관계를 조회하지 않습니다."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if fields is not None or expand is not None:
+        columns, relationships, hidden = parse_fieldset(
+            fields,
+            expand,
+            fast_read.LEAGUE_COLUMNS,
+            fast_read.LEAGUE_RELATIONSHIPS,
+            ("league_id",),
+        )
+        query = crud.select_league(league_id)
+        leagues = await fast_read.read_leagues(db, query, columns, relationships)
+        if not leagues:
+            raise HTTPException(status_code=404, detail="리그를 찾을 수 없습니다!")
+        return fast_read.json_response(fast_read.drop_fields(leagues, hidden)[0])
+
+    league = await crud_async.get_league(db, league_id=league_id)
     if league is None:
         raise HTTPException(status_code=404, detail="리그를 찾을 수 없습니다!")
     return league
@@ -164,6 +751,9 @@ def read_league(league_id: int, db: Session = Depends(get_db)):
     description=(
         "SWC 판타지 풋볼 리그 목록을 조회하는 엔드포인트입니다. "
         "skip과 limit로 페이지네이션을 수행할 수 있습니다. "
+        "대량 동기화에는 응답의 X-Next-Cursor 헤더 값을 cursor 파라미터로 전달하는 커서 기반 페이지네이션을 권장합니다. "
+        "Accept 헤더로 Arrow IPC 스트림(application/vnd.apache.arrow.stream) 또는 MessagePack(application/msgpack) 응답을 요청할 수 있으며, "
+        "큰 응답은 Accept-Encoding에 따라 zstd 또는 gzip으로 압축됩니다. "
         "리그 이름은 유일하지 않을 수 있습니다. "
         "League ID는 내부 식별자이며 순차성이 보장되지 않으므로, 카운팅이나 순번 기반 로직에 사용하지 마세요."
     ),
@@ -171,7 +761,9 @@ def read_league(league_id: int, db: Session = Depends(get_db)):
     operation_id="v0_get_leagues",
     tags=["membership"],
 )
-def read_leagues(
+async def read_leagues(
+    request: Request,
+    response: Response,
     skip: int = Query(
         0, description="API 호출 결과의 시작 부분에서 건너뛸(스킵할) 레코드 수입니다."
     ),
@@ -183,16 +775,59 @@ def read_leagues(
     league_name: str = Query(
         None, description="조회할 리그 이름 필터입니다(SWC에서 유일하지 않을 수 있음)."
     ),
-    db: Session = Depends(get_db),
+    cursor: str = Query(
+        None,
+        description=(
+            "이전 응답의 X-Next-Cursor 헤더 값입니다. 지정하면 해당 위치 다음 레코드부터 반환하며, "
+            "skip과 달리 페이지가 깊어져도 조회 비용이 일정합니다."
+        ),
+    ),
+    fields: str = Query(
+        None,
+        description=(
+            "응답에 포함할 필드 목록입니다(쉼표로 구분, 예: league_id,league_name). "
+            "관계 이름을 넣으면 해당 관계도 포함하며, 생략하면 모든 필드를 반환합니다."
+        ),
+    ),
+    expand: str = Query(
+        None,
+        description=(
+            "응답에 펼쳐 포함할 관계 목록입니다(teams). "
+            "생략하면 fields가 없을 때는 모든 관계를, 있을 때는 fields에 든 관계만 포함합니다. "
+            "빈 값(expand=)이면 관계를 조회하지 않습니다."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    leagues = crud.get_leagues(
+    after = parse_cursor(cursor, minimum_last_changed_date)
+    by_date = minimum_last_changed_date is not None
+    if use_fast_read(request, fields, expand):
+        columns, relationships, hidden = parse_fieldset(
+            fields,
+            expand,
+            fast_read.LEAGUE_COLUMNS,
+            fast_read.LEAGUE_RELATIONSHIPS,
+            ("league_id", "last_changed_date"),
+        )
+        query = crud.select_leagues(
+            skip, limit, minimum_last_changed_date, league_name, after
+        )
+        leagues = await fast_read.read_leagues(db, query, columns, relationships)
+        return fast_list_response(
+            request, response, leagues, limit, "league_id", by_date, hidden
+        )
+
+    leagues = await crud_async.get_leagues(
         db,
         skip=skip,
         limit=limit,
         min_last_changed_date=minimum_last_changed_date,
         league_name=league_name,
+        after=after,
+    )
+    return orm_list_response(
+        request, response, leagues, schemas.League, limit, "league_id", by_date
     )
-    return leagues
 
 
 @app.get(
@@ -202,6 +837,9 @@ def read_leagues(
     description=(
         "SWC 판타지 풋볼 팀 목록을 조회하는 엔드포인트입니다. "
         "skip과 limit로 페이지네이션을 수행할 수 있습니다. "
+        "대량 동기화에는 응답의 X-Next-Cursor 헤더 값을 cursor 파라미터로 전달하는 커서 기반 페이지네이션을 권장합니다. "
+        "Accept 헤더로 Arrow IPC 스트림(application/vnd.apache.arrow.stream) 또는 MessagePack(application/msgpack) 응답을 요청할 수 있으며, "
+        "큰 응답은 Accept-Encoding에 따라 zstd 또는 gzip으로 압축됩니다. "
         "팀 이름은 유일하지 않을 수 있습니다. "
         "다른 API(예: v0_get_players)에서 얻은 Team ID를 이 엔드포인트 결과의 Team ID와 매칭하여 사용할 수 있습니다. "
         "Team ID는 내부 식별자이며 순차성이 보장되지 않으므로, 카운팅이나 순번 기반 로직에 사용하지 마세요."
@@ -210,7 +848,9 @@ def read_leagues(
     operation_id="v0_get_teams",
     tags=["membership"],
 )
-def read_teams(
+async def read_teams(
+    request: Request,
+    response: Response,
     skip: int = Query(
         0, description="API 호출 결과의 시작 부분에서 건너뛸(스킵할) 레코드 수입니다."
     ),
@@ -226,17 +866,87 @@ def read_teams(
     league_id: int = Query(
         None, description="조회할 리그 ID 필터입니다(SWC에서 유일한 식별자)."
     ),
-    db: Session = Depends(get_db),
+    cursor: str = Query(
+        None,
+        description=(
+            "이전 응답의 X-Next-Cursor 헤더 값입니다. 지정하면 해당 위치 다음 레코드부터 반환하며, "
+            "skip과 달리 페이지가 깊어져도 조회 비용이 일정합니다."
+        ),
+    ),
+    fields: str = Query(
+        None,
+        description=(
+            "응답에 포함할 필드 목록입니다(쉼표로 구분, 예: team_id,team_name). "
+            "관계 이름을 넣으면 해당 관계도 포함하며, 생략하면 모든 필드를 반환합니다."
+        ),
+    ),
+    expand: str = Query(
+        None,
+        description=(
+            "응답에 펼쳐 포함할 관계 목록입니다(players). "
+            "생략하면 fields가 없을 때는 모든 관계를, 있을 때는 fields에 든 관계만 포함합니다. "
+            "빈 값(expand=)이면 관계를 조회하지 않습니다."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    teams = crud.get_teams(
+    after = parse_cursor(cursor, minimum_last_changed_date)
+    by_date = minimum_last_changed_date is not None
+    if use_fast_read(request, fields, expand):
+        columns, relationships, hidden = parse_fieldset(
+            fields,
+            expand,
+            fast_read.TEAM_COLUMNS,
+            fast_read.TEAM_RELATIONSHIPS,
+            ("team_id", "last_changed_date"),
+        )
+        query = crud.select_teams(
+            skip, limit, minimum_last_changed_date, team_name, league_id, after
+        )
+        teams = await fast_read.read_teams(db, query, columns, relationships)
+        return fast_list_response(
+            request, response, teams, limit, "team_id", by_date, hidden
+        )
+
+    teams = await crud_async.get_teams(
         db,
         skip=skip,
         limit=limit,
         min_last_changed_date=minimum_last_changed_date,
         team_name=team_name,
         league_id=league_id,
+        after=after,
     )
-    return teams
+    return orm_list_response(
+        request, response, teams, schemas.Team, limit, "team_id", by_date
+    )
+
+
+@app.get(
+    "/v0/teams/batch/",
+    response_model=schemas.TeamBatch,
+    summary="여러 팀 ID로 팀 정보를 한 번에 조회합니다.",
+    description=(
+        "쉼표로 구분한 팀 ID 목록(예: ids=1001,1002)에 해당하는 팀을 한 번의 요청으로 조회하는 엔드포인트입니다. "
+        "ID 하나마다 개별 엔드포인트를 호출하는 대신, 서버가 IN 쿼리 한 번과 관계 일괄 로딩으로 전체를 읽습니다. "
+        "결과는 요청한 ID 순서대로 반환되며(중복 ID는 한 번만 포함), 찾지 못한 ID는 missing_ids에 담깁니다."
+    ),
+    response_description="요청 순서대로 정렬된 팀 목록(items)과 찾지 못한 ID 목록(missing_ids)을 반환합니다.",
+    operation_id="v0_get_teams_by_ids",
+    tags=["membership"],
+)
+async def read_teams_batch(
+    ids: str = Query(
+        ...,
+        description=f"조회할 팀 ID 목록입니다(쉼표로 구분, 최대 {crud.MAX_BATCH_IDS}개).",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    id_list = parse_ids(ids)
+    if config.FAST_READ:
+        rows = await fast_read.read_teams(db, crud.select_teams_by_ids(id_list))
+        return fast_read.json_response(crud.order_by_ids(rows, id_list, "team_id"))
+    return await crud_async.get_teams_by_ids(db, id_list)
 
 
 @app.get(
@@ -253,11 +963,119 @@ def read_teams(
     operation_id="v0_get_counts",
     tags=["analytics"],
 )
-def get_count(db: Session = Depends(get_db)):
-    counts = schemas.Counts(
-        league_count=crud.get_league_count(db),
-        team_count=crud.get_team_count(db),
-        player_count=crud.get_player_count(db),
-        performace_count=crud.get_performance_count(db),
-    )
+async def get_count(db: AsyncSession = Depends(get_async_db)):
+    version = get_data_version()
+    counts = counts_cache.get("counts", version)
+    if counts is None:
+        counts = schemas.Counts(**(await crud_async.get_counts(db))._mapping)
+        counts_cache.set("counts", version, counts)
     return counts
+
+
+@app.get(
+    "/v0/season_stats/",
+    response_model=list[schemas.PlayerSeasonStats],
+    summary="선수별 시즌 누적 판타지 포인트 통계를 순위 순서로 조회합니다.",
+    description=(
+        "선수별 시즌 총점, 평균, 표준편차, 최고/최저 점수와 해당 주차, 출전 경기 수를 "
+        "총점 내림차순으로 반환하는 엔드포인트입니다. 시즌과 포지션으로 필터링할 수 있으며, "
+        "skip과 limit로 페이지네이션을 수행합니다. "
+        "주차 범위를 지정하지 않으면 미리 계산된 요약 테이블에서 바로 조회하고, "
+        "주차 범위를 지정하면 해당 주차의 퍼포먼스만 집계합니다. "
+        "요약 테이블은 데이터가 바뀐 뒤 첫 요청에서 바뀐 선수만 자동으로 다시 계산됩니다."
+    ),
+    response_description="선수 시즌 성적 목록을 총점이 높은 순서로 반환합니다.",
+    operation_id="v0_get_player_season_stats",
+    tags=["analytics"],
+)
+async def read_player_season_stats(
+    skip: int = Query(
+        0, description="API 호출 결과의 시작 부분에서 건너뛸(스킵할) 레코드 수입니다."
+    ),
+    limit: int = Query(100, description="스킵 이후 반환할 최대 레코드 수입니다."),
+    season: str = Query(None, description="조회할 시즌 필터입니다(예: 2023)."),
+    position: str = Query(
+        None, description="조회할 선수 포지션 필터입니다(QB, RB, WR, TE, K)."
+    ),
+    minimum_week_number: str = Query(
+        None, description="집계에 포함할 첫 주차입니다(예: 202301, 해당 주차 포함)."
+    ),
+    maximum_week_number: str = Query(
+        None, description="집계에 포함할 마지막 주차입니다(예: 202308, 해당 주차 포함)."
+    ),
+    db: AsyncSession = Depends(get_summary_db),
+):
+    stats = await crud_async.get_player_season_stats(
+        db,
+        skip=skip,
+        limit=limit,
+        season=season,
+        position=position,
+        min_week_number=minimum_week_number,
+        max_week_number=maximum_week_number,
+    )
+    return stats
+
+
+@app.get(
+    "/v0/changes/",
+    response_model=schemas.ChangeBatch,
+    summary="마지막으로 받은 변경 이후 추가·수정·삭제된 행을 모든 테이블에 걸쳐 조회합니다.",
+    description=(
+        "league, team, player, team_player, performance 테이블의 변경을 발생 순서대로 반환하는 "
+        "변경 피드 엔드포인트입니다. 각 변경에는 테이블 이름, 기본 키, 작업(upsert 또는 delete), "
+        "upsert인 경우 행의 현재 상태가 담깁니다. 같은 행이 여러 번 바뀌었다면 최신 상태 하나만 전달됩니다. "
+        "응답의 next_token을 다음 요청의 token으로 넘기면 이어서 받을 수 있으며, "
+        "token 없이 요청하면 처음부터(전체 데이터) 받습니다. has_more가 false가 될 때까지 반복하면 "
+        "현재 시점까지 동기화되며, 이후에는 같은 token으로 주기적으로 새 변경을 확인할 수 있습니다."
+    ),
+    response_description="변경 목록과 다음 요청에 사용할 토큰을 반환합니다.",
+    operation_id="v0_get_changes",
+    tags=["analytics"],
+)
+async def read_changes(
+    token: str = Query(
+        None, description="이전 응답의 next_token입니다. 생략하면 처음부터 받습니다."
+    ),
+    limit: int = Query(
+        500, ge=1, le=crud.MAX_CHANGES, description="한 번에 받을 최대 변경 수입니다."
+    ),
+    db: AsyncSession = Depends(get_async_db),
+):
+    after_seq = 0
+    if token is not None:
+        try:
+            (after_seq,) = decode_cursor(token)
+        except ValueError:
+            after_seq = -1
+        if after_seq < 0:
+            raise HTTPException(status_code=400, detail="유효하지 않은 토큰입니다!")
+    batch = await crud_async.get_changes(db, after_seq=after_seq, limit=limit)
+    return schemas.ChangeBatch(
+        changes=batch["changes"],
+        next_token=encode_cursor((batch["last_seq"],)),
+        has_more=batch["has_more"],
+    )
+
+
+@app.get(
+    "/v0/bulk/{file_name}",
+    summary="SWC 데이터 테이블 전체를 Parquet, Arrow IPC 또는 CSV 파일로 내려받습니다.",
+    description=(
+        "player_data, league_data, performance_data, team_data, team_player_data 파일을 "
+        "parquet, arrow(Arrow IPC 파일), csv 확장자로 요청할 수 있습니다(예: player_data.parquet). "
+        "파일은 서버가 데이터베이스에서 직접 생성하며, 테이블이 변경된 경우에만 다시 만들어집니다. "
+        "Range 헤더로 파일의 일부만 내려받거나 중단된 다운로드를 이어받을 수 있습니다."
+    ),
+    response_description="요청한 대용량 데이터 파일을 반환합니다.",
+    operation_id="v0_get_bulk_file",
+    tags=["analytics"],
+)
+async def get_bulk_file(file_name: str):
+    bulk_file = bulk.bulk_file_path(file_name)
+    if bulk_file is None:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다!")
+    path, media_type = bulk_file
+    # 파일 생성은 CPU와 디스크를 사용하는 동기 작업이므로 스레드 풀에서 실행한다.
+    await run_in_threadpool(bulk.ensure_bulk_file, path)
+    return FileResponse(path, media_type=media_type, filename=file_name)
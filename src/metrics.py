@@ -0,0 +1,238 @@
+"""요청·SQL 계측(metrics)
+
+엔드포인트(operation_id)별 요청 지연 시간·응답 크기, 요청당 SQL 실행 수·실행 시간,
+SQL 문 실행 시간을 메모리에 집계하고 /metrics 엔드포인트에서 Prometheus 텍스트 형식으로 내보낸다.
+느린 SQL 문은 문장과 파라미터를 함께 slow query 로그로 남긴다.
+
+요청당 SQL 통계는 contextvars로 요청마다 따로 모은다. 미들웨어가 요청을 시작할 때 넣은 RequestStats 객체를
+엔드포인트와 AsyncSession(greenlet)이 같은 컨텍스트 사본으로 공유하므로, 엔진 이벤트에서 바로 누적할 수 있다.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Prometheus 텍스트 형식의 응답 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 느린 SQL 로그에 남기는 파라미터 문자열의 최대 길이(IN 일괄 조회는 파라미터가 수백 개일 수 있다)
+SLOW_QUERY_PARAMETERS_MAX_LENGTH = 1000
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+_lock = threading.Lock()
+_registry = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple, values: tuple, extra: str = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """레이블별로 누적되는 카운터"""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values = {}
+        _registry.append(self)
+
+    def inc(self, *labels, amount: float = 1):
+        with _lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    """레이블별 누적 버킷 히스토그램(Prometheus histogram과 같은 구조)"""
+
+    def __init__(
+        self, name: str, documentation: str, buckets: tuple, labelnames: tuple = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.labelnames = labelnames
+        # 레이블 값 → [버킷별 개수(+Inf 포함), 합계, 개수]
+        self._series = {}
+        _registry.append(self)
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with _lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labels) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def sum(self, *labels) -> float:
+        series = self._series.get(labels)
+        return series[1] if series else 0
+
+    def render(self) -> list:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket_count
+                le = _labels(self.labelnames, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            label_text = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {total}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+# HTTP 요청
+http_requests = Counter(
+    "swc_http_requests_total",
+    "엔드포인트·상태 코드별 요청 수",
+    ("operation_id", "status"),
+)
+http_request_duration = Histogram(
+    "swc_http_request_duration_seconds",
+    "엔드포인트별 요청 처리 시간(초, 응답 헤더를 보낼 때까지)",
+    LATENCY_BUCKETS,
+    ("operation_id",),
+)
+http_response_size = Histogram(
+    "swc_http_response_size_bytes",
+    "엔드포인트별 응답 본문 크기(바이트, Content-Length가 있는 응답만)",
+    SIZE_BUCKETS,
+    ("operation_id",),
+)
+http_request_sql_queries = Histogram(
+    "swc_http_request_sql_queries",
+    "엔드포인트별 요청 하나가 실행한 SQL 문 수",
+    QUERY_COUNT_BUCKETS,
+    ("operation_id",),
+)
+http_request_sql_duration = Histogram(
+    "swc_http_request_sql_duration_seconds",
+    "엔드포인트별 요청 하나가 SQLite에서 보낸 시간(초)",
+    LATENCY_BUCKETS,
+    ("operation_id",),
+)
+
+# SQL
+sql_query_duration = Histogram(
+    "swc_sql_query_duration_seconds",
+    "SQL 문 하나의 실행 시간(초)",
+    LATENCY_BUCKETS,
+)
+sql_slow_queries = Counter(
+    "swc_sql_slow_queries_total",
+    "실행 시간이 SWC_SLOW_QUERY_SECONDS 이상인 SQL 문 수",
+)
+
+
+class RequestStats:
+    """요청 하나에서 실행한 SQL 문 수와 실행 시간"""
+
+    __slots__ = ("queries", "sql_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_seconds = 0.0
+
+
+request_stats: ContextVar = ContextVar("swc_request_stats", default=None)
+
+
+def instrument_engine(engine):
+    """동기 엔진(비동기 엔진은 sync_engine)의 SQL 실행 시간을 계측한다."""
+
+    # 시작 시각은 연결(conn.info)이 아니라 실행 컨텍스트에 저장한다. 실행이 실패하면
+    # after_cursor_execute가 호출되지 않으므로, 연결에 쌓아 두면 풀에 반환된 연결에 값이 남는다.
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context.swc_query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = getattr(context, "swc_query_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        sql_query_duration.observe(elapsed)
+
+        stats = request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.sql_seconds += elapsed
+
+        if elapsed >= config.SLOW_QUERY_SECONDS:
+            sql_slow_queries.inc()
+            logger.warning(
+                "slow query (%.3fs): %s parameters=%.*s",
+                elapsed,
+                statement,
+                SLOW_QUERY_PARAMETERS_MAX_LENGTH,
+                repr(parameters),
+            )
+
+
+def operation_id_of(request) -> str:
+    """요청과 일치한 라우트의 operation_id(없으면 경로 템플릿)를 반환한다."""
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    return getattr(route, "operation_id", None) or getattr(route, "path", "unknown")
+
+
+def observe_request(request, response, elapsed: float, stats: RequestStats):
+    """요청 하나의 처리 결과를 엔드포인트별 지표에 기록한다."""
+    operation_id = operation_id_of(request)
+    http_requests.inc(operation_id, str(response.status_code))
+    http_request_duration.observe(elapsed, operation_id)
+    http_request_sql_queries.observe(stats.queries, operation_id)
+    http_request_sql_duration.observe(stats.sql_seconds, operation_id)
+    content_length = response.headers.get("content-length")
+    if content_length is not None:
+        http_response_size.observe(int(content_length), operation_id)
+
+
+def render() -> str:
+    """등록된 모든 지표를 Prometheus 텍스트 형식으로 만든다."""
+    with _lock:
+        lines = [line for metric in _registry for line in metric.render()]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,77 @@
+"""데이터베이스 마이그레이션
+
+기존 fantasy_data.db에 모델(models.py)에는 정의됐지만 아직 없는 테이블과 인덱스를 만든다.
+이미 있는 객체는 건너뛰므로 여러 번 실행해도 안전하다.
+
+저장소의 fantasy_data.db에는 원본 데이터만 들어 있고, 인덱스·변경 피드·파생 테이블은 이 모듈이 만든다.
+API 서버는 시작할 때 자동으로 실행하며(SWC_AUTO_MIGRATE), 도커 이미지는 빌드할 때 실행한다.
+
+사용 예시:
+    python migrate.py
+    python migrate.py --database ./fantasy_data.db
+"""
+
+import argparse
+
+from sqlalchemy import create_engine
+
+import models
+from analytics import install_summary_triggers, refresh_player_season_summary
+from changes import install_change_log
+
+# 모델 정의에서 빠져 더는 쓰이지 않는 인덱스(새 인덱스로 대체됨)
+OBSOLETE_INDEXES = (
+    "ix_performance_week_number_fantasy_points",
+    "ix_player_season_summary_season_total",
+    "ix_player_season_summary_season_position_total",
+)
+
+
+def upgrade(engine):
+    """
+    모델 정의에 맞춰 누락된 테이블과 인덱스를 만들고, 변경 피드 트리거를 설치하고,
+    파생 테이블(선수 시즌 요약)을 갱신한 뒤 쿼리 플래너 통계를 갱신한다.
+    """
+    # 새 테이블은 인덱스와 함께 만들어진다.
+    models.Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        # 기존 테이블에 나중에 추가된 인덱스는 create_all이 만들지 않으므로 직접 만든다.
+        for table in models.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        for name in OBSOLETE_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        # 변경 피드 트리거를 설치하고, 트리거 설치 전부터 있던 행을 change_log에 채운다.
+        install_change_log(conn)
+        # 이후 바뀐 선수의 요약이 자동으로 다시 계산되도록 트리거를 설치한 뒤 요약을 갱신한다.
+        install_summary_triggers(conn)
+        refresh_player_season_summary(conn)
+        # 인덱스 선택에 필요한 통계(sqlite_stat1)를 갱신한다.
+        conn.exec_driver_sql("ANALYZE")
+
+
+def upgrade_file(path: str):
+    """데이터베이스 파일 경로로 upgrade를 실행한다."""
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        upgrade(engine)
+    finally:
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SWC 데이터베이스 마이그레이션")
+    parser.add_argument(
+        "--database",
+        default="./fantasy_data.db",
+        help="마이그레이션할 SQLite 데이터베이스 파일 경로",
+    )
+    args = parser.parse_args()
+
+    upgrade_file(args.database)
+    print(f"마이그레이션 완료: {args.database}")
+
+
+if __name__ == "__main__":
+    main()
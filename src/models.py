@@ -1,6 +1,15 @@
 """SQLAlchemy 모델"""
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Float, Date
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Float,
+    Date,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 
@@ -10,68 +19,184 @@ from database import Base
 class Player(Base):
     __tablename__ = "player"
 
-    player_id = Column(Integer, primary_key=True, index=True)
+    player_id = Column(Integer, primary_key=True)
     gsis_id = Column(String, nullable=True)
-    first_name = Column(String, nullable=False)
+    first_name = Column(String, nullable=False, index=True)
     last_name = Column(String, nullable=False)
     position = Column(String, nullable=False)
-    last_changed_date = Column(Date, nullable=False)
+    last_changed_date = Column(Date, nullable=False, index=True)
 
-    performances = relationship("Performance", back_populates="player")
+    performances = relationship(
+        "Performance",
+        back_populates="player",
+        order_by="Performance.performance_id",
+    )
 
     # player와 team 테이블 간 다대다 관계
     teams = relationship("Team", secondary="team_player", back_populates="players")
 
+    # 성(last_name) 단독 조회와 성+이름 조회를 모두 처리하는 복합 인덱스
+    __table_args__ = (Index("ix_player_last_name_first_name", last_name, first_name),)
+
 
 class Performance(Base):
     __tablename__ = "performance"
 
-    performance_id = Column(Integer, primary_key=True, index=True)
+    performance_id = Column(Integer, primary_key=True)
     week_number = Column(String, nullable=False)
     fantasy_points = Column(Float, nullable=False)
-    last_changed_date = Column(Date, nullable=False)
+    last_changed_date = Column(Date, nullable=False, index=True)
 
     player_id = Column(Integer, ForeignKey("player.player_id"))
 
     player = relationship("Player", back_populates="performances")
 
+    # 선수별 퍼포먼스 관계 로딩(player_id IN (...))과 주차 순 조회에 사용하는 복합 인덱스,
+    # 주차별 점수 순위(리더보드)를 정렬 없이 인덱스 순서대로 읽기 위한 복합 인덱스
+    # 동점은 performance_id 순서로 정해 호출마다 같은 순위가 나오게 한다.
+    __table_args__ = (
+        Index("ix_performance_player_id_week_number", player_id, week_number),
+        Index(
+            "ix_performance_week_number_points_id",
+            week_number,
+            fantasy_points.desc(),
+            performance_id,
+        ),
+    )
+
 
 class League(Base):
     __tablename__ = "league"
 
-    league_id = Column(Integer, primary_key=True, index=True)
-    league_name = Column(String, nullable=False)
+    league_id = Column(Integer, primary_key=True)
+    league_name = Column(String, nullable=False, index=True)
     scoring_type = Column(String, nullable=False)
-    last_changed_date = Column(Date, nullable=False)
+    last_changed_date = Column(Date, nullable=False, index=True)
 
-    teams = relationship("Team", back_populates="league")
+    teams = relationship("Team", back_populates="league", order_by="Team.team_id")
 
 
 class Team(Base):
     __tablename__ = "team"
 
-    team_id = Column(Integer, primary_key=True, index=True)
-    team_name = Column(String, nullable=False)
-    last_changed_date = Column(Date, nullable=False)
+    team_id = Column(Integer, primary_key=True)
+    team_name = Column(String, nullable=False, index=True)
+    last_changed_date = Column(Date, nullable=False, index=True)
 
     league_id = Column(Integer, ForeignKey("league.league_id"))
 
     league = relationship("League", back_populates="teams")
 
-    players = relationship("Player", secondary="team_player", back_populates="teams")
+    players = relationship(
+        "Player",
+        secondary="team_player",
+        back_populates="teams",
+        order_by="Player.player_id",
+    )
+
+    # 리그별 팀 관계 로딩과 리그 ID + 팀 이름 조회에 사용하는 복합 인덱스
+    __table_args__ = (Index("ix_team_league_id_team_name", league_id, team_name),)
 
 
 class TeamPlayer(Base):
     __tablename__ = "team_player"
 
-    team_id = Column(Integer, ForeignKey("team.team_id"), primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("team.team_id"), primary_key=True)
     player_id = Column(
         Integer, ForeignKey("player.player_id"), primary_key=True, index=True
     )
-    last_changed_date = Column(Date, nullable=False)
+    last_changed_date = Column(Date, nullable=False, index=True)
+
+
+class PlayerSeasonSummary(Base):
+    """
+    선수별 시즌 누적 성적 요약 테이블
+
+    performance 테이블에서 파생되는 테이블로, analytics.refresh_player_season_summary가 갱신한다.
+    last_changed_date는 요약에 반영된 원본 행 중 가장 최근 변경일이다.
+    """
+
+    __tablename__ = "player_season_summary"
+
+    player_id = Column(Integer, ForeignKey("player.player_id"), primary_key=True)
+    season = Column(String, primary_key=True)
+    position = Column(String, nullable=False)
+    games_played = Column(Integer, nullable=False)
+    total_points = Column(Float, nullable=False)
+    average_points = Column(Float, nullable=False)
+    stddev_points = Column(Float, nullable=False)
+    max_points = Column(Float, nullable=False)
+    max_week_number = Column(String, nullable=False)
+    min_points = Column(Float, nullable=False)
+    min_week_number = Column(String, nullable=False)
+    last_changed_date = Column(Date, nullable=False, index=True)
+
+    # 시즌 전체 / 포지션별 순위 조회를 인덱스 순서대로 처리하기 위한 복합 인덱스
+    # 동점은 player_id 순서로 정해 호출마다 같은 순위가 나오게 한다.
+    __table_args__ = (
+        Index(
+            "ix_player_season_summary_season_total_player",
+            season,
+            total_points.desc(),
+            player_id,
+        ),
+        Index(
+            "ix_player_season_summary_season_position_total_player",
+            season,
+            position,
+            total_points.desc(),
+            player_id,
+        ),
+    )
+
+
+class ChangeLog(Base):
+    """
+    변경 피드(changes feed) 테이블
+
+    추적 대상 테이블에 정의된 트리거(changes.install_change_log)가 행이 추가·수정·삭제될 때마다
+    (테이블, 행 키)별로 한 행을 남긴다. 같은 행이 다시 바뀌면 기존 행을 지우고 새 seq로 다시 기록하므로,
+    seq 이후의 변경을 읽으면 바뀐 행마다 최신 상태 하나씩만 전달된다.
+    AUTOINCREMENT로 seq가 재사용되지 않으므로 클라이언트는 마지막으로 받은 seq를 기준점으로 쓸 수 있다.
+    """
+
+    __tablename__ = "change_log"
+
+    seq = Column(Integer, primary_key=True)
+    table_name = Column(String, nullable=False)
+    # 기본 키 값(복합 키는 쉼표로 연결, 예: team_player의 "1001,1005")
+    row_key = Column(String, nullable=False)
+    # upsert(추가 또는 수정) 또는 delete
+    operation = Column(String, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(table_name, row_key),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class PlayerSeasonSummaryDirty(Base):
+    """
+    시즌 요약을 다시 계산해야 하는 선수 테이블
+
+    performance·player 테이블의 트리거(analytics.install_summary_triggers)가 행이 추가·수정·삭제될 때마다
+    영향을 받은 선수를 기록하고, analytics.refresh_player_season_summary가 다시 계산한 뒤 지운다.
+    같은 선수가 다시 기록되면 새 mark를 받으므로, 갱신 도중에 들어온 변경은 지워지지 않고 다음 갱신에 남는다.
+    """
+
+    __tablename__ = "player_season_summary_dirty"
+
+    mark = Column(Integer, primary_key=True)
+    player_id = Column(Integer, nullable=False, unique=True)
+
+    __table_args__ = ({"sqlite_autoincrement": True},)
 
 
 """
+INTEGER 기본 키는 SQLite의 rowid와 같으므로 별도 인덱스를 만들지 않는다.
+last_changed_date 단일 인덱스에는 rowid(기본 키)가 함께 저장되므로,
+(last_changed_date, 기본 키) 순서의 커서 페이지네이션도 이 인덱스로 처리된다.
+
 relationship()은 테이블 간 관계를 파이썬 객체 속성으로 연결해 주는 ORM 전용 장치이며, 실제
 컬럼을 만드는 것이 아닌 조회·연결·편의 기능을 담당한다.
 """
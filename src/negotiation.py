@@ -0,0 +1,139 @@
+"""응답 형식 협상(content negotiation)과 압축
+
+목록 엔드포인트는 Accept 헤더에 따라 JSON 외에 Arrow IPC 스트림(열 기반, 복사 없이 읽기 가능)과
+MessagePack으로도 응답한다. 본문이 일정 크기 이상이면 Accept-Encoding에 따라 zstd 또는 gzip으로 압축한다.
+
+msgpack과 zstandard는 선택 의존성이다. 설치되지 않았으면 해당 형식과 압축 방식을 제공하지 않는다.
+"""
+
+import gzip
+import io
+
+import orjson
+import pyarrow as pa
+from fastapi import Response
+
+import config
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+JSON = "application/json"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+MSGPACK = "application/msgpack"
+
+# 요청 Accept 헤더의 미디어 타입 → 응답 미디어 타입
+MEDIA_TYPE_ALIASES = {
+    JSON: JSON,
+    ARROW_STREAM: ARROW_STREAM,
+    MSGPACK: MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+    "application/*": JSON,
+    "*/*": JSON,
+}
+
+# 같은 URL이라도 아래 요청 헤더에 따라 응답이 달라지므로 캐시에 알린다(Vary 헤더).
+VARY = "Accept, Accept-Encoding"
+
+
+def _parse_header(value: str) -> list:
+    """Accept 계열 헤더를 q 값 내림차순(같으면 나열 순서)의 (값, q) 리스트로 변환한다."""
+    items = []
+    for part in (value or "").split(","):
+        name, *params = [piece.strip() for piece in part.split(";")]
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, number = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(number)
+                except ValueError:
+                    q = 0.0
+        items.append((name.lower(), q))
+    return sorted(items, key=lambda item: -item[1])
+
+
+def available_media_types() -> set:
+    types = {JSON, ARROW_STREAM}
+    if msgpack is not None:
+        types.add(MSGPACK)
+    return types
+
+
+def negotiate(accept: str) -> str:
+    """
+    Accept 헤더에서 제공 가능한 응답 미디어 타입 중 가장 선호도가 높은 것을 고른다.
+
+    Accept가 없거나 제공 가능한 형식이 없으면 JSON으로 응답한다.
+    """
+    available = available_media_types()
+    for name, q in _parse_header(accept):
+        media_type = MEDIA_TYPE_ALIASES.get(name)
+        if q > 0 and media_type in available:
+            return media_type
+    return JSON
+
+
+def choose_encoding(accept_encoding: str):
+    """
+    Accept-Encoding에서 사용할 압축 방식(zstd 우선, 그다음 gzip)을 고른다. 없으면 None
+
+    직접 나열한 방식은 그 q 값을 따르고, 나열하지 않은 방식만 "*"의 q 값을 따른다.
+    따라서 "*, gzip;q=0"은 gzip을 거부한 것으로 본다.
+    """
+    quality = dict(reversed(_parse_header(accept_encoding)))
+    candidates = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+    for encoding in candidates:
+        if quality.get(encoding, quality.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def _msgpack_default(value):
+    # 날짜는 JSON 응답과 같은 ISO 8601 문자열로 보낸다.
+    return value.isoformat()
+
+
+def encode(rows: list, media_type: str) -> bytes:
+    """행 딕셔너리 목록을 지정한 미디어 타입으로 인코딩한다."""
+    if media_type == ARROW_STREAM:
+        table = pa.Table.from_pylist(rows)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue()
+    if media_type == MSGPACK:
+        return msgpack.packb(rows, default=_msgpack_default)
+    return orjson.dumps(rows)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=config.ZSTD_LEVEL).compress(body)
+    return gzip.compress(body, compresslevel=config.GZIP_LEVEL)
+
+
+def render(rows: list, request_headers, headers: dict = None) -> Response:
+    """
+    요청 헤더에 맞는 형식으로 행 목록을 인코딩하고, 본문이 COMPRESS_MIN_SIZE 이상이면 압축한다.
+
+    압축 임계값보다 작은 본문은 압축 이득보다 CPU 비용이 크므로 그대로 보낸다.
+    """
+    media_type = negotiate(request_headers.get("accept"))
+    body = encode(rows, media_type)
+    headers = dict(headers or {})
+    encoding = choose_encoding(request_headers.get("accept-encoding"))
+    if encoding is not None and len(body) >= config.COMPRESS_MIN_SIZE:
+        body = compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
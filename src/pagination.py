@@ -0,0 +1,68 @@
+"""커서(keyset) 페이지네이션 유틸리티"""
+
+import base64
+import json
+from collections.abc import Mapping
+from datetime import date
+
+# 다음 페이지 커서를 전달하는 응답 헤더 이름
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# SQLite INTEGER(부호 있는 64비트)의 범위. 벗어난 값을 파라미터로 넘기면 드라이버가 OverflowError를 낸다.
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def encode_cursor(key: tuple) -> str:
+    """
+    정렬 키 값을 클라이언트에게 전달할 불투명(opaque) 커서 문자열로 변환한다.
+
+    키는 (기본 키,) 또는 (last_changed_date, 기본 키) 형태이며,
+    URL에 그대로 넣을 수 있도록 URL-safe base64로 인코딩한다.
+    """
+    payload = [value.isoformat() if isinstance(value, date) else value for value in key]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, by_date: bool = False) -> tuple:
+    """
+    encode_cursor로 만든 커서 문자열을 정렬 키 튜플로 되돌린다.
+
+    by_date가 True이면 (last_changed_date, 기본 키) 형태의 커서만 허용한다.
+    형식이 맞지 않는 커서는 ValueError를 발생시킨다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("잘못된 커서 형식") from e
+
+    if not isinstance(payload, list) or len(payload) != (2 if by_date else 1):
+        raise ValueError("요청 조건과 맞지 않는 커서")
+    if not isinstance(payload[-1], int) or isinstance(payload[-1], bool):
+        raise ValueError("커서의 기본 키가 정수가 아님")
+    if not INT64_MIN <= payload[-1] <= INT64_MAX:
+        raise ValueError("커서의 기본 키가 범위를 벗어남")
+    if by_date:
+        if not isinstance(payload[0], str):
+            raise ValueError("커서의 날짜 형식이 잘못됨")
+        return (date.fromisoformat(payload[0]), payload[1])
+    return (payload[0],)
+
+
+def next_cursor(rows: list, limit: int, id_attr: str, by_date: bool = False):
+    """
+    현재 페이지의 마지막 행으로 다음 페이지 커서를 만든다.
+
+    행은 ORM 객체 또는 딕셔너리(빠른 조회 경로)일 수 있다.
+    페이지가 limit보다 적게 채워졌다면 더 이상 읽을 데이터가 없으므로 None을 반환한다.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    if not isinstance(last, Mapping):
+        last = vars(last)
+    if by_date:
+        return encode_cursor((last["last_changed_date"], last[id_attr]))
+    return encode_cursor((last[id_attr],))
@@ -0,0 +1,266 @@
+"""요청 단위 프로파일링
+
+운영 중 특정 엔드포인트가 느려졌을 때, 재배포 없이 요청 하나를 골라 프로파일을 남긴다.
+SWC_PROFILING=true일 때만 main.py가 미들웨어를 등록하므로, 꺼져 있으면 요청 처리 경로에 아무 코드도 추가되지 않는다.
+
+프로파일링 대상은 요청 헤더(X-Profile: 1)나 샘플링 비율로 고르며, 결과는 PROFILE_DIR에 프로파일 ID 이름으로 저장한다.
+프로파일 ID는 요청 ID 뒤에 서버가 만든 시각과 난수를 붙인 것으로, 응답의 X-Profile-Id 헤더에 담긴다.
+- cprofile: cProfile 통계 파일(<프로파일 ID>.prof). snakeviz, flameprof 등으로 플레임그래프를 그릴 수 있다.
+- sample  : 이벤트 루프 스레드의 호출 스택을 주기적으로 수집한 접힌 스택 파일(<프로파일 ID>.folded).
+            flamegraph.pl, speedscope에 그대로 넣을 수 있다.
+PROFILE_DIR에는 최근 PROFILE_MAX_FILES개 파일만 남기고 오래된 파일부터 지운다.
+
+엔드포인트, SQLAlchemy 쿼리 구성·결과 처리(crud), Pydantic 직렬화는 모두 이벤트 루프 스레드에서 실행되므로
+두 방식 모두 이 구간을 포함한다. 한 번에 한 요청만 프로파일링하지만, 두 방식 모두 요청이 아니라 이벤트 루프 스레드
+전체를 기록하므로 같은 시간에 처리된 다른 요청도 결과에 섞인다. 이때는 응답의 X-Profile-Overlap 헤더에
+겹친 요청 수를 담고 경고 로그를 남긴다.
+SWC_PROFILE_ISOLATE=true이면 프로파일링하는 동안 다른 요청을 잠시 멈춰 세워 결과에 그 요청만 담기게 한다.
+대신 그동안 다른 요청의 지연 시간이 늘어나므로 트래픽이 적을 때만 켜는 것이 좋다.
+"""
+
+import asyncio
+
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+import config
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "X-Request-ID"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_OVERLAP_HEADER = "X-Profile-Overlap"
+
+# 클라이언트가 보낸 요청 ID를 파일 이름으로 쓸 수 있는지 확인하는 패턴
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+PROFILE_EXTENSIONS = (".prof", ".folded")
+
+# 동시에 하나의 요청만 프로파일링하기 위한 잠금
+_active = threading.Lock()
+
+
+class RequestGate:
+    """
+    이벤트 루프에서 처리 중인 요청 수를 세고, 프로파일링하는 요청이 루프를 혼자 쓰도록 다른 요청을 막는다.
+
+    모든 메서드는 이벤트 루프 스레드에서만 호출되므로 별도의 잠금이 필요 없다.
+    이벤트 객체는 실행 중인 루프에서 필요할 때 만든다.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        # 지금까지 게이트를 지난 요청 수(프로파일링 구간과 겹친 요청 수 계산용)
+        self.entered = 0
+        # 처리 중인 요청이 모두 끝나면 set된다(프로파일링 요청이 기다리는 동안에만 존재).
+        self._idle = None
+        # 독점 구간이 끝나면 set된다(독점 구간에만 존재).
+        self._released = None
+
+    @property
+    def exclusive(self) -> bool:
+        return self._released is not None
+
+    async def enter(self):
+        while self._released is not None:
+            await self._released.wait()
+        self.in_flight += 1
+        self.entered += 1
+
+    def leave(self):
+        self.in_flight -= 1
+        if self.in_flight == 0 and self._idle is not None:
+            self._idle.set()
+
+    async def acquire_exclusive(self):
+        """새 요청을 막고, 이미 처리 중인 요청이 모두 끝날 때까지 기다린다."""
+        self._released = asyncio.Event()
+        try:
+            while self.in_flight:
+                self._idle = asyncio.Event()
+                await self._idle.wait()
+        except BaseException:
+            self.release_exclusive()
+            raise
+        finally:
+            self._idle = None
+
+    def release_exclusive(self):
+        released, self._released = self._released, None
+        if released is not None:
+            released.set()
+
+
+gate = RequestGate()
+
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 일정 간격으로 수집해 접힌(folded) 스택별 표본 수를 센다."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def enable(self):
+        self._thread.start()
+
+    def disable(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_fold(frame)] += 1
+
+    def dump_stats(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _fold(frame) -> str:
+    """프레임 체인을 바깥 호출부터 세미콜론으로 이은 한 줄로 만든다."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        names.append(f"{module}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def should_profile(headers) -> bool:
+    """요청 헤더가 프로파일링을 요청했거나 샘플링에 뽑혔는지 확인한다."""
+    if headers.get(config.PROFILE_HEADER, "").lower() in ("1", "true"):
+        return True
+    return random.random() < config.PROFILE_SAMPLE_RATE
+
+
+def request_id_of(headers) -> str:
+    """요청 ID 헤더 값이 파일 이름으로 안전하면 그대로, 아니면 새 ID를 만든다."""
+    request_id = headers.get(REQUEST_ID_HEADER, "")
+    if _REQUEST_ID_PATTERN.match(request_id):
+        return request_id
+    return uuid.uuid4().hex
+
+
+def profile_id_of(headers) -> str:
+    """
+    요청 ID 뒤에 서버가 만든 시각과 난수를 붙여 프로파일 ID를 만든다.
+
+    클라이언트가 같은 요청 ID를 다시 보내도 이전 프로파일 파일을 덮어쓰지 않는다.
+    """
+    timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    return f"{request_id_of(headers)}-{timestamp}-{uuid.uuid4().hex[:8]}"
+
+
+def prune_profiles(directory: str, max_files: int):
+    """디렉토리의 프로파일 파일이 max_files개를 넘으면 수정 시각이 오래된 것부터 지운다."""
+    if max_files <= 0:
+        return
+    with os.scandir(directory) as entries:
+        profiles = [
+            entry
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(PROFILE_EXTENSIONS)
+        ]
+    profiles.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in profiles[max_files:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            # 다른 프로세스가 이미 지운 경우
+            pass
+
+
+def start_profile():
+    """설정된 방식으로 프로파일링을 시작한다. 다른 요청을 프로파일링 중이면 None을 반환한다."""
+    if not _active.acquire(blocking=False):
+        return None
+    if config.PROFILE_MODE == "sample":
+        profiler = StackSampler(threading.get_ident(), config.PROFILE_SAMPLE_INTERVAL)
+    else:
+        profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except BaseException:
+        # 다른 프로파일러가 이미 켜져 있는 경우 등. 잠금을 풀지 않으면 이후 프로파일링이 모두 막힌다.
+        _active.release()
+        raise
+    return profiler
+
+
+def finish_profile(profiler, profile_id: str) -> str:
+    """프로파일링을 멈추고 결과를 PROFILE_DIR에 저장한 뒤 파일 경로를 반환한다."""
+    try:
+        profiler.disable()
+    finally:
+        _active.release()
+    extension = "folded" if isinstance(profiler, StackSampler) else "prof"
+    os.makedirs(config.PROFILE_DIR, exist_ok=True)
+    path = os.path.join(config.PROFILE_DIR, f"{profile_id}.{extension}")
+    profiler.dump_stats(path)
+    prune_profiles(config.PROFILE_DIR, config.PROFILE_MAX_FILES)
+    return path
+
+
+async def profile_request(request, call_next):
+    """
+    프로파일링 대상 요청이면 처리 구간을 프로파일링하고 응답 헤더에 프로파일 ID를 담는다.
+
+    프로파일링 대상이 아닌 요청도 게이트를 지나가므로, 프로파일링 구간과 겹친 요청 수를 셀 수 있다.
+    """
+    if not should_profile(request.headers):
+        return await _call_through_gate(request, call_next)
+    if config.PROFILE_ISOLATE:
+        # 다른 요청을 프로파일링 중이거나 그 준비 중이면 일반 요청처럼 처리한다.
+        if _active.locked() or gate.exclusive:
+            return await _call_through_gate(request, call_next)
+        await gate.acquire_exclusive()
+    try:
+        profiler = start_profile()
+    except BaseException:
+        gate.release_exclusive()
+        raise
+    if profiler is None:
+        gate.release_exclusive()
+        return await _call_through_gate(request, call_next)
+
+    profile_id = profile_id_of(request.headers)
+    in_flight, entered = gate.in_flight, gate.entered
+    try:
+        response = await call_next(request)
+    finally:
+        finish_profile(profiler, profile_id)
+        gate.release_exclusive()
+    overlap = in_flight + gate.entered - entered
+    response.headers[PROFILE_ID_HEADER] = profile_id
+    if overlap:
+        response.headers[PROFILE_OVERLAP_HEADER] = str(overlap)
+        logger.warning(
+            "프로파일 %s에 동시에 처리된 다른 요청 %d개가 섞여 있습니다.",
+            profile_id,
+            overlap,
+        )
+    return response
+
+
+async def _call_through_gate(request, call_next):
+    await gate.enter()
+    try:
+        return await call_next(request)
+    finally:
+        gate.leave()
@@ -1,7 +1,7 @@
 """Pydantic 스키마"""
 
 from pydantic import BaseModel, ConfigDict
-from typing import List
+from typing import Any, Dict, List, Optional
 from datetime import date
 
 
@@ -51,8 +51,61 @@ class League(BaseModel):
     teams: List[TeamBase] = []
 
 
+class PlayerBatch(BaseModel):
+    items: List[Player] = []
+    missing_ids: List[int] = []
+
+
+class TeamBatch(BaseModel):
+    items: List[Team] = []
+    missing_ids: List[int] = []
+
+
+class LeagueBatch(BaseModel):
+    items: List[League] = []
+    missing_ids: List[int] = []
+
+
 class Counts(BaseModel):
     league_count: int
     team_count: int
     player_count: int
     performace_count: int
+
+
+class PlayerSeasonStats(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    player_id: int
+    season: str
+    position: str
+    games_played: int
+    total_points: float
+    average_points: float
+    stddev_points: float
+    max_points: float
+    max_week_number: str
+    min_points: float
+    min_week_number: str
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    player_id: int
+    first_name: str
+    last_name: str
+    position: str
+    fantasy_points: float
+
+
+class Change(BaseModel):
+    seq: int
+    table_name: str
+    operation: str
+    key: Dict[str, int]
+    data: Optional[Dict[str, Any]] = None
+
+
+class ChangeBatch(BaseModel):
+    changes: List[Change]
+    next_token: str
+    has_more: bool
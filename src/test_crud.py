@@ -10,11 +10,23 @@ pytest를 사용할 떄는 몇 가지 명명 규칙을 따라야 한다.
 AssertionError 예외가 발생하며, 해당 테스트는 실패로 간주된다.
 """
 
+import asyncio
+import shutil
+import statistics
 import pytest
 from datetime import date
 
-import crud
-from database import SessionLocal
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError
+
+import analytics, crud, crud_async, generate_data
+from database import (
+    DATABASE_PATH,
+    AsyncSessionLocal,
+    SessionLocal,
+    create_profile_engine,
+)
 
 test_date = date(2024, 4, 1)
 
@@ -56,6 +68,269 @@ def test_get_new_performances(db_session):
     assert len(performances) == 2711
 
 
+def test_get_players_by_ids(db_session):
+    batch = crud.get_players_by_ids(db_session, [1003, 9999, 1001])
+    assert [player.player_id for player in batch["items"]] == [1003, 1001]
+    assert batch["missing_ids"] == [9999]
+
+
 def test_get_player_count(db_session):
     player_count = crud.get_player_count(db_session)
     assert player_count == 1018
+
+
+def test_get_performances_after_key(db_session):
+    first_page = crud.get_performances(db_session, limit=100)
+    next_page = crud.get_performances(
+        db_session, limit=100, after=(first_page[-1].performance_id,)
+    )
+    assert next_page[0].performance_id > first_page[-1].performance_id
+    assert next_page == crud.get_performances(db_session, skip=100, limit=100)
+
+
+def test_get_counts(db_session):
+    counts = crud.get_counts(db_session)
+    assert counts.league_count == 5
+    assert counts.team_count == 20
+    assert counts.player_count == 1018
+    assert counts.performace_count == 17306
+
+
+def test_get_players_async():
+    async def fetch():
+        async with AsyncSessionLocal() as session:
+            return await crud_async.get_players(
+                session, skip=0, limit=10000, min_last_changed_date=test_date
+            )
+
+    players = asyncio.run(fetch())
+    assert len(players) == 1018
+    # 관계가 미리 로딩되어 세션이 닫힌 뒤에도 접근할 수 있어야 한다.
+    assert all(isinstance(player.performances, list) for player in players)
+
+
+@pytest.mark.parametrize("profile", ["default", "readonly", "memory"])
+def test_engine_profiles(profile):
+    engine = create_profile_engine(profile)
+    with engine.connect() as conn:
+        assert conn.scalar(text("SELECT count(*) FROM player")) == 1018
+        assert conn.scalar(text("PRAGMA cache_size")) < 0
+    engine.dispose()
+
+
+@pytest.mark.parametrize("profile", ["readonly", "memory"])
+def test_read_only_profiles_reject_writes(profile):
+    engine = create_profile_engine(profile)
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("DELETE FROM league"))
+    engine.dispose()
+
+
+def test_get_player_season_stats(db_session):
+    stats = crud.get_player_season_stats(db_session, season="2023", position="QB")
+    assert len(stats) == 100
+    assert all(row.position == "QB" for row in stats)
+    assert stats[0].total_points >= stats[-1].total_points
+
+
+def test_player_season_stats_match_performances(db_session):
+    # 요약 테이블 값과 퍼포먼스 행을 직접 집계한 값이 같아야 한다.
+    summary = crud.get_player_season_stats(db_session, limit=1)[0]
+    performances = [
+        p.fantasy_points
+        for p in crud.get_player(db_session, summary.player_id).performances
+    ]
+    assert summary.games_played == len(performances)
+    assert summary.total_points == pytest.approx(sum(performances))
+    assert summary.max_points == max(performances)
+    assert summary.stddev_points == pytest.approx(statistics.pstdev(performances))
+
+
+def test_get_player_week_range_stats(db_session):
+    stats = crud.get_player_season_stats(
+        db_session, limit=2000, min_week_number="202301", max_week_number="202304"
+    )
+    assert len(stats) == 1018
+    assert all(row["games_played"] <= 4 for row in stats)
+
+
+def test_get_leaderboard(db_session):
+    weekly = crud.get_leaderboard(db_session, week_number="202301", position="K", k=3)
+    assert [row["rank"] for row in weekly] == [1, 2, 3]
+    assert all(row["position"] == "K" for row in weekly)
+    assert weekly[0]["fantasy_points"] >= weekly[-1]["fantasy_points"]
+
+    # 시즌을 생략하면 최신 시즌 요약 테이블로 순위를 매긴다.
+    season = crud.get_leaderboard(db_session, k=1)[0]
+    top = crud.get_player_season_stats(db_session, season="2023", limit=1)[0]
+    assert season["fantasy_points"] == top.total_points
+
+
+def test_leaderboard_breaks_ties_by_id(db_session):
+    # 동점이 있는 주차와 시즌에서도 순위가 항상 같은 순서로 정해진다.
+    week = db_session.scalar(
+        text(
+            "SELECT week_number FROM performance GROUP BY week_number, fantasy_points "
+            "HAVING count(*) > 1 LIMIT 1"
+        )
+    )
+    expected = db_session.scalars(
+        text(
+            "SELECT player_id FROM performance WHERE week_number = :week "
+            "ORDER BY fantasy_points DESC, performance_id"
+        ),
+        {"week": week},
+    ).all()
+    weekly = crud.get_leaderboard(db_session, week_number=week, k=len(expected))
+    assert [row["player_id"] for row in weekly] == expected
+
+    expected = db_session.scalars(
+        text(
+            "SELECT player_id FROM player_season_summary WHERE season = '2023' "
+            "ORDER BY total_points DESC, player_id"
+        )
+    ).all()
+    season = crud.get_leaderboard(db_session, season="2023", k=len(expected))
+    assert [row["player_id"] for row in season] == expected
+
+
+def test_refresh_player_season_summary_incremental(tmp_path):
+    # 번들 DB를 건드리지 않도록 사본에서 퍼포먼스 하나를 바꾼 뒤 갱신한다.
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(DATABASE_PATH, database)
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE performance SET fantasy_points = 99, "
+                "last_changed_date = '2099-01-01' WHERE performance_id = 2501"
+            )
+        )
+        # 마지막 갱신 이후 바뀐 선수는 player 1001뿐이다.
+        assert analytics.refresh_player_season_summary(conn) == 1
+        max_points = conn.scalar(
+            text("SELECT max_points FROM player_season_summary WHERE player_id = 1001")
+        )
+        assert max_points == 99
+        # 이미 반영한 변경은 다시 계산하지 않는다.
+        assert analytics.refresh_player_season_summary(conn) == 0
+        assert analytics.refresh_player_season_summary(conn, full=True) == 1018
+    engine.dispose()
+
+
+def _season_total(conn, player_id: int) -> tuple:
+    return conn.execute(
+        text(
+            "SELECT sum(games_played), sum(total_points) FROM player_season_summary "
+            "WHERE player_id = :player_id"
+        ),
+        {"player_id": player_id},
+    ).one()
+
+
+def _performance_total(conn, player_id: int) -> tuple:
+    return conn.execute(
+        text(
+            "SELECT count(*), sum(fantasy_points) FROM performance "
+            "WHERE player_id = :player_id"
+        ),
+        {"player_id": player_id},
+    ).one()
+
+
+def test_refresh_player_season_summary_after_delete(tmp_path):
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(DATABASE_PATH, database)
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.begin() as conn:
+        games, _ = _season_total(conn, 1001)
+        conn.execute(text("DELETE FROM performance WHERE performance_id = 2501"))
+        # 삭제 트리거가 삭제된 퍼포먼스의 선수를 기록해 둔다.
+        assert analytics.refresh_player_season_summary(conn) == 1
+        assert _season_total(conn, 1001)[0] == games - 1
+        assert _season_total(conn, 1001) == pytest.approx(
+            _performance_total(conn, 1001)
+        )
+    engine.dispose()
+
+
+def test_refresh_player_season_summary_backdated_row(tmp_path):
+    # 워터마크보다 이른 변경일로 기록된 보정 행도 반영한다.
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(DATABASE_PATH, database)
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO performance (performance_id, week_number, fantasy_points, "
+                "player_id, last_changed_date) "
+                "VALUES (999999, '202399', 42.5, 1001, '2000-01-01')"
+            )
+        )
+        assert analytics.refresh_player_season_summary(conn) == 1
+        assert _season_total(conn, 1001) == pytest.approx(
+            _performance_total(conn, 1001)
+        )
+    engine.dispose()
+
+
+def test_get_changes_after_writes(tmp_path):
+    # 번들 DB 사본에서 행을 바꿔 트리거가 바뀐 행만 기록하는지 확인한다.
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(DATABASE_PATH, database)
+    engine = create_engine(f"sqlite:///{database}")
+    with Session(engine) as db:
+        high_water = db.scalar(text("SELECT max(seq) FROM change_log"))
+        db.execute(text("UPDATE player SET last_name = 'X' WHERE player_id = 1001"))
+        db.execute(text("UPDATE player SET last_name = 'Y' WHERE player_id = 1001"))
+        db.execute(
+            text("DELETE FROM team_player WHERE team_id = 1001 AND player_id = 1001")
+        )
+        db.commit()
+
+        feed = crud.get_changes(db, after_seq=high_water)
+        assert [
+            (change["table_name"], change["operation"]) for change in feed["changes"]
+        ] == [("player", "upsert"), ("team_player", "delete")]
+        # 같은 행이 여러 번 바뀌어도 최신 상태 하나만 전달된다.
+        assert feed["changes"][0]["data"]["last_name"] == "Y"
+        assert feed["changes"][1]["key"] == {"team_id": 1001, "player_id": 1001}
+        assert feed["changes"][1]["data"] is None
+        assert not feed["has_more"]
+    engine.dispose()
+
+
+def test_generate_data(tmp_path):
+    database = tmp_path / "generated.db"
+    counts = generate_data.generate(
+        str(database),
+        leagues=2,
+        teams_per_league=4,
+        players=300,
+        seasons=2,
+        log=lambda message: None,
+    )
+    assert counts["league"] == 2
+    assert counts["team"] == 8
+    assert counts["player"] == 300
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.connect() as conn:
+        assert (
+            conn.scalar(text("SELECT count(*) FROM performance"))
+            == counts["performance"]
+        )
+        seasons = conn.scalars(
+            text("SELECT DISTINCT season FROM player_season_summary ORDER BY season")
+        ).all()
+        assert seasons == ["2023", "2024"]
+        # 적재 후 인덱스와 플래너 통계가 만들어진다.
+        indexes = conn.scalars(
+            text("SELECT name FROM sqlite_master WHERE type = 'index'")
+        ).all()
+        assert "ix_performance_week_number_points_id" in indexes
+        assert conn.scalar(text("SELECT count(*) FROM sqlite_stat1")) > 0
+    engine.dispose()
+    # 이미 있는 파일은 덮어쓰지 않는다.
+    with pytest.raises(ValueError):
+        generate_data.generate(str(database))
@@ -1,9 +1,49 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import pstats
+import shutil
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi import FastAPI, Response
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import bulk, config, main, metrics, profiling
+from database import DATABASE_PATH, async_engine
 from main import app
+from pagination import encode_cursor
 
 client = TestClient(app)
 
 
+@contextmanager
+def count_queries():
+    """블록 안에서 데이터베이스로 전송된 SQL 문과 파라미터를 수집한다."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    # 비동기 엔진의 이벤트는 내부 동기 엔진(sync_engine)에 등록한다.
+    engine = async_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 # API 상태 확인 엔드포인트 테스트
 def test_read_main():
     response = client.get("/")
@@ -84,3 +124,799 @@ def test_counts():
     assert response_data["league_count"] == 5
     assert response_data["team_count"] == 20
     assert response_data["player_count"] == 1018
+
+
+def test_counts_cached_until_data_changes(monkeypatch):
+    main.counts_cache.clear()
+    with count_queries() as statements:
+        client.get("/v0/counts/")
+        response = client.get("/v0/counts/")
+    assert response.json()["performace_count"] == 17306
+    # 네 개수를 한 번의 쿼리로 집계하고, 두 번째 요청은 캐시에서 응답
+    assert len(statements) == 1
+
+    # 데이터 버전이 바뀌면 다시 집계
+    monkeypatch.setattr(main, "get_data_version", lambda: ((1, 1), None))
+    with count_queries() as statements:
+        client.get("/v0/counts/")
+    assert len(statements) == 1
+
+
+# 커서 기반 페이지네이션 테스트
+def test_read_performances_with_cursor():
+    seen = []
+    response = client.get("/v0/performances/?limit=5000")
+    while True:
+        assert response.status_code == 200
+        seen.extend(row["performance_id"] for row in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"/v0/performances/?limit=5000&cursor={cursor}")
+    assert len(seen) == 17306
+    assert len(set(seen)) == 17306
+
+
+def test_read_performances_by_date_with_cursor():
+    url = "/v0/performances/?limit=1000&minimum_last_changed_date=2024-04-01"
+    seen = []
+    response = client.get(url)
+    while True:
+        assert response.status_code == 200
+        seen.extend(row["performance_id"] for row in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"{url}&cursor={cursor}")
+    assert len(set(seen)) == 2711
+
+
+def test_read_players_with_invalid_cursor():
+    response = client.get("/v0/players/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_read_players_with_out_of_range_cursor():
+    # 64비트 정수 범위를 벗어난 키는 SQLite까지 가지 않고 400으로 거부한다.
+    cursor = encode_cursor((10**30,))
+    assert client.get(f"/v0/players/?cursor={cursor}").status_code == 400
+    cursor = encode_cursor((date(2024, 4, 1), -(10**30)))
+    response = client.get(
+        f"/v0/players/?minimum_last_changed_date=2024-04-01&cursor={cursor}"
+    )
+    assert response.status_code == 400
+
+
+# 관계 일괄 로딩(N+1 방지) 테스트
+# 빠른 조회 경로와 ORM 경로 모두 같은 쿼리 수를 유지해야 한다.
+@pytest.fixture(params=[True, False], ids=["fast_read", "orm"])
+def read_mode(request, monkeypatch):
+    monkeypatch.setattr(config, "FAST_READ", request.param)
+
+
+def test_read_players_query_count(read_mode):
+    with count_queries() as statements:
+        response = client.get("/v0/players/?skip=0&limit=100")
+    assert response.status_code == 200
+    assert len(response.json()) == 100
+    # 선수 1회 + 퍼포먼스 일괄 로딩 1회
+    assert len(statements) == 2
+
+
+def test_read_teams_query_count(read_mode):
+    with count_queries() as statements:
+        response = client.get("/v0/teams/?skip=0&limit=500")
+    assert response.status_code == 200
+    assert len(response.json()) == 20
+    # 팀 1회 + 소속 선수 일괄 로딩 1회
+    assert len(statements) == 2
+
+
+def test_read_leagues_query_count(read_mode):
+    with count_queries() as statements:
+        response = client.get("/v0/leagues/?skip=0&limit=500")
+    assert response.status_code == 200
+    # 리그 1회 + 소속 팀 일괄 로딩 1회
+    assert len(statements) == 2
+
+
+# 여러 ID 일괄 조회(multi-get) 테스트
+def test_read_players_batch(read_mode):
+    with count_queries() as statements:
+        response = client.get("/v0/players/batch/?ids=1010,1001,9999,1005,1001")
+    assert response.status_code == 200
+    batch = response.json()
+    # 요청 순서를 유지하고, 중복 ID는 한 번만, 없는 ID는 missing_ids로 반환한다.
+    assert [player["player_id"] for player in batch["items"]] == [1010, 1001, 1005]
+    assert batch["missing_ids"] == [9999]
+    assert batch["items"][1] == client.get("/v0/players/1001").json()
+    # 선수 1회 + 퍼포먼스 일괄 로딩 1회
+    assert len(statements) == 2
+
+
+def test_read_teams_and_leagues_batch(read_mode):
+    teams = client.get("/v0/teams/batch/?ids=1002,1001").json()
+    assert [team["team_id"] for team in teams["items"]] == [1002, 1001]
+    assert teams["missing_ids"] == []
+    leagues = client.get("/v0/leagues/batch/?ids=5002,42").json()
+    assert [league["league_id"] for league in leagues["items"]] == [5002]
+    assert leagues["missing_ids"] == [42]
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        "",
+        "1001,abc",
+        ",".join(map(str, range(501))),
+        "1000000000000000000000000000000",
+        "1001,-9223372036854775809",
+    ],
+)
+def test_read_players_batch_rejects_invalid_ids(ids):
+    assert client.get(f"/v0/players/batch/?ids={ids}").status_code == 400
+
+
+# 필드 선택(fields)과 관계 펼치기(expand) 테스트
+def test_read_players_sparse_fieldset(read_mode):
+    with count_queries() as statements:
+        response = client.get("/v0/players/?limit=5&fields=player_id,last_name")
+    assert response.status_code == 200
+    assert all(set(player) == {"player_id", "last_name"} for player in response.json())
+    # 관계를 요청하지 않았으므로 퍼포먼스는 조회하지 않는다.
+    assert len(statements) == 1
+    assert response.headers["X-Next-Cursor"]
+
+
+def test_read_players_fieldset_with_relationship():
+    response = client.get("/v0/players/?limit=3&fields=first_name,performances")
+    assert response.status_code == 200
+    player = response.json()[0]
+    assert set(player) == {"first_name", "performances"}
+    assert player["performances"][0]["performance_id"]
+
+
+def test_read_teams_without_expand(read_mode):
+    with count_queries() as statements:
+        response = client.get("/v0/teams/?expand=")
+    assert response.status_code == 200
+    teams = response.json()
+    assert len(teams) == 20
+    assert all("players" not in team for team in teams)
+    assert len(statements) == 1
+
+
+def test_read_detail_with_fieldset():
+    assert client.get("/v0/players/1001?fields=last_name").json() == {
+        "last_name": "Rodgers"
+    }
+    league = client.get("/v0/leagues/5001?expand=").json()
+    assert "teams" not in league and league["league_id"] == 5001
+    assert client.get("/v0/players/9999?fields=last_name").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/v0/players/?fields=salary",
+        "/v0/teams/?expand=performances",
+        "/v0/performances/?fields=performances",
+        "/v0/leagues/5001?fields=team_name",
+        "/v0/players/?fields=",
+        "/v0/players/1001?fields=,,",
+    ],
+)
+def test_read_invalid_fieldset(url):
+    assert client.get(url).status_code == 400
+
+
+# HTTP 조건부 요청(ETag / Last-Modified) 테스트
+def test_conditional_get_with_etag():
+    response = client.get("/v0/players/1001")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"].startswith("public")
+
+    with count_queries() as statements:
+        response = client.get("/v0/players/1001", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    # 304 응답은 DB 조회 없이 반환되어야 한다.
+    assert len(statements) == 0
+
+
+def test_conditional_get_with_last_modified():
+    response = client.get("/v0/leagues/")
+    last_modified = response.headers["Last-Modified"]
+
+    response = client.get("/v0/leagues/", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+def test_conditional_get_after_data_change(monkeypatch):
+    etag = client.get("/v0/teams/").headers["ETag"]
+    monkeypatch.setattr(main, "get_data_version", lambda: ((1, 1), None))
+    response = client.get("/v0/teams/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_conditional_get_wildcard_only_for_existing():
+    # If-None-Match: *는 표현이 있을 때만 304이고, 없는 리소스나 잘못된 요청은 그대로 응답한다.
+    headers = {"If-None-Match": "*"}
+    assert client.get("/v0/players/1001", headers=headers).status_code == 304
+    assert client.get("/v0/players/9999999", headers=headers).status_code == 404
+    assert client.get("/v0/players/abc", headers=headers).status_code == 422
+
+
+def test_changes_feed_not_shared_cached():
+    response = client.get("/v0/changes/")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-cache"
+    etag = response.headers["ETag"]
+    response = client.get("/v0/changes/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+# 응답 형식 협상(Accept)과 압축(Accept-Encoding) 테스트
+def test_read_performances_arrow_stream(read_mode):
+    url = "/v0/performances/?limit=50"
+    expected = client.get(url).json()
+    response = client.get(
+        url, headers={"Accept": "application/vnd.apache.arrow.stream"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert response.headers["X-Next-Cursor"]
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == list(expected[0])
+    assert table.column("performance_id").to_pylist() == [
+        row["performance_id"] for row in expected
+    ]
+    assert table.schema.field("last_changed_date").type == pa.date32()
+
+
+def test_read_players_arrow_stream_nested():
+    response = client.get(
+        "/v0/players/?limit=5",
+        headers={"Accept": "application/vnd.apache.arrow.stream"},
+    )
+    players = pa.ipc.open_stream(response.content).read_all().to_pylist()
+    assert len(players) == 5
+    assert players[0]["performances"][0]["player_id"] == players[0]["player_id"]
+
+
+def test_read_teams_msgpack(read_mode):
+    msgpack = pytest.importorskip("msgpack")
+    url = "/v0/teams/?limit=3"
+    response = client.get(url, headers={"Accept": "application/msgpack"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == client.get(url).json()
+
+
+def test_accept_preference_and_fallback():
+    url = "/v0/leagues/"
+    accept = "application/json;q=0.5, application/msgpack"
+    assert (
+        client.get(url, headers={"Accept": accept})
+        .headers["content-type"]
+        .startswith("application/msgpack")
+    )
+    # 제공하지 않는 형식만 요청하면 JSON으로 응답한다.
+    response = client.get(url, headers={"Accept": "text/html"})
+    assert response.headers["content-type"] == "application/json"
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_large_responses_are_compressed(read_mode, encoding):
+    # SWC_FAST_READ=false인 ORM 경로도 같은 방식으로 압축한다.
+    headers = {"Accept-Encoding": encoding}
+    large = client.get("/v0/performances/?limit=500", headers=headers)
+    assert large.headers["content-encoding"] == encoding
+    assert len(large.json()) == 500
+    # 압축 임계값보다 작은 응답은 압축하지 않는다.
+    small = client.get("/v0/performances/?limit=1", headers=headers)
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("*", {"zstd"}),
+        ("*, gzip;q=0", {"zstd"}),
+        ("*, zstd;q=0", {"gzip"}),
+        ("zstd;q=0, gzip;q=0, *", set()),
+        ("*;q=0, gzip", {"gzip"}),
+        ("identity", set()),
+    ],
+)
+def test_explicit_encoding_overrides_wildcard(read_mode, accept_encoding, expected):
+    response = client.get(
+        "/v0/performances/?limit=500", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert {response.headers.get("content-encoding")} - {None} == expected
+
+
+def test_orm_and_fast_read_responses_match(monkeypatch):
+    url = "/v0/players/?limit=20"
+    headers = {"Accept-Encoding": "gzip"}
+    monkeypatch.setattr(config, "FAST_READ", False)
+    orm = client.get(url, headers=headers)
+    monkeypatch.setattr(config, "FAST_READ", True)
+    fast = client.get(url, headers=headers)
+    assert orm.headers["content-encoding"] == fast.headers["content-encoding"]
+    assert orm.headers["X-Next-Cursor"] == fast.headers["X-Next-Cursor"]
+    assert orm.json() == fast.json()
+
+
+def test_etag_varies_by_media_type():
+    url = "/v0/players/?limit=3"
+    json_response = client.get(url)
+    arrow_response = client.get(
+        url, headers={"Accept": "application/vnd.apache.arrow.stream"}
+    )
+    assert json_response.headers["Vary"] == "Accept, Accept-Encoding"
+    assert json_response.headers["ETag"] != arrow_response.headers["ETag"]
+
+
+# 계측(metrics) 엔드포인트 테스트
+def test_metrics_records_requests_and_queries():
+    before = metrics.http_request_sql_queries.count("v0_get_players")
+    assert client.get("/v0/players/?limit=5").status_code == 200
+    assert metrics.http_request_sql_queries.count("v0_get_players") == before + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert "# TYPE swc_http_request_duration_seconds histogram" in text
+    assert 'swc_http_requests_total{operation_id="v0_get_players",status="200"}' in text
+    assert (
+        'swc_http_request_duration_seconds_bucket{operation_id="v0_get_players",le="+Inf"}'
+        in text
+    )
+    assert 'swc_http_response_size_bytes_count{operation_id="v0_get_players"}' in text
+    assert 'swc_http_request_sql_queries_sum{operation_id="v0_get_players"}' in text
+
+
+def test_metrics_counts_queries_per_request():
+    histogram = metrics.http_request_sql_queries
+    operation_id = "v0_get_players_by_player_id"
+    before = histogram.sum(operation_id)
+    client.get("/v0/players/1001")
+    # 선수 1회 + 퍼포먼스 일괄 로딩 1회
+    assert histogram.sum(operation_id) - before == 2
+
+
+def test_metrics_failed_query_does_not_skew_timing():
+    # 실패한 SQL 문의 시작 시각이 남아 다음 SQL 문의 시간 측정에 쓰이지 않아야 한다.
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine)
+    before = metrics.sql_query_duration.count()
+    with engine.connect() as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        assert "swc_query_start" not in conn.info
+    assert metrics.sql_query_duration.count() == before + 1
+    engine.dispose()
+
+
+def test_slow_query_log(monkeypatch, caplog):
+    monkeypatch.setattr(config, "SLOW_QUERY_SECONDS", 0)
+    before = metrics.sql_slow_queries.value()
+    with caplog.at_level("WARNING", logger="metrics"):
+        client.get("/v0/players/1001")
+    assert metrics.sql_slow_queries.value() >= before + 2
+    assert any("FROM player" in record.getMessage() for record in caplog.records)
+
+
+# 요청 프로파일링 테스트
+@pytest.fixture
+def profiled_client(tmp_path, monkeypatch):
+    """프로파일링 미들웨어로 API 앱 전체를 감싼 테스트 클라이언트"""
+    monkeypatch.setattr(config, "PROFILE_DIR", str(tmp_path))
+    profiled_app = FastAPI()
+    profiled_app.middleware("http")(profiling.profile_request)
+    profiled_app.mount("/", app)
+    return TestClient(profiled_app)
+
+
+def test_profiling_disabled_by_default():
+    # 꺼져 있으면 미들웨어 자체를 등록하지 않는다.
+    assert not config.PROFILING
+    assert all(
+        middleware.kwargs.get("dispatch") is not profiling.profile_request
+        for middleware in app.user_middleware
+    )
+
+
+@pytest.mark.parametrize("mode,extension", [("cprofile", "prof"), ("sample", "folded")])
+def test_profile_request_by_header(
+    profiled_client, tmp_path, monkeypatch, mode, extension
+):
+    monkeypatch.setattr(config, "PROFILE_MODE", mode)
+    response = profiled_client.get(
+        "/v0/players/?limit=200",
+        headers={"X-Profile": "1", "X-Request-ID": "players-slow-1"},
+    )
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    # 서버가 만든 접미사를 붙여, 같은 요청 ID로 다시 프로파일링해도 덮어쓰지 않는다.
+    assert profile_id.startswith("players-slow-1-")
+    path = tmp_path / f"{profile_id}.{extension}"
+    assert path.exists()
+    if mode == "cprofile":
+        stats = pstats.Stats(str(path))
+        assert any(name == "read_players" for _, _, name in stats.stats)
+
+
+def test_profile_only_selected_requests(profiled_client, tmp_path):
+    response = profiled_client.get("/v0/players/1001")
+    assert "X-Profile-Id" not in response.headers
+    assert not list(tmp_path.iterdir())
+    # 파일 이름으로 쓸 수 없는 요청 ID는 새 ID로 바꾼다.
+    response = profiled_client.get(
+        "/v0/players/1001", headers={"X-Profile": "1", "X-Request-ID": "../etc"}
+    )
+    assert response.headers["X-Profile-Id"] != "../etc"
+    assert [path.parent for path in tmp_path.iterdir()] == [tmp_path]
+
+
+def test_profile_files_are_pruned(profiled_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "PROFILE_MAX_FILES", 2)
+    (tmp_path / "notes.txt").write_text("프로파일이 아닌 파일은 지우지 않는다.")
+    headers = {"X-Profile": "1", "X-Request-ID": "players-slow-1"}
+    profile_ids = [
+        profiled_client.get("/v0/players/1001", headers=headers).headers["X-Profile-Id"]
+        for _ in range(3)
+    ]
+    assert len(set(profile_ids)) == 3
+    # 가장 최근 2개만 남는다.
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [f"{profile_id}.prof" for profile_id in profile_ids[1:]] + ["notes.txt"]
+    )
+
+
+def test_start_profile_releases_lock_on_failure(monkeypatch):
+    class BrokenProfile:
+        def enable(self):
+            raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(config, "PROFILE_MODE", "cprofile")
+    monkeypatch.setattr(profiling.cProfile, "Profile", BrokenProfile)
+    with pytest.raises(ValueError):
+        profiling.start_profile()
+    assert not profiling._active.locked()
+
+
+@pytest.mark.parametrize("isolate,overlap", [(False, "1"), (True, None)])
+def test_profile_overlapping_requests(tmp_path, monkeypatch, isolate, overlap):
+    # 이벤트 루프 전체를 기록하므로 겹친 요청은 헤더로 알리고, 격리 모드에서는 겹치지 않게 한다.
+    monkeypatch.setattr(config, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "PROFILE_ISOLATE", isolate)
+    finished = []
+
+    async def call_next(request):
+        slow = request.headers.get("X-Request-ID") == "other"
+        await asyncio.sleep(0.05 if slow else 0.01)
+        finished.append(request.headers.get("X-Request-ID"))
+        return Response()
+
+    async def run():
+        other = SimpleNamespace(headers={"X-Request-ID": "other"})
+        profiled = SimpleNamespace(
+            headers={"X-Profile": "1", "X-Request-ID": "profiled"}
+        )
+        background = asyncio.ensure_future(profiling.profile_request(other, call_next))
+        await asyncio.sleep(0)
+        response = await profiling.profile_request(profiled, call_next)
+        await background
+        return response
+
+    response = asyncio.run(run())
+    assert response.headers.get("X-Profile-Overlap") == overlap
+    # 격리 모드에서는 먼저 처리 중이던 요청이 끝난 뒤에야 프로파일링을 시작한다.
+    assert finished == (["other", "profiled"] if isolate else ["profiled", "other"])
+    assert profiling.gate.in_flight == 0 and not profiling.gate.exclusive
+
+
+# 필터 조회가 인덱스를 사용하는지 확인하는 실행 계획(EXPLAIN) 테스트
+def test_filters_use_indexes(monkeypatch):
+    # 시즌 요약 갱신 확인(변경 기록 전체를 읽는 유지보수 쿼리)은 검사 대상이 아니므로 건너뛴다.
+    monkeypatch.setattr(main, "_summary_checked_version", main.get_data_version())
+    urls = [
+        "/v0/players/?minimum_last_changed_date=2024-04-01",
+        "/v0/players/?first_name=Bryce",
+        "/v0/players/?last_name=Young",
+        "/v0/players/?first_name=Bryce&last_name=Young",
+        "/v0/performances/?minimum_last_changed_date=2024-04-01",
+        "/v0/leagues/?league_name=AHAHFZZFFFL",
+        "/v0/leagues/?minimum_last_changed_date=2024-04-01",
+        "/v0/teams/?team_name=Roaring%20Kitties",
+        "/v0/teams/?league_id=5001",
+        "/v0/teams/?minimum_last_changed_date=2024-04-01",
+        "/v0/players/1001",
+        "/v0/leagues/5002",
+        "/v0/leaderboard/?week_number=202307&k=10",
+        "/v0/leaderboard/?week_number=202307&position=TE&k=10",
+        "/v0/leaderboard/?k=10",
+        "/v0/leaderboard/?season=2023&position=QB&k=10",
+    ]
+    with count_queries() as statements:
+        for url in urls:
+            assert client.get(url).status_code == 200
+
+    # 통계(sqlite_stat1)가 없는 스키마 사본에서 실행 계획을 확인한다. 번들 DB처럼 작은 테이블은
+    # 플래너가 전체 스캔을 택할 수 있으므로, 데이터 크기와 무관하게 사용 가능한 인덱스가 있는지 검사한다.
+    with sqlite3.connect(DATABASE_PATH) as source:
+        schema = source.execute(
+            "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL "
+            "AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+    with sqlite3.connect(":memory:") as conn:
+        for (sql,) in schema:
+            conn.execute(sql)
+        for statement, parameters in statements:
+            plan = conn.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            for row in plan.fetchall():
+                # 마지막 열(detail)이 SCAN으로 시작하면 테이블/인덱스 전체를 읽는 것이다.
+                assert not row[-1].startswith("SCAN"), (statement, row[-1])
+                # 리더보드는 인덱스 순서대로 K행만 읽어야 하므로 별도 정렬도 없어야 한다.
+                if "LIMIT" in statement and "fantasy_points" in statement:
+                    assert "TEMP B-TREE" not in row[-1], (statement, row[-1])
+
+
+# 스트리밍 내보내기 엔드포인트 테스트
+def test_export_performances_ndjson():
+    response = client.get("/v0/export/performances/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 17306
+    assert json.loads(lines[0]) == client.get("/v0/performances/?limit=1").json()[0]
+
+
+def test_export_players_csv():
+    response = client.get(
+        "/v0/export/players/?format=csv&minimum_last_changed_date=2024-04-01"
+    )
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == [
+        "player_id",
+        "gsis_id",
+        "first_name",
+        "last_name",
+        "position",
+        "last_changed_date",
+    ]
+    assert len(rows) == 1018 + 1
+
+
+# 대용량 파일 엔드포인트 테스트
+@pytest.fixture()
+def bulk_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "BULK_DIR", str(tmp_path))
+    monkeypatch.setattr(bulk, "_checked_version", None)
+    return tmp_path
+
+
+def test_bulk_parquet_file(bulk_dir):
+    response = client.get("/v0/bulk/player_data.parquet")
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 1018
+    assert table.column_names[0] == "player_id"
+
+
+def test_bulk_arrow_file_range(bulk_dir):
+    full = client.get("/v0/bulk/performance_data.arrow").content
+    assert pa.ipc.open_file(io.BytesIO(full)).read_all().num_rows == 17306
+
+    response = client.get(
+        "/v0/bulk/performance_data.arrow", headers={"Range": "bytes=0-99"}
+    )
+    assert response.status_code == 206
+    assert response.content == full[:100]
+
+
+def test_bulk_files_rebuilt_only_when_changed(bulk_dir):
+    assert bulk.refresh_bulk_files() == list(bulk.BULK_TABLES)
+    assert bulk.refresh_bulk_files() == []
+
+
+def test_bulk_files_rebuilt_after_same_day_update(bulk_dir, tmp_path, monkeypatch):
+    # 번들 DB 사본에서 last_changed_date를 바꾸지 않고 행을 수정해도 파일을 다시 만드는지 확인한다.
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(DATABASE_PATH, database)
+    engine = create_engine(f"sqlite:///{database}")
+    monkeypatch.setattr(bulk, "engine", engine)
+    assert bulk.refresh_bulk_files() == list(bulk.BULK_TABLES)
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE player SET last_name = 'Bulk' WHERE player_id = 1001")
+        )
+    assert bulk.refresh_bulk_files() == ["player_data"]
+    table = pq.read_table(bulk_dir / "player_data.parquet")
+    assert "Bulk" in table.column("last_name").to_pylist()
+    engine.dispose()
+
+
+def test_bulk_unknown_file(bulk_dir):
+    assert client.get("/v0/bulk/secret.db").status_code == 404
+
+
+# 빠른 조회 경로와 ORM 경로의 응답 바이트 호환성 테스트
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/v0/players/?limit=10000",
+        "/v0/players/?minimum_last_changed_date=2024-04-01&limit=50",
+        "/v0/performances/?limit=20000",
+        "/v0/leagues/",
+        "/v0/teams/?league_id=5001",
+        "/v0/players/batch/?ids=1005,1001,9999",
+        "/v0/teams/batch/?ids=1003,1001",
+        "/v0/leagues/batch/?ids=5002,5001,1",
+    ],
+)
+def test_fast_read_matches_orm_response(url, monkeypatch):
+    monkeypatch.setattr(config, "FAST_READ", True)
+    fast = client.get(url)
+    monkeypatch.setattr(config, "FAST_READ", False)
+    orm = client.get(url)
+    assert fast.status_code == orm.status_code == 200
+    assert fast.content == orm.content
+    assert fast.headers.get("X-Next-Cursor") == orm.headers.get("X-Next-Cursor")
+
+
+# 리더보드 엔드포인트 테스트
+def test_read_weekly_leaderboard():
+    response = client.get("/v0/leaderboard/?week_number=202307&position=WR&k=5")
+    assert response.status_code == 200
+    leaderboard = response.json()
+    assert [entry["rank"] for entry in leaderboard] == [1, 2, 3, 4, 5]
+    assert all(entry["position"] == "WR" for entry in leaderboard)
+
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        expected = conn.execute(
+            "SELECT fantasy_points FROM performance JOIN player USING (player_id) "
+            "WHERE week_number = '202307' AND position = 'WR' "
+            "ORDER BY fantasy_points DESC LIMIT 5"
+        ).fetchall()
+    assert [entry["fantasy_points"] for entry in leaderboard] == [
+        points for (points,) in expected
+    ]
+
+
+def test_read_season_leaderboard_matches_season_stats():
+    leaderboard = client.get("/v0/leaderboard/?position=RB&k=10").json()
+    season_stats = client.get("/v0/season_stats/?position=RB&limit=10").json()
+    assert len(leaderboard) == 10
+    assert [entry["fantasy_points"] for entry in leaderboard] == [
+        stats["total_points"] for stats in season_stats
+    ]
+
+
+def test_read_leaderboard_rejects_invalid_k():
+    assert client.get("/v0/leaderboard/?k=0").status_code == 422
+    assert client.get("/v0/leaderboard/?k=501").status_code == 422
+
+
+# 변경 피드 엔드포인트 테스트
+def test_read_changes_resumes_from_token():
+    first = client.get("/v0/changes/?limit=3").json()
+    assert [change["seq"] for change in first["changes"]] == [1, 2, 3]
+    assert first["has_more"]
+    league = first["changes"][0]
+    assert league["table_name"] == "league"
+    assert league["operation"] == "upsert"
+    assert league["data"]["league_id"] == league["key"]["league_id"]
+
+    second = client.get(f"/v0/changes/?limit=3&token={first['next_token']}").json()
+    assert [change["seq"] for change in second["changes"]] == [4, 5, 6]
+
+
+def test_read_changes_covers_every_row():
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        (total,) = conn.execute(
+            "SELECT (SELECT count(*) FROM league) + (SELECT count(*) FROM team) + "
+            "(SELECT count(*) FROM player) + (SELECT count(*) FROM team_player) + "
+            "(SELECT count(*) FROM performance)"
+        ).fetchone()
+    received = 0
+    params = {"limit": 1000}
+    while True:
+        batch = client.get("/v0/changes/", params=params).json()
+        received += len(batch["changes"])
+        token = params["token"] = batch["next_token"]
+        if not batch["has_more"]:
+            break
+    assert received == total
+    # 끝까지 받은 뒤에는 같은 토큰으로 빈 배치를 받는다.
+    tail = client.get(f"/v0/changes/?token={token}").json()
+    assert tail == {"changes": [], "next_token": token, "has_more": False}
+
+
+def test_read_changes_rejects_invalid_token():
+    assert client.get("/v0/changes/?token=not-a-token").status_code == 400
+    # 64비트 정수 범위를 벗어난 seq는 조회 전에 거부한다.
+    token = encode_cursor((10**30,))
+    assert client.get(f"/v0/changes/?token={token}").status_code == 400
+    assert client.get("/v0/changes/?limit=1001").status_code == 422
+
+
+# 선수 시즌 성적 분석 엔드포인트 테스트
+def test_read_player_season_stats():
+    response = client.get("/v0/season_stats/?position=RB&limit=25")
+    assert response.status_code == 200
+    rows = response.json()
+    assert len(rows) == 25
+    assert all(row["position"] == "RB" for row in rows)
+    points = [row["total_points"] for row in rows]
+    assert points == sorted(points, reverse=True)
+
+
+def test_season_stats_refresh_after_insert(tmp_path, monkeypatch):
+    # 번들 DB 사본에 퍼포먼스를 추가하면 다음 요청에서 요약이 자동으로 갱신된다.
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(DATABASE_PATH, database)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database}", poolclass=NullPool)
+    monkeypatch.setattr(
+        main,
+        "AsyncSessionLocal",
+        async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+    )
+    monkeypatch.setattr(main, "_summary_checked_version", None)
+
+    def season_row(player_id):
+        rows = client.get("/v0/season_stats/?season=2023&limit=2000").json()
+        return next(row for row in rows if row["player_id"] == player_id)
+
+    before = season_row(1001)
+    with sqlite3.connect(database) as conn:
+        conn.execute(
+            "INSERT INTO performance (performance_id, week_number, fantasy_points, "
+            "player_id, last_changed_date) "
+            "VALUES (999999, '202318', 50.0, 1001, '2024-04-01')"
+        )
+    # 파일이 바뀌면 데이터 버전 표식이 바뀐다. 사본은 표식 대상 파일이 아니므로 직접 초기화한다.
+    monkeypatch.setattr(main, "_summary_checked_version", None)
+    after = season_row(1001)
+    assert after["games_played"] == before["games_played"] + 1
+    assert after["total_points"] == pytest.approx(before["total_points"] + 50)
+    assert after["max_points"] == max(before["max_points"], 50.0)
+
+    leaderboard = client.get("/v0/leaderboard/?season=2023&k=500").json()
+    entry = next(row for row in leaderboard if row["player_id"] == 1001)
+    assert entry["fantasy_points"] == pytest.approx(after["total_points"])
+
+
+def test_read_player_season_stats_by_week_range():
+    response = client.get(
+        "/v0/season_stats/?minimum_week_number=202307&maximum_week_number=202307&limit=5"
+    )
+    assert response.status_code == 200
+    assert all(row["games_played"] == 1 for row in response.json())
+
+
+# 서버 시작 시 마이그레이션 테스트
+def test_startup_migrates_database(tmp_path, monkeypatch):
+    # 저장소의 원본 DB 사본으로 서버를 시작하면 인덱스·변경 피드·파생 테이블이 만들어진다.
+    database = tmp_path / "fantasy_data.db"
+    shutil.copy(os.path.join(os.path.dirname(__file__), "fantasy_data.db"), database)
+    with sqlite3.connect(database) as conn:
+        assert not conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'change_log'"
+        ).fetchall()
+    monkeypatch.setattr(main, "DATABASE_PATH", str(database))
+    with TestClient(app):
+        pass
+    with sqlite3.connect(database) as conn:
+        names = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
+    assert {"change_log", "player_season_summary"} <= names
+    assert any(name.startswith("change_log_performance_") for name in names)